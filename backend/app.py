@@ -1,20 +1,39 @@
 # Backend API Server for Resume Scanner with Dynamic Analysis
 import os
 import json
+import base64
+import functools
+import hmac
 import logging
 import re
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify, render_template_string, stream_with_context
 from flask_cors import CORS
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 from werkzeug.utils import secure_filename
-import google.generativeai as genai
-import requests
-import PyPDF2
-import docx
-from typing import Dict, List, Optional
-from backend.utils.text_processor import TextProcessor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from backend.utils.text_processor import ParsedResume, TextProcessor
 from backend.utils.job_matcher import JobMatcher
-from backend.config import get_config
+from backend.utils.candidate_index import CandidateIndex, candidate_profile
+from backend.utils.candidate_store import GRADE_THRESHOLDS, create_candidate_repository
+from backend.utils.resume_index import SQLiteResumeIndex
+from backend.utils.llm_client import LLMClient, LLMResponseError, create_llm_model
+from backend.utils.duplicate_detector import SQLiteDuplicateIndex
+from backend.utils.batch_processor import BatchProcessor, collect_batch_files
+from backend.utils.job_queue import STATUS_COMPLETED, STATUS_FAILED, JobWorkerPool, create_job_queue
+from backend.utils.stage_runner import run_stages
+from backend.utils.analysis_cache import AnalysisCache, content_hash, create_cache_backend
+from backend.utils.metrics import metrics
+from backend.utils.github_client import GitHubClient, GitHubRateLimited
+from backend.utils.text_extraction import (
+    ExtractionError, ExtractionLimits, ResumeSource, TextExtractor, source_hash, spool_upload
+)
+from backend.config import Config, get_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,82 +52,180 @@ GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY', 'your-gemini-api-key-here')
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN', 'your-github-token-here')
 
 # Initialize API clients
-if GEMINI_API_KEY and GEMINI_API_KEY != 'your-gemini-api-key-here':
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel('gemini-pro')
-else:
-    model = None
+llm_model = create_llm_model(
+    Config.LLM_BACKEND,
+    GEMINI_API_KEY if GEMINI_API_KEY != 'your-gemini-api-key-here' else None,
+    Config.GEMINI_MODEL,
+    stub_latency=Config.LLM_STUB_LATENCY
+)
+llm_client = LLMClient(
+    llm_model,
+    create_cache_backend(Config.LLM_CACHE_BACKEND, Config.LLM_CACHE_PATH, Config.CACHE_MAX_ENTRIES, Config.CACHE_TTL),
+    max_concurrency=Config.LLM_MAX_CONCURRENCY,
+    max_retries=Config.LLM_MAX_RETRIES,
+    backoff=Config.LLM_RETRY_BACKOFF,
+    timeout=Config.LLM_TIMEOUT
+) if llm_model else None
 
 # Ensure upload directory exists
-os.makedirs('uploads', exist_ok=True)
+os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+
+# Bump when analysis output changes so cached results are not reused
+ANALYZER_VERSION = '2'
 
 class AdvancedResumeAnalyzer:
     """Advanced Resume Analyzer with Dynamic Scoring"""
     
     def __init__(self):
-        self.text_processor = TextProcessor()
-        self.job_matcher = JobMatcher()
-        self.github_headers = {
-            'Authorization': f'token {GITHUB_TOKEN}',
-            'Accept': 'application/vnd.github.v3+json'
-        } if GITHUB_TOKEN != 'your-github-token-here' else {}
-    
-    def extract_text_from_resume(self, file_path: str) -> str:
-        """Extract text from uploaded resume file"""
-        try:
-            file_extension = file_path.split('.')[-1].lower()
-            
-            if file_extension == 'pdf':
-                return self._extract_text_from_pdf(file_path)
-            elif file_extension in ['doc', 'docx']:
-                return self._extract_text_from_docx(file_path)
-            else:
-                raise ValueError(f"Unsupported file format: {file_extension}")
-                
-        except Exception as e:
-            logger.error(f"Error extracting text from resume: {str(e)}")
-            raise
+        self.text_processor = TextProcessor(Config.KEY_PHRASE_BATCH_SIZE, Config.KEY_PHRASE_PROCESSES)
+        self.job_matcher = JobMatcher(semantic_model_path=Config.SEMANTIC_MODEL_PATH)
+        self.github_client = GitHubClient(
+            token=GITHUB_TOKEN,
+            base_url=Config.GITHUB_API_URL,
+            timeout=Config.GITHUB_TIMEOUT,
+            pool_size=Config.GITHUB_POOL_SIZE,
+            cache_size=Config.GITHUB_CACHE_SIZE,
+            max_rate_wait=Config.GITHUB_MAX_RATE_WAIT
+        ) if GITHUB_TOKEN != 'your-github-token-here' else None
+        self._batch_processor = None
+        self.text_extractor = TextExtractor(
+            ExtractionLimits(
+                max_pages=Config.MAX_RESUME_PAGES,
+                max_chars=Config.MAX_RESUME_CHARS,
+                time_budget=Config.EXTRACTION_TIME_BUDGET
+            ),
+            Config.EXTRACTION_BENCHMARK_PATH
+        )
+        
+        # Cached results are tied to both the analyzer and skill taxonomy versions
+        self.cache = AnalysisCache(
+            create_cache_backend(Config.CACHE_BACKEND, Config.CACHE_PATH, Config.CACHE_MAX_ENTRIES, Config.CACHE_TTL),
+            f"{ANALYZER_VERSION}-{self.text_processor.taxonomy.version}"
+        )
     
-    def _extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file"""
-        text = ""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-        except Exception as e:
-            logger.error(f"Error reading PDF: {str(e)}")
-            # Basic fallback
-            text = "Unable to extract text from PDF"
+    def analyze_batch(
+        self,
+        files: Iterable[Tuple[str, str]],
+        user_data: Optional[Dict] = None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Analyze many resumes on a process pool, yielding results as they complete
+        
+        files is an iterable of (display_name, file_path) pairs. The shared
+        pool is sized by Config.BATCH_MAX_WORKERS; passing max_workers runs
+        this batch on a dedicated pool of that size instead.
+        """
+        user_data = user_data or {}
+        if max_workers:
+            processor = BatchProcessor(AdvancedResumeAnalyzer, max_workers)
+            try:
+                yield from processor.iter_results(files, user_data)
+            finally:
+                processor.shutdown()
+            return
+        
+        if self._batch_processor is None:
+            self._batch_processor = BatchProcessor(AdvancedResumeAnalyzer, Config.BATCH_MAX_WORKERS)
+        yield from self._batch_processor.iter_results(files, user_data)
+    
+    def extract_text_from_resume(self, resume: ResumeSource) -> str:
+        """Extract text from an uploaded resume (bytes or file path), reusing results for identical files
         
-        return text.strip()
+        Raises ExtractionError when no backend can read the file; failures are not cached.
+        """
+        digest = source_hash(resume)
+        return self.cache.get_or_compute('text', digest, lambda: self._extract_text(resume))
     
-    def _extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX file"""
+    def _extract_text(self, resume: ResumeSource) -> str:
+        """Extract text with the fastest installed backend for the sniffed file type"""
         try:
-            doc = docx.Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return self.text_extractor.extract(resume)
+        except ExtractionError as e:
+            logger.error(f"Error reading {e.file_type.upper()}: {str(e)}")
+            raise
         except Exception as e:
-            logger.error(f"Error reading DOCX: {str(e)}")
-            return "Unable to extract text from DOCX"
+            logger.error(f"Error extracting text from resume: {str(e)}")
+            raise
     
     def analyze_resume_with_ai(self, resume_text: str, user_data: Dict) -> Dict:
-        """Use AI to analyze resume content dynamically"""
+        """Use AI to analyze resume content dynamically, reusing results for identical inputs"""
+        digest = content_hash(json.dumps([
+            resume_text,
+            user_data.get('fullName'),
+            user_data.get('college'),
+            user_data.get('cgpa'),
+            llm_client.model.name if llm_client else None,
+            Config.ANALYSIS_MODE,
+            Config.TIER_MIN_CONFIDENCE,
+            Config.TIER_BORDERLINE_MARGIN
+        ]))
+        # Fallbacks after an LLM failure are not cached, so the next request retries the LLM
+        return self.cache.get_or_compute(
+            'analysis', digest, lambda: self._analyze_resume(resume_text, user_data),
+            cacheable=lambda analysis: analysis.get('analysis_tier') != 'llm_failed'
+        )
+    
+    def _analyze_resume(self, resume_text: str, user_data: Dict) -> Dict:
+        """Analyze locally and/or with the LLM, as Config.ANALYSIS_MODE says
+        
+        'llm' sends every resume to the LLM, 'tiered' only those whose local
+        analysis is low-confidence or borderline, and 'local' none. Local
+        analysis is also the fallback when the LLM fails. The tier that
+        produced a result is recorded under 'analysis_tier' and counted in
+        the analysis.tier.* metrics.
+        """
+        started = time.perf_counter()
+        mode = Config.ANALYSIS_MODE if llm_client else 'local'
+        local = None
+        if mode == 'tiered':
+            try:
+                local, confidence = self._analyze_locally(resume_text, user_data)
+                reason = self._escalation_reason(local, confidence)
+            except Exception as e:
+                logger.error(f"Error in local analysis: {str(e)}")
+                reason = 'local_error'
+            if reason is None:
+                return self._record_tier('local', local, started)
+            metrics.increment(f'analysis.escalations.{reason}')
+        elif mode == 'local':
+            return self._record_tier('local', self._analyze_with_fallback(resume_text, user_data), started)
+        
         try:
-            if model:
-                return self._analyze_with_gemini(resume_text, user_data)
-            else:
-                return self._analyze_with_fallback(resume_text, user_data)
+            return self._record_tier('llm', self._analyze_with_llm(resume_text, user_data), started)
         except Exception as e:
             logger.error(f"Error in AI analysis: {str(e)}")
-            return self._analyze_with_fallback(resume_text, user_data)
+            return self._record_tier('llm_failed', local or self._analyze_with_fallback(resume_text, user_data), started)
     
-    def _analyze_with_gemini(self, resume_text: str, user_data: Dict) -> Dict:
-        """Analyze resume using Gemini AI"""
+    def _escalation_reason(self, analysis: Dict, confidence: float) -> Optional[str]:
+        """Why a local analysis needs the LLM ('low_confidence' or 'borderline'), or None"""
+        if confidence < Config.TIER_MIN_CONFIDENCE:
+            return 'low_confidence'
+        score = analysis['scoring']['overall_resume_score']
+        if any(
+            threshold is not None and abs(score - threshold) < Config.TIER_BORDERLINE_MARGIN
+            for _, threshold in GRADE_THRESHOLDS
+        ):
+            return 'borderline'
+        return None
+    
+    def _record_tier(self, tier: str, analysis: Dict, started: float) -> Dict:
+        metrics.increment(f'analysis.tier.{tier}')
+        metrics.increment(f'analysis.tier.{tier}.seconds', time.perf_counter() - started)
+        return dict(analysis, analysis_tier=tier)
+    
+    def _analyze_with_llm(self, resume_text: str, user_data: Dict) -> Dict:
+        """Analyze resume using the LLM (Gemini)"""
+        # Only the prompt text is compacted; the fallback and caches still see the full resume
+        if Config.PROMPT_COMPACTION:
+            compacted = self.text_processor.compact_for_prompt(resume_text, Config.LLM_RESUME_TOKEN_BUDGET or None)
+            metrics.increment('llm.resume_tokens.original', compacted.original_tokens)
+            metrics.increment('llm.resume_tokens.sent', compacted.tokens)
+            logger.info(
+                f"Compacted resume for the LLM: {compacted.original_tokens} -> {compacted.tokens} tokens"
+                + (" (truncated)" if compacted.truncated else "")
+            )
+            resume_text = compacted.text
+        
         prompt = f"""
         Analyze this resume comprehensively and provide detailed scoring. The candidate is:
         Name: {user_data.get('fullName', '')}
@@ -159,24 +276,33 @@ class AdvancedResumeAnalyzer:
         Be thorough and provide realistic scores based on the actual content.
         """
         
-        try:
-            response = model.generate_content(prompt)
-            analysis = json.loads(response.text)
-            return analysis
-        except json.JSONDecodeError:
-            return self._analyze_with_fallback(resume_text, user_data)
+        analysis = llm_client.complete_json(prompt)
+        if not isinstance(analysis, dict):
+            raise LLMResponseError("LLM analysis is not a JSON object")
+        return analysis
     
     def _analyze_with_fallback(self, resume_text: str, user_data: Dict) -> Dict:
         """Fallback analysis using text processing"""
-        # Extract information using text processor
-        skills = self.text_processor.extract_skills(resume_text)
-        experience = self.text_processor.extract_experience(resume_text)
-        projects = self.text_processor.extract_projects(resume_text)
-        education = self.text_processor.extract_education(resume_text)
+        return self._analyze_locally(resume_text, user_data)[0]
+    
+    def _analyze_locally(self, resume_text: str, user_data: Dict) -> Tuple[Dict, float]:
+        """Text-processing analysis, and how confident it is (0-1)
+        
+        Confidence is high for clearly technical resumes of reasonable length
+        with many taxonomy skills and some experience or projects, which is
+        where keyword extraction works well.
+        """
+        # Extract information using text processor; the resume is tokenized once for all extractors
+        parsed = ParsedResume(resume_text)
+        skills = self.text_processor.extract_skills(parsed)
+        experience = self.text_processor.extract_experience(parsed)
+        projects = self.text_processor.extract_projects(parsed)
+        education = self.text_processor.extract_education(parsed)
         
         # Determine candidate type
         tech_keywords = ['programming', 'software', 'development', 'coding', 'algorithm', 'database', 'api', 'framework']
-        is_technical = any(keyword in resume_text.lower() for keyword in tech_keywords)
+        tech_keyword_hits = sum(keyword in parsed.lower for keyword in tech_keywords)
+        is_technical = tech_keyword_hits > 0
         
         # Calculate scores
         technical_score = min(25, len(skills['technical_skills']) * 3)
@@ -185,11 +311,7 @@ class AdvancedResumeAnalyzer:
         projects_score = min(20, len(projects) * 4)
         
         # Achievement extraction (basic)
-        achievement_keywords = ['award', 'recognition', 'achievement', 'honor', 'medal', 'certificate', 'winner']
-        achievements = []
-        for sentence in resume_text.split('.'):
-            if any(keyword in sentence.lower() for keyword in achievement_keywords):
-                achievements.append(sentence.strip())
+        achievements = self.text_processor.extract_achievements(parsed)
         
         achievements_score = min(10, len(achievements) * 2)
         
@@ -202,7 +324,14 @@ class AdvancedResumeAnalyzer:
         
         overall_score = technical_score + soft_skills_score + experience_score + projects_score + achievements_score + education_score
         
-        return {
+        confidence = (
+            0.35 * min(1.0, len(skills['technical_skills']) / 6)
+            + 0.25 * min(1.0, (len(experience) + len(projects)) / 4)
+            + 0.25 * min(1.0, tech_keyword_hits / 3)
+            + 0.15 * min(1.0, len(resume_text) / 1500)
+        )
+        
+        analysis = {
             "candidate_type": "Technical" if is_technical else "Non-Technical",
             "skills_analysis": {
                 "technical_skills": skills['technical_skills'],
@@ -238,82 +367,96 @@ class AdvancedResumeAnalyzer:
             "improvement_areas": ["Industry experience", "Professional certifications"],
             "job_recommendations": ["Software Developer", "Data Analyst", "Business Analyst"]
         }
+        return analysis, round(confidence, 3)
     
     def analyze_github_profile(self, github_url: str) -> Optional[Dict]:
-        """Analyze GitHub profile with scoring"""
+        """Analyze GitHub profile with scoring
+        
+        Raises GitHubRateLimited when the API budget is exhausted rather than
+        passing off mock data as the candidate's profile.
+        """
+        if not self.github_client:
+            return self._mock_github_analysis()
+        
+        username = self._github_username(github_url)
         try:
-            if not self.github_headers:
-                return self._mock_github_analysis()
-            
-            username = github_url.split('github.com/')[-1].strip('/')
-            
-            # Get user profile
-            profile_response = requests.get(
-                f'https://api.github.com/users/{username}',
-                headers=self.github_headers
-            )
-            
-            if profile_response.status_code != 200:
-                return self._mock_github_analysis()
-            
-            profile_data = profile_response.json()
-            
-            # Get repositories
-            repos_response = requests.get(
-                f'https://api.github.com/users/{username}/repos?sort=updated&per_page=20',
-                headers=self.github_headers
-            )
-            
-            if repos_response.status_code != 200:
-                return self._mock_github_analysis()
-            
-            repos_data = repos_response.json()
-            
-            # Analyze repositories
-            languages = {}
-            total_stars = 0
-            total_forks = 0
-            active_repos = 0
-            
-            for repo in repos_data:
-                if not repo['fork']:
-                    active_repos += 1
-                    total_stars += repo['stargazers_count']
-                    total_forks += repo['forks_count']
-                    
-                    if repo['language']:
-                        languages[repo['language']] = languages.get(repo['language'], 0) + 1
-            
-            # Calculate GitHub score
-            repo_score = min(30, active_repos * 2)
-            star_score = min(25, total_stars * 2)
-            language_score = min(20, len(languages) * 4)
-            contribution_score = min(25, profile_data.get('public_repos', 0))
-            
-            github_score = repo_score + star_score + language_score + contribution_score
-            
-            return {
-                'username': username,
-                'public_repos': profile_data['public_repos'],
-                'followers': profile_data['followers'],
-                'following': profile_data['following'],
-                'total_stars': total_stars,
-                'total_forks': total_forks,
-                'languages': list(languages.keys()),
-                'active_repos': active_repos,
-                'github_score': min(100, github_score),
-                'score_breakdown': {
-                    'repository_count': repo_score,
-                    'star_rating': star_score,
-                    'language_diversity': language_score,
-                    'contribution_activity': contribution_score
-                },
-                'profile_strength': self._get_github_strength(github_score)
-            }
-            
+            fetched = self.github_client.fetch_profile(username)
+        except GitHubRateLimited:
+            raise
         except Exception as e:
             logger.error(f"Error analyzing GitHub: {str(e)}")
             return self._mock_github_analysis()
+        
+        if fetched is None:
+            return self._mock_github_analysis()
+        return self._score_github_profile(username, fetched['profile'], fetched['repos'])
+    
+    def analyze_github_profiles(self, github_urls: List[str]) -> Dict[str, Optional[Dict]]:
+        """Analyze many GitHub profiles at once over the pooled client
+        
+        Returns a mapping from each URL to its analysis, or None when the
+        profile could not be fetched (missing user, rate limit, network error).
+        """
+        if not self.github_client:
+            return {url: self._mock_github_analysis() for url in github_urls}
+        
+        usernames = {url: self._github_username(url) for url in github_urls}
+        fetched = self.github_client.fetch_profiles(usernames.values())
+        
+        results = {}
+        for url, username in usernames.items():
+            profile = fetched.get(username)
+            results[url] = self._score_github_profile(
+                username, profile['profile'], profile['repos']
+            ) if profile else None
+        return results
+    
+    def _github_username(self, github_url: str) -> str:
+        return github_url.split('github.com/')[-1].strip('/')
+    
+    def _score_github_profile(self, username: str, profile_data: Dict, repos_data: List[Dict]) -> Dict:
+        """Score a fetched GitHub profile and its repositories"""
+        # Analyze repositories
+        languages = {}
+        total_stars = 0
+        total_forks = 0
+        active_repos = 0
+        
+        for repo in repos_data:
+            if not repo['fork']:
+                active_repos += 1
+                total_stars += repo['stargazers_count']
+                total_forks += repo['forks_count']
+                
+                if repo['language']:
+                    languages[repo['language']] = languages.get(repo['language'], 0) + 1
+        
+        # Calculate GitHub score
+        repo_score = min(30, active_repos * 2)
+        star_score = min(25, total_stars * 2)
+        language_score = min(20, len(languages) * 4)
+        contribution_score = min(25, profile_data.get('public_repos', 0))
+        
+        github_score = repo_score + star_score + language_score + contribution_score
+        
+        return {
+            'username': username,
+            'public_repos': profile_data['public_repos'],
+            'followers': profile_data['followers'],
+            'following': profile_data['following'],
+            'total_stars': total_stars,
+            'total_forks': total_forks,
+            'languages': list(languages.keys()),
+            'active_repos': active_repos,
+            'github_score': min(100, github_score),
+            'score_breakdown': {
+                'repository_count': repo_score,
+                'star_rating': star_score,
+                'language_diversity': language_score,
+                'contribution_activity': contribution_score
+            },
+            'profile_strength': self._get_github_strength(github_score)
+        }
     
     def _mock_github_analysis(self) -> Dict:
         """Mock GitHub analysis for demo"""
@@ -367,12 +510,232 @@ class AdvancedResumeAnalyzer:
         else:
             return "Needs Improvement"
 
-# Initialize analyzer
-analyzer = AdvancedResumeAnalyzer()
+# The analyzer and the applicant index built on its job matcher are created
+# on first use, so importing the app (and starting a worker) stays cheap
+_analyzer = None
+_candidate_index = None
+_analyzer_lock = threading.Lock()
+
+def get_analyzer() -> AdvancedResumeAnalyzer:
+    """The process-wide analyzer, created on first use"""
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = AdvancedResumeAnalyzer()
+    return _analyzer
+
+_candidate_index_synced = None
+_candidate_sync_lock = threading.Lock()
+
+def _index_candidate(index: CandidateIndex, analysis: Dict, resume_text: Optional[str] = None):
+    """Add (or replace) one analyzed applicant, keyed by email; resume_text adds the semantic match
+    
+    The analysis timestamp is the index version, so an analysis that is
+    already indexed is not added again.
+    """
+    user_data = analysis.get('user_data') or {}
+    index.add(user_data['email'], candidate_profile(analysis, resume_text), {
+        'name': user_data.get('fullName'),
+        'email': user_data.get('email'),
+        'college': user_data.get('college'),
+        'analysis_timestamp': analysis.get('analysis_timestamp')
+    }, version=analysis.get('analysis_timestamp'))
+
+def get_candidate_index() -> CandidateIndex:
+    """Analyzed applicants, ranked against job roles for HR
+    
+    The index is per process. It is filled from candidate_repository when
+    first built and then catches up with analyses stored since, so every
+    worker ranks the whole applicant pool, not just its own submissions.
+    """
+    global _candidate_index, _candidate_index_synced
+    if _candidate_index is None:
+        analyzer = get_analyzer()
+        with _analyzer_lock:
+            if _candidate_index is None:
+                _candidate_index = CandidateIndex(analyzer.job_matcher)
+    
+    with _candidate_sync_lock:
+        try:
+            for application, analysis in candidate_repository.iter_analyses(_candidate_index_synced):
+                email = analysis.setdefault('user_data', {}).setdefault('email', application['email'])
+                # Status and score edits also move updatedAt; skip rows whose analysis is already indexed
+                if not _candidate_index.is_current(email, analysis.get('analysis_timestamp')):
+                    _index_candidate(_candidate_index, analysis, resume_index.get_text(application['id']))
+                _candidate_index_synced = (application['updatedAt'], application['id'])
+        except Exception as e:
+            logger.error(f"Error loading candidates into the index: {str(e)}")
+    return _candidate_index
+
+# Shared threads for the independent resume/GitHub/LinkedIn stages
+stage_executor = ThreadPoolExecutor(max_workers=Config.ANALYSIS_STAGE_WORKERS, thread_name_prefix='analysis-stage')
+
+# Applications and their analyses, served to the HR dashboard
+candidate_repository = create_candidate_repository(Config.DATABASE_URL)
+
+# Searchable text of analyzed resumes, keyed by application id
+resume_index = SQLiteResumeIndex(Config.RESUME_INDEX_PATH)
+
+# MinHash signatures of analyzed resumes, for flagging near-duplicate resubmissions
+duplicate_index = SQLiteDuplicateIndex(
+    Config.DUPLICATE_INDEX_PATH, Config.MINHASH_BANDS, Config.MINHASH_ROWS, Config.DUPLICATE_THRESHOLD,
+    min_shingles=Config.DUPLICATE_MIN_SHINGLES
+) if Config.DUPLICATE_DETECTION else None
+
+def find_duplicate_analysis(resume_text: str) -> Optional[Dict]:
+    """The closest earlier near-duplicate of a resume, if any
+    
+    Returns {'duplicate_of': {'application_id', 'similarity',
+    'reused_analysis'}} plus the earlier 'resume_analysis' when
+    DUPLICATE_SHORT_CIRCUIT is on and it is stored.
+    """
+    if duplicate_index is None:
+        return None
+    try:
+        matches = duplicate_index.find(resume_text, limit=1)
+        if not matches:
+            return None
+        earlier_analysis = None
+        if Config.DUPLICATE_SHORT_CIRCUIT:
+            earlier_analysis = (candidate_repository.get_analysis(matches[0]['id']) or {}).get('resume_analysis')
+    except Exception as e:
+        logger.error(f"Error checking for duplicate resumes: {str(e)}")
+        return None
+    
+    logger.info(f"Resume is a near-duplicate of {matches[0]['id']} (similarity {matches[0]['similarity']})")
+    return {
+        'duplicate_of': {
+            'application_id': matches[0]['id'],
+            'similarity': matches[0]['similarity'],
+            'reused_analysis': earlier_analysis is not None
+        },
+        'resume_analysis': earlier_analysis
+    }
+
+def run_profile_analysis(user_data: Dict, resume: ResumeSource) -> Dict:
+    """Run the full profile analysis for one uploaded resume
+    
+    resume is the document bytes, or the path of an upload spilled to disk,
+    which is removed once the resume stage is done with it.
+    
+    Resume, GitHub and LinkedIn analysis run concurrently with per-stage
+    timeouts. The resume stage is required; a failed or slow profile stage
+    leaves its section empty and is reported under 'stage_errors'.
+    """
+    analyzer = get_analyzer()
+    extracted = {}
+    
+    def resume_stage() -> Dict:
+        logger.info("Extracting text from resume...")
+        try:
+            resume_text = analyzer.extract_text_from_resume(resume)
+        except ExtractionError as e:
+            # Basic fallback
+            resume_text = f"Unable to extract text from {e.file_type.upper()}"
+        else:
+            # Only real resume text is compared with, and added to, the duplicate and search indexes
+            if resume_text.strip():
+                extracted['text'] = resume_text
+        
+        earlier = find_duplicate_analysis(resume_text) if 'text' in extracted else None
+        if earlier is not None:
+            extracted['duplicate_of'] = earlier['duplicate_of']
+            if earlier.get('resume_analysis') is not None:
+                logger.info(f"Reusing the analysis of near-duplicate {earlier['duplicate_of']['application_id']}")
+                return earlier['resume_analysis']
+        
+        logger.info("Analyzing resume with AI...")
+        return analyzer.analyze_resume_with_ai(resume_text, user_data)
+    
+    stages = {
+        'resume': (resume_stage, Config.RESUME_STAGE_TIMEOUT)
+    }
+    if user_data.get('github'):
+        logger.info("Analyzing GitHub profile...")
+        stages['github'] = (lambda: analyzer.analyze_github_profile(user_data['github']), Config.GITHUB_STAGE_TIMEOUT)
+    if user_data.get('linkedin'):
+        logger.info("Analyzing LinkedIn profile...")
+        stages['linkedin'] = (lambda: analyzer.analyze_linkedin_profile(user_data['linkedin']), Config.LINKEDIN_STAGE_TIMEOUT)
+    
+    def remove_spilled_upload():
+        os.remove(resume)
+    
+    # A timed-out resume stage may still be reading the spilled upload, so it is
+    # removed when the stage's thread finishes rather than when this call returns
+    cleanup = {'resume': remove_spilled_upload} if isinstance(resume, str) else None
+    results, timings, errors = run_stages(stage_executor, stages, required=['resume'], on_done=cleanup)
+    
+    # Prepare comprehensive response
+    analysis = {
+        'user_data': user_data,
+        'resume_analysis': results['resume'],
+        'github_analysis': results.get('github'),
+        'linkedin_analysis': results.get('linkedin'),
+        'stage_timings_ms': timings,
+        'stage_errors': errors,
+        'analysis_timestamp': datetime.now().isoformat()
+    }
+    if 'duplicate_of' in extracted:
+        analysis['duplicate_of'] = extracted['duplicate_of']
+    
+    try:
+        _index_candidate(get_candidate_index(), analysis, extracted.get('text'))
+    except Exception as e:
+        logger.error(f"Error indexing candidate: {str(e)}")
+    
+    try:
+        application = candidate_repository.record_analysis(
+            user_data, analysis, _skill_ids(candidate_profile(analysis)['technical_skills'])
+        )
+        if extracted.get('text'):
+            resume_index.add(application['id'], extracted['text'])
+            if duplicate_index is not None:
+                duplicate_index.add(application['id'], extracted['text'])
+    except Exception as e:
+        logger.error(f"Error storing analysis: {str(e)}")
+    
+    return analysis
+
+def _job_payload(user_data: Dict, resume: ResumeSource) -> Dict:
+    """JSON-safe job payload; in-memory resumes travel base64-encoded"""
+    if isinstance(resume, str):
+        return {'user_data': user_data, 'file_path': resume}
+    return {'user_data': user_data, 'resume_bytes': base64.b64encode(resume).decode('ascii')}
+
+def _run_profile_job(payload: Dict) -> Dict:
+    """Job queue handler for asynchronous profile analysis"""
+    if 'resume_bytes' in payload:
+        resume = base64.b64decode(payload['resume_bytes'])
+    else:
+        resume = payload['file_path']
+    return run_profile_analysis(payload['user_data'], resume)
+
+_job_workers = None
+_job_workers_lock = threading.Lock()
+
+def get_job_workers() -> JobWorkerPool:
+    """Start the background analysis workers on first use"""
+    global _job_workers
+    if _job_workers is None:
+        with _job_workers_lock:
+            if _job_workers is None:
+                job_queue = create_job_queue(Config.JOB_QUEUE_BACKEND, Config.JOB_QUEUE_PATH, Config.JOB_LEASE_SECONDS)
+                _job_workers = JobWorkerPool(job_queue, _run_profile_job, Config.JOB_WORKERS)
+    return _job_workers
+
+def _wants_async() -> bool:
+    """Whether the client asked for submit/poll mode"""
+    flag = request.args.get('async') or request.form.get('async') or ''
+    return flag.lower() in ('1', 'true', 'yes') or 'respond-async' in request.headers.get('Prefer', '')
 
 @app.route('/api/analyze-profile', methods=['POST'])
 def analyze_profile():
-    """Main endpoint for analyzing user profile"""
+    """Main endpoint for analyzing user profile
+    
+    Pass async=true (query or form) or 'Prefer: respond-async' to get a job id
+    back immediately and poll /api/jobs/<job_id> for the result.
+    """
     try:
         # Get form data
         user_data = {
@@ -409,54 +772,25 @@ def analyze_profile():
                 'message': 'No file selected'
             }), 400
         
-        # Save uploaded file
-        filename = secure_filename(file.filename)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_')
-        filename = timestamp + filename
-        file_path = os.path.join('uploads', filename)
-        file.save(file_path)
+        # Keep small uploads in memory; only large ones are spilled to disk
+        suffix = '_' + secure_filename(file.filename)
+        resume = spool_upload(file.stream, Config.UPLOAD_SPOOL_THRESHOLD, Config.UPLOAD_FOLDER, suffix)
         
-        try:
-            # Extract text from resume
-            logger.info("Extracting text from resume...")
-            resume_text = analyzer.extract_text_from_resume(file_path)
-            
-            # Analyze resume with AI
-            logger.info("Analyzing resume with AI...")
-            resume_analysis = analyzer.analyze_resume_with_ai(resume_text, user_data)
-            
-            # Analyze GitHub profile
-            github_analysis = None
-            if user_data.get('github'):
-                logger.info("Analyzing GitHub profile...")
-                github_analysis = analyzer.analyze_github_profile(user_data['github'])
-            
-            # Analyze LinkedIn profile
-            linkedin_analysis = None
-            if user_data.get('linkedin'):
-                logger.info("Analyzing LinkedIn profile...")
-                linkedin_analysis = analyzer.analyze_linkedin_profile(user_data['linkedin'])
-            
-            # Prepare comprehensive response
-            response_data = {
-                'user_data': user_data,
-                'resume_analysis': resume_analysis,
-                'github_analysis': github_analysis,
-                'linkedin_analysis': linkedin_analysis,
-                'analysis_timestamp': datetime.now().isoformat()
-            }
-            
+        if _wants_async():
+            workers = get_job_workers()
+            workers.queue.purge(Config.JOB_RESULT_TTL)
+            job_id = workers.submit(_job_payload(user_data, resume))
             return jsonify({
                 'success': True,
-                'data': response_data
-            })
-            
-        finally:
-            # Clean up uploaded file
-            try:
-                os.remove(file_path)
-            except Exception as e:
-                logger.warning(f"Could not delete uploaded file: {str(e)}")
+                'job_id': job_id,
+                'status': 'queued',
+                'status_url': f'/api/jobs/{job_id}'
+            }), 202
+        
+        return jsonify({
+            'success': True,
+            'data': run_profile_analysis(user_data, resume)
+        })
         
     except Exception as e:
         logger.error(f"Error in analyze_profile: {str(e)}")
@@ -465,6 +799,321 @@ def analyze_profile():
             'message': f'Analysis failed: {str(e)}'
         }), 500
 
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job_status(job_id: str):
+    """Status and, once finished, result of an asynchronous analysis"""
+    job = get_job_workers().queue.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'message': 'Job not found'
+        }), 404
+    
+    response = {
+        'success': True,
+        'job_id': job_id,
+        'status': job['status'],
+        'created_at': datetime.fromtimestamp(job['created_at']).isoformat(),
+        'updated_at': datetime.fromtimestamp(job['updated_at']).isoformat()
+    }
+    if job['status'] == STATUS_COMPLETED:
+        response['data'] = job['result']
+    elif job['status'] == STATUS_FAILED:
+        response['message'] = f"Analysis failed: {job['error']}"
+    
+    return jsonify(response)
+
+# HR sessions are bearer tokens signed with SECRET_KEY; see /api/hr/login
+hr_tokens = URLSafeTimedSerializer(Config.SECRET_KEY, salt='hr-login')
+
+def _hr_login_configured() -> bool:
+    """Whether HR_PASSWORD is set and tokens are signed with a real secret"""
+    return bool(Config.HR_PASSWORD) and Config.SECRET_KEY != 'your-secret-key-here'
+
+def hr_login_required(view):
+    """Reject requests without a valid HR token (Authorization: Bearer <token>)"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+        try:
+            if not _hr_login_configured() or scheme.lower() != 'bearer':
+                raise BadSignature('missing token')
+            hr_tokens.loads(token, max_age=Config.HR_TOKEN_TTL)
+        except (BadSignature, SignatureExpired):
+            return jsonify({
+                'success': False,
+                'message': 'HR login required'
+            }), 401
+        return view(*args, **kwargs)
+    return wrapper
+
+@app.route('/api/hr/login', methods=['POST'])
+def hr_login():
+    """Exchange the HR password for a token to send with HR requests"""
+    if not _hr_login_configured():
+        logger.error("HR login attempted, but HR_PASSWORD or SECRET_KEY is not configured")
+        return jsonify({
+            'success': False,
+            'message': 'HR login is not configured on the server'
+        }), 503
+    
+    data = request.get_json(silent=True) or request.form.to_dict()
+    username = (data.get('username') or '').strip() or 'HR'
+    if not hmac.compare_digest((data.get('password') or '').encode('utf-8'), Config.HR_PASSWORD.encode('utf-8')):
+        return jsonify({
+            'success': False,
+            'message': 'Invalid credentials'
+        }), 401
+    
+    return jsonify({
+        'success': True,
+        'token': hr_tokens.dumps({'username': username}),
+        'username': username,
+        'expires_in': Config.HR_TOKEN_TTL
+    })
+
+@app.route('/api/applications', methods=['POST'])
+def create_application():
+    """Store a submitted job application"""
+    data = request.get_json(silent=True) or request.form.to_dict()
+    
+    required_fields = ['fullName', 'email']
+    for field in required_fields:
+        if not data.get(field):
+            return jsonify({
+                'success': False,
+                'message': f'Missing required field: {field}'
+            }), 400
+    
+    return jsonify({
+        'success': True,
+        'application': candidate_repository.add_application(data)
+    }), 201
+
+def _skill_ids(skills) -> List[str]:
+    """Canonical taxonomy ids for skill names"""
+    taxonomy = get_analyzer().job_matcher.taxonomy
+    return [taxonomy.canonical_id(skill) for skill in skills if skill]
+
+def _list_arg(name: str) -> List[str]:
+    """A repeatable or comma-separated query parameter"""
+    return [value.strip() for values in request.args.getlist(name) for value in values.split(',') if value.strip()]
+
+@app.route('/api/applications', methods=['GET'])
+@hr_login_required
+def list_applications():
+    """One page of applications, filtered and sorted, with keyset pagination
+    
+    Query parameters: limit, cursor (next_cursor of the previous page),
+    q (text search over name, email, college, role and skills), status,
+    jobRole, candidateType, grade and skills (comma-separated; skills must
+    all match), minScore, maxScore, submittedFrom, submittedTo, sort
+    (submissionDate, score, fullName, cgpa), order (asc or desc) and
+    count=true to include the number of matches (capped at
+    APPLICATIONS_COUNT_LIMIT).
+    """
+    limit = max(1, min(
+        request.args.get('limit', Config.APPLICATIONS_PAGE_SIZE, type=int),
+        Config.APPLICATIONS_MAX_PAGE_SIZE
+    ))
+    filters = {
+        'q': request.args.get('q'),
+        'status': _list_arg('status'),
+        'jobRole': _list_arg('jobRole'),
+        'candidateType': _list_arg('candidateType'),
+        'grade': _list_arg('grade'),
+        'skills': _skill_ids(_list_arg('skills')),
+        'minScore': request.args.get('minScore', type=float),
+        'maxScore': request.args.get('maxScore', type=float),
+        'submittedFrom': request.args.get('submittedFrom'),
+        'submittedTo': request.args.get('submittedTo')
+    }
+    
+    try:
+        applications, next_cursor = candidate_repository.list_applications(
+            filters,
+            sort=request.args.get('sort', 'submissionDate'),
+            descending=request.args.get('order', 'desc').lower() != 'asc',
+            limit=limit,
+            cursor=request.args.get('cursor')
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
+    response = {
+        'success': True,
+        'applications': applications,
+        'limit': limit,
+        'next_cursor': next_cursor
+    }
+    if request.args.get('count', '').lower() == 'true':
+        # Counting stops at APPLICATIONS_COUNT_LIMIT; total_exact is false past it
+        total = candidate_repository.count_applications(filters, Config.APPLICATIONS_COUNT_LIMIT)
+        response['total'] = total
+        response['total_exact'] = total < Config.APPLICATIONS_COUNT_LIMIT
+    return jsonify(response)
+
+@app.route('/api/resumes/search', methods=['GET'])
+@hr_login_required
+def search_resumes():
+    """Full-text search over analyzed resumes, best BM25 match first
+    
+    Query parameters: q (words are ANDed; AND, OR, NOT, parentheses,
+    "quoted phrases", 'phrase: words' and prefix* are supported) and limit.
+    """
+    limit = max(1, min(request.args.get('limit', 20, type=int), Config.RESUME_SEARCH_MAX_RESULTS))
+    try:
+        hits = resume_index.search(request.args.get('q', ''), limit)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
+    return jsonify({
+        'success': True,
+        'results': [
+            {**hit, 'application': candidate_repository.get_application(hit['id'])}
+            for hit in hits
+        ]
+    })
+
+@app.route('/api/applications/stats', methods=['GET'])
+@hr_login_required
+def application_stats():
+    """Application counts by job role and status"""
+    return jsonify({
+        'success': True,
+        **candidate_repository.stats()
+    })
+
+@app.route('/api/applications/<application_id>', methods=['GET', 'PATCH'])
+@hr_login_required
+def application_detail(application_id: str):
+    """Fetch an application, or PATCH its status and/or score"""
+    if request.method == 'PATCH':
+        body = request.get_json(silent=True) or {}
+        if not isinstance(body, dict):
+            return jsonify({
+                'success': False,
+                'message': 'Expected a JSON object'
+            }), 400
+        changes = {key: value for key, value in body.items() if key in ('status', 'score')}
+        try:
+            application = candidate_repository.update_application(application_id, changes)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'message': str(e)
+            }), 400
+    else:
+        application = candidate_repository.get_application(application_id)
+    
+    if application is None:
+        return jsonify({
+            'success': False,
+            'message': 'Application not found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'application': application
+    })
+
+@app.route('/api/job-roles/<path:title>/candidates', methods=['GET'])
+@hr_login_required
+def rank_job_candidates(title: str):
+    """Rank the analyzed applicant pool against one job role (?k= limits the results)"""
+    job_role = next(
+        (job for job in get_analyzer().job_matcher.job_database if job.title.lower() == title.lower()),
+        None
+    )
+    if job_role is None:
+        return jsonify({
+            'success': False,
+            'message': f'Unknown job role: {title}'
+        }), 404
+    
+    k = max(1, min(request.args.get('k', 20, type=int), 1000))
+    candidate_index = get_candidate_index()
+    return jsonify({
+        'success': True,
+        'job_role': job_role.title,
+        'total_candidates': len(candidate_index),
+        'candidates': candidate_index.rank_candidates(job_role, k)
+    })
+
+@app.route('/api/analyze-batch', methods=['POST'])
+def analyze_batch():
+    """Analyze many resumes (or zip archives of resumes), streaming NDJSON results"""
+    uploads = request.files.getlist('resumes') + request.files.getlist('resume')
+    if not uploads:
+        return jsonify({
+            'success': False,
+            'message': 'No resume files uploaded'
+        }), 400
+    
+    # Shared fields applied to every resume in the batch
+    user_data = {
+        'college': request.form.get('college'),
+        'cgpa': request.form.get('cgpa')
+    }
+    
+    try:
+        os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+        batch_dir = tempfile.mkdtemp(prefix='batch_', dir=Config.UPLOAD_FOLDER)
+    except OSError as e:
+        logger.error(f"Error creating batch directory: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': 'Could not store the batch upload'
+        }), 500
+    
+    try:
+        files = collect_batch_files(
+            uploads,
+            batch_dir,
+            Config.ALLOWED_EXTENSIONS,
+            Config.BATCH_MAX_FILES,
+            Config.MAX_CONTENT_LENGTH
+        )
+    except Exception as e:
+        shutil.rmtree(batch_dir, ignore_errors=True)
+        logger.error(f"Error reading batch upload: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': f'Invalid batch upload: {str(e)}'
+        }), 400
+    
+    if not files:
+        shutil.rmtree(batch_dir, ignore_errors=True)
+        return jsonify({
+            'success': False,
+            'message': 'No supported resume files found'
+        }), 400
+    
+    logger.info(f"Analyzing batch of {len(files)} resumes...")
+    
+    def generate():
+        failed = 0
+        try:
+            for result in get_analyzer().analyze_batch(files, user_data):
+                failed += 0 if result['success'] else 1
+                yield json.dumps(result) + '\n'
+            yield json.dumps({
+                'done': True,
+                'total': len(files),
+                'failed': failed,
+                'analysis_timestamp': datetime.now().isoformat()
+            }) + '\n'
+        finally:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/api/calculate-total-score', methods=['POST'])
 def calculate_total_score():
     """Calculate total score including HR evaluations"""
@@ -543,6 +1192,15 @@ def get_grade_and_recommendation(score: float) -> tuple:
     else:
         return "D", "Not recommended - Major gaps in required skills"
 
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Process-local counters (cache hits/misses and evictions, ...)"""
+    return jsonify({
+        'success': True,
+        'metrics': metrics.snapshot(),
+        'cache': get_analyzer().cache.stats()
+    })
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
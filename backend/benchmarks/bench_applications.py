@@ -0,0 +1,110 @@
+# Query benchmark for the SQLite application store at dashboard scale
+#
+#   python -m backend.benchmarks.bench_applications [--applications N] [--db PATH]
+#
+# Loads N synthetic analyzed applications (once; an existing --db is
+# reused), then times a mix of dashboard queries, each paged three deep
+# with keyset cursors, and reports p50/p95 latency per query. As in the
+# dashboard, the first page also counts the matches (up to --count-limit).
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator
+from backend.utils.candidate_store import APPLICATION_STATUSES, SQLiteCandidateRepository
+
+ROLES = ['Frontend Developer', 'Backend Developer', 'Full Stack Developer', 'Data Scientist',
+         'DevOps Engineer', 'Mobile Developer', 'UI/UX Designer', 'Machine Learning Engineer']
+CANDIDATE_TYPES = ['Technical', 'Non-Technical']
+SKILLS = ['python', 'javascript', 'react', 'node', 'docker', 'kubernetes', 'sql', 'machine_learning',
+          'java', 'aws', 'typescript', 'css', 'html', 'git', 'figma', 'tensorflow', 'go', 'cpp']
+FIRST_NAMES = ['Aarav', 'Priya', 'Rahul', 'Ananya', 'Vikram', 'Sneha', 'Arjun', 'Divya', 'Karan', 'Meera']
+LAST_NAMES = ['Sharma', 'Patel', 'Reddy', 'Iyer', 'Gupta', 'Nair', 'Singh', 'Das', 'Kumar', 'Rao']
+COLLEGES = ['IIT Delhi', 'NIT Trichy', 'BITS Pilani', 'VIT Vellore', 'Anna University', 'IIIT Hyderabad']
+
+QUERIES = {
+    'latest': {},
+    'role': {'jobRole': 'Data Scientist'},
+    'status': {'status': 'shortlisted'},
+    'score range': {'minScore': 70, 'maxScore': 85},
+    'grade A/A+ by score': ({'grade': ['A+', 'A']}, 'score'),
+    'type + role': {'candidateType': 'Technical', 'jobRole': 'DevOps Engineer'},
+    'one skill': {'skills': ['kubernetes']},
+    'two skills': {'skills': ['python', 'machine_learning']},
+    'search name': {'q': 'priya'},
+    'search college + skill': {'q': 'bits docker'},
+    'by name': ({}, 'fullName'),
+    'by cgpa': ({'jobRole': 'Backend Developer'}, 'cgpa')
+}
+
+
+def synthetic_applications(count: int, seed: int = 3) -> Iterator[Dict]:
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for number in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        analyzed = rng.random() < 0.9
+        yield {
+            'fullName': f'{first} {last} {number}',
+            'email': f'{first.lower()}.{last.lower()}{number}@example.com',
+            'college': rng.choice(COLLEGES),
+            'cgpa': round(rng.uniform(6, 10), 2),
+            'jobRole': rng.choice(ROLES),
+            'submissionDate': (start + timedelta(minutes=number)).isoformat(timespec='seconds'),
+            'score': rng.randint(20, 98) if analyzed else None,
+            'candidateType': rng.choice(CANDIDATE_TYPES) if analyzed else None,
+            'skills': rng.sample(SKILLS, rng.randint(3, 8)) if analyzed else []
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--applications', type=int, default=500000)
+    parser.add_argument('--db', default=os.path.join(tempfile.gettempdir(), 'bench_applications.db'))
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--count-limit', type=int, default=1000)
+    args = parser.parse_args()
+
+    repository = SQLiteCandidateRepository(args.db)
+    existing = repository.count_applications()
+    if existing < args.applications:
+        started = time.perf_counter()
+        rng = random.Random(5)
+        applications = list(synthetic_applications(args.applications - existing))
+        repository.add_applications(applications)
+        conn = repository._connect()
+        conn.executemany(
+            "UPDATE applications SET status = ? WHERE id = ?",
+            [(rng.choice(APPLICATION_STATUSES), row_id) for row_id in range(1, args.applications + 1, 7)]
+        )
+        repository.optimize()
+        print(f"loaded {args.applications - existing} applications in {time.perf_counter() - started:.1f} s")
+
+    all_timings = []
+    for name, query in QUERIES.items():
+        filters, sort = query if isinstance(query, tuple) else (query, 'submissionDate')
+        timings = []
+        for _ in range(args.repeats):
+            cursor = None
+            for page in range(3):
+                started = time.perf_counter()
+                _, cursor = repository.list_applications(filters, sort=sort, limit=20, cursor=cursor)
+                if page == 0:
+                    repository.count_applications(filters, args.count_limit)
+                timings.append((time.perf_counter() - started) * 1000)
+                if cursor is None:
+                    break
+        timings.sort()
+        all_timings.extend(timings)
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f"{name:24} p50 {statistics.median(timings):7.2f} ms   p95 {p95:7.2f} ms")
+
+    all_timings.sort()
+    print(f"overall p95: {all_timings[int(len(all_timings) * 0.95) - 1]:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
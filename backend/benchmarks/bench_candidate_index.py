@@ -0,0 +1,40 @@
+# Ranking benchmark for CandidateIndex on a large synthetic applicant pool
+#
+#   python -m backend.benchmarks.bench_candidate_index [--candidates N] [--k K]
+#
+# Indexes N synthetic candidates incrementally, then times
+# rank_candidates for every role in the built-in job catalog.
+import argparse
+import time
+from backend.benchmarks.bench_job_matcher import synthetic_profiles
+from backend.utils.candidate_index import CandidateIndex
+from backend.utils.job_matcher import JobMatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--candidates', type=int, default=100000)
+    parser.add_argument('--k', type=int, default=20)
+    args = parser.parse_args()
+
+    matcher = JobMatcher()
+    index = CandidateIndex(matcher)
+    profiles = synthetic_profiles(matcher, args.candidates)
+
+    started = time.perf_counter()
+    for number, profile in enumerate(profiles):
+        index.add(f'candidate-{number}', profile)
+    elapsed = time.perf_counter() - started
+    print(f"indexed {len(index)} candidates in {elapsed:.2f} s ({elapsed * 1e6 / len(index):.1f} us each)")
+
+    timings = []
+    for job_role in matcher.job_database:
+        started = time.perf_counter()
+        index.rank_candidates(job_role, args.k)
+        timings.append((time.perf_counter() - started) * 1000)
+        print(f"{job_role.title:28} {timings[-1]:8.2f} ms")
+    print(f"mean rank_candidates: {sum(timings) / len(timings):.2f} ms, max {max(timings):.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# Throughput benchmark for text extraction backends
+#
+#   python -m backend.benchmarks.bench_extraction [--rounds N] [--output PATH]
+#
+# Measures documents/second for every installed backend on the fixture
+# corpus and writes the results to Config.EXTRACTION_BENCHMARK_PATH, which
+# TextExtractor reads to try the fastest backend for each file type first.
+import argparse
+import glob
+import io
+import json
+import os
+import platform
+import time
+from datetime import datetime
+from typing import Dict
+from backend.config import Config
+from backend.benchmarks.fixtures import FIXTURES_DIR, write_fixtures
+from backend.utils.text_extraction import (
+    EXTRACTION_BACKENDS, ExtractionLimits, join_text, sniff_file_type
+)
+
+
+def benchmark(corpus_dir: str, rounds: int) -> Dict[str, Dict[str, float]]:
+    """Return {file_type: {backend: documents_per_second}} over the corpus"""
+    documents = {}
+    for path in sorted(glob.glob(os.path.join(corpus_dir, '*'))):
+        with open(path, 'rb') as file:
+            data = file.read()
+        file_type = sniff_file_type(io.BytesIO(data))
+        if file_type:
+            documents.setdefault(file_type, []).append((path, data))
+
+    # Measure full extraction work, not the production page/character caps
+    limits = ExtractionLimits(max_pages=1000, max_chars=10 ** 9, time_budget=float('inf'))
+    throughput = {}
+    for file_type, files in documents.items():
+        for backend in EXTRACTION_BACKENDS:
+            if file_type not in backend.file_types or not backend.available():
+                continue
+            try:
+                # Warm-up pass so imports and caches are not timed
+                for path, data in files:
+                    join_text(backend.extract(io.BytesIO(data), path, limits))
+                started = time.perf_counter()
+                for _ in range(rounds):
+                    for path, data in files:
+                        join_text(backend.extract(io.BytesIO(data), path, limits))
+                elapsed = time.perf_counter() - started
+            except Exception as e:
+                print(f"{backend.name} failed on {file_type}: {str(e)}")
+                continue
+
+            docs_per_second = rounds * len(files) / elapsed
+            throughput.setdefault(file_type, {})[backend.name] = round(docs_per_second, 1)
+            print(f"{file_type:5} {backend.name:12} {docs_per_second:10.1f} docs/s")
+
+    return throughput
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--corpus', default=FIXTURES_DIR, help='directory of resume files')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--output', default=Config.EXTRACTION_BENCHMARK_PATH)
+    args = parser.parse_args()
+
+    if args.corpus == FIXTURES_DIR and not os.path.isdir(FIXTURES_DIR):
+        write_fixtures()
+
+    results = {
+        'measured_at': datetime.now().isoformat(timespec='seconds'),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'rounds': args.rounds,
+        'throughput': benchmark(args.corpus, args.rounds)
+    }
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+        file.write('\n')
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
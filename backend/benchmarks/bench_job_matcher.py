@@ -0,0 +1,96 @@
+# Scoring benchmark for JobMatcher on large synthetic job catalogs
+#
+#   python -m backend.benchmarks.bench_job_matcher [--jobs N] [--candidates N]
+#
+# Compares the per-role Python loop (calculate_job_match) with the
+# vectorized JobMatrix scoring for one candidate and for a batch, and
+# times the TF-IDF semantic component for a candidate with resume text.
+import argparse
+import random
+import time
+from typing import Dict, List
+from backend.utils.job_matcher import JobMatcher, JobRole, MATCH_WEIGHTS
+
+EXPERIENCE_LEVELS = ['Entry-level', 'Entry to Mid-level', 'Mid-level', 'Mid to Senior-level', 'Senior-level']
+SOFT_SKILLS = ['communication', 'teamwork', 'problem solving', 'leadership', 'time management', 'creativity']
+
+
+def synthetic_catalog(matcher: JobMatcher, size: int, seed: int = 7) -> List[JobRole]:
+    """Random roles drawn from the taxonomy's skill names"""
+    rng = random.Random(seed)
+    skills = sorted({
+        skill for job in matcher.job_database for skill in job.required_skills + job.preferred_skills
+    })
+    return [
+        JobRole(
+            title=f"Role {index}",
+            category=rng.choice(['Web Development', 'Data Science', 'Infrastructure', 'Design']),
+            required_skills=rng.sample(skills, rng.randint(2, 5)),
+            preferred_skills=rng.sample(skills, rng.randint(3, 7)),
+            description='',
+            salary_range='',
+            experience_level=rng.choice(EXPERIENCE_LEVELS),
+            growth_potential='High'
+        )
+        for index in range(size)
+    ]
+
+
+def synthetic_profiles(matcher: JobMatcher, count: int, seed: int = 11) -> List[Dict]:
+    rng = random.Random(seed)
+    skills = sorted({skill for job in matcher.job_database for skill in job.required_skills})
+    return [
+        {
+            'technical_skills': rng.sample(skills, rng.randint(3, 12)),
+            'soft_skills': rng.sample(SOFT_SKILLS, rng.randint(0, 4)),
+            'experience_years': rng.randint(0, 12),
+            'education_level': rng.choice(['bachelor', 'master', 'phd']),
+            'github_projects': rng.randint(0, 8)
+        }
+        for _ in range(count)
+    ]
+
+
+def timed(function, repeats: int = 1) -> float:
+    """Mean wall time of function() in milliseconds"""
+    started = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - started) * 1000 / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=10000)
+    parser.add_argument('--candidates', type=int, default=100)
+    args = parser.parse_args()
+
+    matcher = JobMatcher()
+    catalog = synthetic_catalog(matcher, args.jobs)
+    started = time.perf_counter()
+    matcher = JobMatcher(catalog)
+    print(f"built {args.jobs} job matrix in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    profiles = synthetic_profiles(matcher, args.candidates)
+    profile = profiles[0]
+
+    def loop():
+        for job_role in matcher.job_database:
+            scores = matcher.calculate_job_match(profile, job_role)
+            sum(scores[category] * weight for category, weight in MATCH_WEIGHTS.items())
+
+    print(f"per-role loop, 1 candidate:       {timed(loop):10.2f} ms")
+    print(f"vectorized, 1 candidate:          {timed(lambda: matcher.score_jobs(profile), 20):10.2f} ms")
+    print(f"vectorized, {args.candidates} candidates (batch): {timed(lambda: matcher.score_jobs_batch(profiles), 5):10.2f} ms")
+    print(f"get_job_recommendations:          {timed(lambda: matcher.get_job_recommendations(profile), 20):10.2f} ms")
+    
+    started = time.perf_counter()
+    matcher.semantic
+    print(f"fitted TF-IDF job vectors in {(time.perf_counter() - started) * 1000:.1f} ms")
+    with_text = dict(profile, resume_text=' '.join(job.description for job in matcher.job_database[:20]))
+    print(f"semantic scores, 1 candidate:     {timed(lambda: matcher.semantic.scores(with_text['resume_text']), 20):10.2f} ms")
+    print(f"with resume text, recommendations:{timed(lambda: matcher.get_job_recommendations(with_text), 20):10.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# Load test for the LLM client against the local stub model (no network)
+#
+#   python -m backend.benchmarks.bench_llm_client [--prompts N] [--latency S] [--concurrency N]
+#
+# Times N distinct prompts one at a time and as one bounded-concurrency
+# batch, then the same batch again with whitespace-only prompt changes,
+# which the normalized-prompt cache answers without calling the model.
+import argparse
+import time
+from backend.benchmarks.fixtures import fixture_texts
+from backend.utils.analysis_cache import MemoryLRUCache
+from backend.utils.llm_client import LLMClient
+from backend.utils.llm_stub import StubLLMModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--prompts', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.2)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--failure-rate', type=float, default=0.05)
+    args = parser.parse_args()
+
+    texts = fixture_texts()
+    prompts = [f"Analyze resume {index}:\n{texts[index % len(texts)]}" for index in range(args.prompts)]
+
+    def client() -> LLMClient:
+        model = StubLLMModel(latency=args.latency, failure_rate=args.failure_rate, seed=11)
+        return LLMClient(model, MemoryLRUCache(), args.concurrency, max_retries=3, backoff=0.05)
+
+    sequential = client()
+    started = time.perf_counter()
+    failed = 0
+    for prompt in prompts:
+        try:
+            sequential.complete_json(prompt)
+        except Exception:
+            failed += 1
+    print(f"sequential       {time.perf_counter() - started:7.2f} s   {sequential.model.calls} model calls, {failed} failed")
+
+    batched = client()
+    started = time.perf_counter()
+    results = batched.complete_json_batch(prompts)
+    failed = sum(isinstance(result, Exception) for result in results)
+    print(f"batch of {args.concurrency:<3}     {time.perf_counter() - started:7.2f} s   "
+          f"{batched.model.calls} model calls, {failed} failed")
+
+    calls = batched.model.calls
+    started = time.perf_counter()
+    batched.complete_json_batch(['  ' + prompt.replace('\n', '\n    ') for prompt in prompts])
+    print(f"cached batch     {time.perf_counter() - started:7.2f} s   {batched.model.calls - calls} model calls")
+
+
+if __name__ == '__main__':
+    main()
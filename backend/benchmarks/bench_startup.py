@@ -0,0 +1,109 @@
+# Startup benchmark: cold start and per-worker memory of the NLP models
+#
+#   python -m backend.benchmarks.bench_startup [--workers N]
+#
+# Cold start: wall time and peak RSS of a fresh interpreter that imports
+# the text processor and builds a TextProcessor (models load on first use),
+# compared with one that also loads every model up front, as the old
+# import-time initialization did, and with importing the whole app.
+#
+# Prefork: forks N workers that each need the models, with and without
+# preloading them in the parent first (gunicorn.conf.py's on_starting),
+# and reports each worker's private (unshared) memory. Linux only.
+import argparse
+import gc
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Optional
+from backend.utils.text_processor import preload_models
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STARTUP_SCRIPT = """
+import resource, sys, time
+started = time.perf_counter()
+if sys.argv[1] == 'app':
+    import backend.app
+else:
+    from backend.utils.text_processor import TextProcessor, preload_models
+    TextProcessor()
+    if sys.argv[1] == 'eager':
+        preload_models()
+print(time.perf_counter() - started, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def private_memory_mb() -> Optional[float]:
+    """Memory private to this process (not shared with its parent), from /proc"""
+    try:
+        with open('/proc/self/smaps_rollup') as file:
+            kilobytes = sum(
+                int(line.split()[1]) for line in file if line.startswith(('Private_Clean', 'Private_Dirty'))
+            )
+    except OSError:
+        return None
+    return kilobytes / 1024
+
+
+def cold_start(mode: str, runs: int):
+    timings, peaks = [], []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT, mode],
+            cwd=REPOSITORY_ROOT, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(f"{mode:6} failed: {result.stderr.strip().splitlines()[-1]}")
+            return
+        elapsed, max_rss_kb = result.stdout.split()
+        timings.append(float(elapsed) * 1000)
+        peaks.append(int(max_rss_kb) / 1024)
+    print(f"{mode:6} cold start {statistics.median(timings):8.1f} ms   peak RSS {statistics.median(peaks):7.1f} MB")
+
+
+def _worker(results):
+    started = time.perf_counter()
+    # What a worker's first analysis needs; a no-op when the parent preloaded
+    preload_models()
+    results.put((time.perf_counter() - started, private_memory_mb()))
+
+
+def prefork(workers: int, preload: bool):
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    processes = [context.Process(target=_worker, args=(results,)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    measured = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    load_ms = statistics.mean(elapsed for elapsed, _ in measured) * 1000
+    private = [memory for _, memory in measured if memory is not None]
+    memory = f"{statistics.mean(private):7.1f} MB" if private else '    n/a'
+    label = 'preloaded' if preload else 'per worker'
+    print(f"{label:10} {workers} workers: first-use load {load_ms:8.1f} ms   private memory {memory} each")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    for mode in ('lazy', 'eager', 'app'):
+        cold_start(mode, args.runs)
+
+    # Lazy workers first, while nothing is loaded in this process yet
+    prefork(args.workers, preload=False)
+    preload_models()
+    gc.freeze()
+    prefork(args.workers, preload=True)
+
+
+if __name__ == '__main__':
+    main()
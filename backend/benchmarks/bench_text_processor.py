@@ -0,0 +1,106 @@
+# Micro-benchmark for the regex-based TextProcessor extractors
+#
+#   python -m backend.benchmarks.bench_text_processor [--rounds N]
+#
+# Measures documents/second per extractor on the fixture text corpus, for
+# the compiled pattern bank in text_processor and for the previous
+# approach (raw pattern strings per call, one scan per alternative) kept
+# below as a baseline. Resumes are parsed before timing, so only the
+# pattern matching is measured.
+import argparse
+import re
+import time
+from typing import Callable, Dict, List
+from backend.benchmarks.fixtures import fixture_texts
+from backend.utils.text_processor import EXPERIENCE_KEYWORDS, ParsedResume, TextProcessor
+
+
+def baseline_contact_info(parsed: ParsedResume) -> Dict[str, str]:
+    text = parsed.text
+    contact_info = {}
+    emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    if emails:
+        contact_info['email'] = emails[0]
+    for pattern in [
+        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+        r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',
+        r'\b\d{10}\b',
+        r'\+\d{1,3}[-.\s]?\d{10,14}'
+    ]:
+        phones = re.findall(pattern, text)
+        if phones:
+            contact_info['phone'] = phones[0]
+            break
+    linkedin = re.search(r'linkedin\.com/in/[^\s]+', text, re.IGNORECASE)
+    if linkedin:
+        contact_info['linkedin'] = 'https://' + linkedin.group()
+    github = re.search(r'github\.com/[^\s]+', text, re.IGNORECASE)
+    if github:
+        contact_info['github'] = 'https://' + github.group()
+    return contact_info
+
+
+def baseline_education(parsed: ParsedResume) -> List[Dict[str, str]]:
+    text = parsed.text
+    education = []
+    for degree_pattern in [
+        r'\b(bachelor|master|phd|doctorate|diploma|certificate|b\.?tech|m\.?tech|mba|bba|bca|mca|b\.?sc|m\.?sc|b\.?com|m\.?com|b\.?a|m\.?a)\b',
+        r'\b(undergraduate|graduate|postgraduate)\b'
+    ]:
+        for degree_match in re.finditer(degree_pattern, text.lower()):
+            context = text[max(0, degree_match.start() - 100):min(len(text), degree_match.end() + 100)]
+            education.append({'degree': degree_match.group().title(), 'context': context.strip()})
+    return education
+
+
+def baseline_experience(parsed: ParsedResume) -> List[Dict[str, str]]:
+    experience = []
+    for sentence in parsed.sentences:
+        sentence_lower = sentence.lower()
+        if any(keyword in sentence_lower for keyword in EXPERIENCE_KEYWORDS):
+            times = []
+            for pattern in [
+                r'\b(20\d{2})\b',
+                r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b',
+                # One group, so findall returns strings rather than (number, unit) tuples
+                r'\b(\d{1,2}\s+(?:years?|months?))\b'
+            ]:
+                times.extend(re.findall(pattern, sentence_lower))
+            if times:
+                experience.append({'description': sentence.strip(), 'timeframe': ', '.join(dict.fromkeys(times))})
+    return experience[:5]
+
+
+def throughput(extractor: Callable, documents: List[ParsedResume], rounds: int) -> float:
+    for document in documents:
+        extractor(document)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for document in documents:
+            extractor(document)
+    return rounds * len(documents) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    processor = TextProcessor()
+    documents = [ParsedResume(text) for text in fixture_texts()]
+    for document in documents:
+        document.sentences_lower
+
+    extractors = {
+        'contact_info': (baseline_contact_info, processor.extract_contact_info),
+        'education': (baseline_education, processor.extract_education),
+        'experience': (baseline_experience, processor.extract_experience)
+    }
+    for name, (baseline, compiled) in extractors.items():
+        before = throughput(baseline, documents, args.rounds)
+        after = throughput(compiled, documents, args.rounds)
+        print(f"{name:14} before {before:10.1f} docs/s   after {after:10.1f} docs/s   {after / before:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# Tiered analysis benchmark: LLM calls and latency per analysis mode (no network)
+#
+#   python -m backend.benchmarks.bench_tiered_analysis [--latency S] [--rounds N]
+#
+# Analyzes the fixture text corpus with ANALYSIS_MODE 'llm' (every resume
+# goes to the model) and 'tiered' (only low-confidence or borderline local
+# results do), against the stub model with caching disabled, and reports
+# model calls, the tier that answered and p50/p95 latency per resume.
+import argparse
+import os
+import statistics
+import time
+
+# Before the app is imported, which builds the model and caches from the environment
+os.environ.setdefault('LLM_BACKEND', 'stub')
+os.environ.setdefault('CACHE_BACKEND', 'none')
+os.environ.setdefault('LLM_CACHE_BACKEND', 'none')
+
+from collections import Counter
+from backend.app import Config, get_analyzer, llm_client
+from backend.benchmarks.fixtures import fixture_texts
+
+
+def run(mode: str, texts, rounds: int):
+    Config.ANALYSIS_MODE = mode
+    analyzer = get_analyzer()
+    calls = llm_client.model.calls
+    tiers = Counter()
+    timings = []
+    for _ in range(rounds):
+        for text in texts:
+            started = time.perf_counter()
+            analysis = analyzer._analyze_resume(text, {})
+            timings.append((time.perf_counter() - started) * 1000)
+            tiers[analysis['analysis_tier']] += 1
+    p50 = statistics.median(timings)
+    p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else p50
+    share = ', '.join(f"{tier} {count}" for tier, count in sorted(tiers.items()))
+    print(f"{mode:6} {llm_client.model.calls - calls:5} model calls   p50 {p50:8.1f} ms   p95 {p95:8.1f} ms   ({share})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--latency', type=float, default=0.5)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    if llm_client is None:
+        raise SystemExit("No LLM configured; set LLM_BACKEND=stub")
+    llm_client.model.latency = args.latency
+    texts = fixture_texts()
+    for mode in ('llm', 'tiered'):
+        run(mode, texts, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
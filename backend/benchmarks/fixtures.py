@@ -0,0 +1,185 @@
+# Deterministic resume fixture corpus for benchmarks
+import os
+import zipfile
+from typing import List
+from xml.sax.saxutils import escape
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SAMPLE_RESUMES = [
+    """John Doe
+john.doe@email.com | +1 234-567-8901 | linkedin.com/in/johndoe | github.com/johndoe
+Education
+B.Tech in Computer Science, Massachusetts Institute of Technology, 2019 - 2023. CGPA 8.5
+Experience
+Software Engineering Intern, Acme Corp Inc, Jun 2022 - Aug 2022. Developed REST APIs in Python and Flask for an internal analytics platform.
+Teaching Assistant, MIT, Jan 2021 - May 2022. Led weekly sessions on data structures and algorithms.
+Projects
+Resume Screener: Built a web application using React, Node.js and MongoDB that ranks resumes with machine learning.
+Chat Service: Implemented a real-time chat system with WebSockets, Redis and Docker, deployed on AWS.
+Skills
+Python, Java, JavaScript, SQL, React, Docker, Kubernetes, Git, Linux, TensorFlow
+Communication, teamwork, problem solving, leadership
+Achievements
+Winner, MIT Hackathon 2022. Dean's List award for academic excellence.""",
+    """Jane Smith
+jane.smith@email.com | (123) 456-7891
+Summary
+Data analyst with 3 years of professional experience in retail analytics and a master degree in statistics.
+Experience
+Data Analyst, Retail Analytics Pvt Ltd, Mar 2021 - present. Built Tableau dashboards and automated reporting with Python, Pandas and SQL.
+Junior Analyst, Insight Company, 2019 - 2021. Designed A/B testing frameworks and presented results to stakeholders.
+Education
+M.Sc Statistics, Stanford University, 2019. B.Sc Mathematics, University of California, 2017.
+Projects
+Developed a demand forecasting system using scikit-learn and NumPy that reduced stockouts by 12 percent.
+Created an Excel and Power BI toolkit adopted by 40 store managers.
+Skills
+Python, R, SQL, Excel, Tableau, Power BI, Statistics, Machine Learning
+Critical thinking, attention to detail, time management, communication
+Certifications
+Google Analytics certificate. Recognition award for analytics excellence 2022.""",
+    """Mike Johnson
+mike.johnson@email.com | +91 9876543210
+Objective
+DevOps engineer seeking a senior role in cloud infrastructure.
+Work Experience
+DevOps Engineer, CloudWorks LLC, 2018 - 2023 (5 years). Managed Kubernetes clusters on AWS and Azure, wrote Terraform modules and Jenkins CI/CD pipelines.
+System Administrator, NetServe Limited, 2016 - 2018. Automated Linux server provisioning with Ansible.
+Education
+Bachelor of Engineering, Information Technology, Pune University, 2016.
+Projects
+Implemented blue-green deployments for a microservices platform serving 2 million users.
+Designed a centralized logging system with Elasticsearch and Kibana.
+Skills
+Docker, Kubernetes, Terraform, AWS, Azure, GCP, Jenkins, Ansible, Python, Go, Linux, Git
+Leadership, adaptability, teamwork
+Awards
+Employee of the year award 2021. AWS Certified Solutions Architect certificate.""",
+    """Sarah Wilson
+sarah.wilson@email.com
+Profile
+Product designer focused on user research, wireframing and prototyping for mobile apps.
+Experience
+UX Designer, Bright Apps Company, Jul 2020 - present. Led user research for three product launches and created prototypes in Figma and Sketch.
+Design Intern, Studio Nine, Jan 2020 - Jun 2020. Produced wireframes and usability reports.
+Education
+BBA, Design Management, National Institute of Design, 2020.
+Projects
+Redesigned the onboarding flow of a banking app, improving activation by 18 percent.
+Built a design system with HTML, CSS and JavaScript components.
+Skills
+Figma, Sketch, Adobe Creative Suite, HTML, CSS, JavaScript, User Research, Wireframing, Prototyping
+Creativity, communication, project management, stakeholder management
+Honors
+Red Dot design award honor 2022."""
+]
+
+
+def long_resume(repeats: int = 12) -> str:
+    """A long multi-page resume built by repeating the samples"""
+    return '\n'.join(SAMPLE_RESUMES * repeats)
+
+
+def _pdf_string(line: str) -> str:
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(text: str, lines_per_page: int = 45) -> bytes:
+    """Build a minimal text PDF (Helvetica, one text object per page)"""
+    lines = [line[:95] for line in text.splitlines()]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [{}] /Count {} >>'.format(
+            ' '.join(f'{4 + 2 * index} 0 R' for index in range(len(pages))), len(pages)
+        ),
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+    ]
+    for index, page_lines in enumerate(pages):
+        content = 'BT /F1 10 Tf 14 TL 40 800 Td ' + ' '.join(
+            f'({_pdf_string(line)}) Tj T*' for line in page_lines
+        ) + ' ET'
+        objects.append(
+            '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * index} 0 R >>'
+        )
+        objects.append(f'<< /Length {len(content)} >>\nstream\n{content}\nendstream')
+
+    output = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1', errors='replace')
+
+    xref_offset = len(output)
+    output += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    output += b''.join(f'{offset:010d} 00000 n \n'.encode() for offset in offsets)
+    output += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n'.encode()
+    return output
+
+
+def make_docx(text: str) -> bytes:
+    """Build a minimal DOCX package with one paragraph per line"""
+    import io
+
+    paragraphs = ''.join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+        for line in text.splitlines()
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{paragraphs}</w:body></w:document>'
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'
+    )
+    relationships = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/></Relationships>'
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', content_types)
+        archive.writestr('_rels/.rels', relationships)
+        archive.writestr('word/document.xml', document)
+    return buffer.getvalue()
+
+
+def fixture_texts() -> List[str]:
+    """The text fixtures: each sample resume plus one long resume"""
+    return SAMPLE_RESUMES + [long_resume()]
+
+
+def write_fixtures(directory: str = FIXTURES_DIR) -> List[str]:
+    """Write the corpus as .txt, .pdf and .docx files; returns the written paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, text in enumerate(fixture_texts()):
+        for extension, data in (
+            ('txt', text.encode('utf-8')),
+            ('pdf', make_pdf(text)),
+            ('docx', make_docx(text))
+        ):
+            path = os.path.join(directory, f'resume_{index + 1:02d}.{extension}')
+            with open(path, 'wb') as file:
+                file.write(data)
+            paths.append(path)
+    return paths
+
+
+if __name__ == '__main__':
+    for written in write_fixtures():
+        print(written)
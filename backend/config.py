@@ -12,6 +12,8 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-secret-key-here'
     MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # 10MB max file size
     UPLOAD_FOLDER = 'uploads'
+    # Uploads up to this size are analyzed in memory; larger ones are spilled to UPLOAD_FOLDER
+    UPLOAD_SPOOL_THRESHOLD = int(os.environ.get('UPLOAD_SPOOL_THRESHOLD', 2 * 1024 * 1024))
     ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
     
     # API Keys
@@ -23,8 +25,30 @@ class Config:
     LINKEDIN_EMAIL = os.environ.get('LINKEDIN_EMAIL')
     LINKEDIN_PASSWORD = os.environ.get('LINKEDIN_PASSWORD')
     
-    # Database (if needed for future enhancements)
+    # HR dashboard login; the applicant list, search, stats and ranking endpoints need
+    # its token. Disabled until HR_PASSWORD (and a real SECRET_KEY) is set
+    HR_PASSWORD = os.environ.get('HR_PASSWORD')
+    HR_TOKEN_TTL = int(os.environ.get('HR_TOKEN_TTL', 8 * 3600))
+    
+    # Database for applications and their analyses (sqlite:///path.db)
     DATABASE_URL = os.environ.get('DATABASE_URL') or 'sqlite:///resume_scanner.db'
+    APPLICATIONS_PAGE_SIZE = int(os.environ.get('APPLICATIONS_PAGE_SIZE', 20))
+    APPLICATIONS_MAX_PAGE_SIZE = int(os.environ.get('APPLICATIONS_MAX_PAGE_SIZE', 100))
+    APPLICATIONS_COUNT_LIMIT = int(os.environ.get('APPLICATIONS_COUNT_LIMIT', 1000))
+    # Full-text index of analyzed resume text (SQLite FTS5)
+    RESUME_INDEX_PATH = os.environ.get('RESUME_INDEX_PATH') or 'resume_index.db'
+    RESUME_SEARCH_MAX_RESULTS = int(os.environ.get('RESUME_SEARCH_MAX_RESULTS', 100))
+    # Near-duplicate resume detection (MinHash/LSH); more rows per band favour
+    # precision, more bands favour recall
+    DUPLICATE_DETECTION = os.environ.get('DUPLICATE_DETECTION', 'true').lower() in ('1', 'true', 'yes')
+    DUPLICATE_INDEX_PATH = os.environ.get('DUPLICATE_INDEX_PATH') or 'duplicates.db'
+    MINHASH_BANDS = int(os.environ.get('MINHASH_BANDS', 16))
+    MINHASH_ROWS = int(os.environ.get('MINHASH_ROWS', 8))
+    DUPLICATE_THRESHOLD = float(os.environ.get('DUPLICATE_THRESHOLD', 0.8))
+    # Resumes with fewer distinct 5-word shingles than this are too short to compare
+    DUPLICATE_MIN_SHINGLES = int(os.environ.get('DUPLICATE_MIN_SHINGLES', 50))
+    # Reuse the earlier resume analysis for a near-duplicate instead of re-analyzing
+    DUPLICATE_SHORT_CIRCUIT = os.environ.get('DUPLICATE_SHORT_CIRCUIT', 'false').lower() in ('1', 'true', 'yes')
     
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL') or 'INFO'
@@ -34,8 +58,85 @@ class Config:
     MAX_JOB_RECOMMENDATIONS = 5
     MIN_JOB_MATCH_PERCENTAGE = 30
     
+    # Skill taxonomy (JSON, YAML or CSV); compiled to a memory-mapped index on first load
+    SKILL_TAXONOMY_PATH = os.environ.get('SKILL_TAXONOMY_PATH') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'data', 'skills_taxonomy.json'
+    )
+    SKILL_INDEX_PATH = os.environ.get('SKILL_INDEX_PATH')
+    # Fitted TF-IDF vectorizer for the semantic job match (refit when the job catalog changes)
+    SEMANTIC_MODEL_PATH = os.environ.get('SEMANTIC_MODEL_PATH') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'data', 'job_tfidf.pkl'
+    )
+    # Load NLTK data and the spaCy pipeline in the gunicorn master before forking
+    # workers (see gunicorn.conf.py); otherwise each process loads them on first use
+    PRELOAD_MODELS = os.environ.get('PRELOAD_MODELS', 'true').lower() in ('1', 'true', 'yes')
+    # spaCy nlp.pipe settings for batched key-phrase extraction
+    KEY_PHRASE_BATCH_SIZE = int(os.environ.get('KEY_PHRASE_BATCH_SIZE', 64))
+    KEY_PHRASE_PROCESSES = int(os.environ.get('KEY_PHRASE_PROCESSES', 1))
+    
     # File Processing
     MAX_RESUME_PAGES = 5
+    MAX_RESUME_CHARS = int(os.environ.get('MAX_RESUME_CHARS', 100000))
+    EXTRACTION_TIME_BUDGET = float(os.environ.get('EXTRACTION_TIME_BUDGET', 10))
+    # Measured backend throughput (written by benchmarks/bench_extraction.py) sets the default order
+    EXTRACTION_BENCHMARK_PATH = os.environ.get('EXTRACTION_BENCHMARK_PATH') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'extraction_results.json'
+    )
+    
+    # Batch analysis (process pool; defaults to one worker per CPU)
+    BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS', 0)) or None
+    BATCH_MAX_FILES = int(os.environ.get('BATCH_MAX_FILES', 5000))
+    
+    # Per-request stage fan-out (seconds per stage)
+    ANALYSIS_STAGE_WORKERS = int(os.environ.get('ANALYSIS_STAGE_WORKERS', 16))
+    RESUME_STAGE_TIMEOUT = float(os.environ.get('RESUME_STAGE_TIMEOUT', 60))
+    GITHUB_STAGE_TIMEOUT = float(os.environ.get('GITHUB_STAGE_TIMEOUT', 10))
+    LINKEDIN_STAGE_TIMEOUT = float(os.environ.get('LINKEDIN_STAGE_TIMEOUT', 5))
+    
+    # Analysis cache ('memory', 'sqlite' or 'none')
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND') or 'memory'
+    CACHE_PATH = os.environ.get('CACHE_PATH') or 'analysis_cache.db'
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1000))
+    CACHE_TTL = int(os.environ.get('CACHE_TTL', 7 * 24 * 3600))
+    
+    # GitHub API client
+    GITHUB_API_URL = os.environ.get('GITHUB_API_URL') or 'https://api.github.com'
+    GITHUB_TIMEOUT = float(os.environ.get('GITHUB_TIMEOUT', 10))
+    GITHUB_POOL_SIZE = int(os.environ.get('GITHUB_POOL_SIZE', 10))
+    GITHUB_CACHE_SIZE = int(os.environ.get('GITHUB_CACHE_SIZE', 1024))
+    GITHUB_MAX_RATE_WAIT = float(os.environ.get('GITHUB_MAX_RATE_WAIT', 5))
+    
+    # LLM resume analysis ('gemini', 'stub' for load tests without the network, or 'none')
+    LLM_BACKEND = os.environ.get('LLM_BACKEND') or 'gemini'
+    GEMINI_MODEL = os.environ.get('GEMINI_MODEL') or 'gemini-pro'
+    LLM_TIMEOUT = float(os.environ.get('LLM_TIMEOUT', 30))
+    LLM_MAX_RETRIES = int(os.environ.get('LLM_MAX_RETRIES', 3))
+    LLM_RETRY_BACKOFF = float(os.environ.get('LLM_RETRY_BACKOFF', 1))
+    LLM_MAX_CONCURRENCY = int(os.environ.get('LLM_MAX_CONCURRENCY', 4))
+    # Response cache keyed by the normalized prompt ('memory', 'sqlite' or 'none')
+    LLM_CACHE_BACKEND = os.environ.get('LLM_CACHE_BACKEND') or 'memory'
+    LLM_CACHE_PATH = os.environ.get('LLM_CACHE_PATH') or 'llm_cache.db'
+    LLM_STUB_LATENCY = float(os.environ.get('LLM_STUB_LATENCY', 0.5))
+    # 'llm' (every resume, the default), 'tiered' (opt-in: local analysis first; only
+    # low-confidence or borderline resumes go to the LLM) or 'local' (never call the LLM)
+    ANALYSIS_MODE = os.environ.get('ANALYSIS_MODE') or 'llm'
+    # Local analyses below this confidence (0-1), or scoring within this many points
+    # of a grade boundary, are escalated to the LLM
+    TIER_MIN_CONFIDENCE = float(os.environ.get('TIER_MIN_CONFIDENCE', 0.7))
+    TIER_BORDERLINE_MARGIN = float(os.environ.get('TIER_BORDERLINE_MARGIN', 3))
+    # Compact resume text in LLM prompts (dedupe lines, drop boilerplate sections) to this
+    # many tokens (0 for no limit)
+    PROMPT_COMPACTION = os.environ.get('PROMPT_COMPACTION', 'true').lower() in ('1', 'true', 'yes')
+    LLM_RESUME_TOKEN_BUDGET = int(os.environ.get('LLM_RESUME_TOKEN_BUDGET', 2000))
+    
+    # Asynchronous analysis jobs ('sqlite', shared by every worker process on the host, or
+    # 'memory', which only works with a single process)
+    JOB_QUEUE_BACKEND = os.environ.get('JOB_QUEUE_BACKEND') or 'sqlite'
+    JOB_QUEUE_PATH = os.environ.get('JOB_QUEUE_PATH') or 'analysis_jobs.db'
+    # Jobs still running this long after being claimed are assumed lost and requeued
+    JOB_LEASE_SECONDS = float(os.environ.get('JOB_LEASE_SECONDS', 900))
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 4))
+    JOB_RESULT_TTL = int(os.environ.get('JOB_RESULT_TTL', 3600))
     SUPPORTED_LANGUAGES = [
         'English', 'Spanish', 'French', 'German', 'Italian', 
         'Portuguese', 'Dutch', 'Russian', 'Chinese', 'Japanese'
@@ -0,0 +1,34 @@
+# Gunicorn settings for serving the API with prefork workers
+#
+#   gunicorn -c backend/gunicorn.conf.py backend.app:app
+#
+# With PRELOAD_MODELS (the default) the master loads the NLP models before
+# forking, so every worker shares them copy-on-write instead of loading its
+# own copy. The app itself (database connections, thread pools) is still
+# imported in each worker.
+import gc
+import os
+
+bind = os.environ.get('GUNICORN_BIND') or '0.0.0.0:5000'
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+# Resume analysis can wait on the Gemini and GitHub APIs
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+
+
+def on_starting(server):
+    """Check the settings, then preload the NLP models before any worker is forked"""
+    from backend.config import Config
+    from backend.utils.text_processor import preload_models
+
+    # An in-memory job queue is private to the worker a job was submitted to,
+    # so polling it through any other worker would answer 404
+    if Config.JOB_QUEUE_BACKEND == 'memory' and server.cfg.workers > 1:
+        raise RuntimeError("JOB_QUEUE_BACKEND=memory needs a single worker; use 'sqlite' with several")
+
+    if Config.PRELOAD_MODELS:
+        preload_models()
+        # Keep the preloaded objects out of garbage collection, whose
+        # bookkeeping writes would otherwise copy their pages into each worker
+        gc.freeze()
+        server.log.info("Preloaded NLP models for the workers")
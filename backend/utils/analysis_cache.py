@@ -0,0 +1,212 @@
+# Content-addressed caching for resume extraction and analysis
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from backend.utils.metrics import metrics
+
+
+def content_hash(data) -> str:
+    """SHA-256 hex digest of bytes or text"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+class CacheBackend:
+    """Interface for cache storage; values must be JSON-serializable"""
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryLRUCache(CacheBackend):
+    """Per-process LRU cache with a TTL and a maximum number of entries"""
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 86400):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                metrics.increment('cache.evictions')
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """On-disk cache shared by all workers on a host, evicting least recently used entries
+
+    The number of entries is kept in a one-row table maintained by
+    triggers, so inserts check the size limit without counting the table.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: float = 86400):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (accessed_at)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_size ("
+                "id INTEGER PRIMARY KEY CHECK (id = 1), entries INTEGER NOT NULL)"
+            )
+            # Counted once, for caches created before the size table existed
+            conn.execute("INSERT OR IGNORE INTO cache_size (id, entries) SELECT 1, COUNT(*) FROM cache")
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS cache_size_insert AFTER INSERT ON cache "
+                "BEGIN UPDATE cache_size SET entries = entries + 1 WHERE id = 1; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS cache_size_delete AFTER DELETE ON cache "
+                "BEGIN UPDATE cache_size SET entries = entries - 1 WHERE id = 1; END"
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] < now:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return None
+        conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        conn = self._connect()
+        now = time.time()
+        # An upsert rather than INSERT OR REPLACE, whose implicit delete would not fire the size trigger
+        conn.execute(
+            "INSERT INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+            "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+            (key, json.dumps(value), now + self.ttl, now)
+        )
+        overflow = len(self) - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+            metrics.increment('cache.evictions', overflow)
+
+    def clear(self):
+        self._connect().execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT entries FROM cache_size WHERE id = 1").fetchone()[0]
+
+
+def create_cache_backend(backend: str, path: str, max_entries: int, ttl: float) -> Optional[CacheBackend]:
+    """Build a cache backend from its configured name; 'none' disables caching"""
+    if backend == 'none':
+        return None
+    if backend == 'memory':
+        return MemoryLRUCache(max_entries, ttl)
+    if backend == 'sqlite':
+        return SQLiteCache(path, max_entries, ttl)
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+
+class AnalysisCache:
+    """Namespaced, versioned cache in front of expensive analysis steps
+
+    Keys combine a namespace ('text', 'analysis', ...), a content hash and
+    the version string, so bumping the analyzer or taxonomy version
+    invalidates old entries without flushing the store. Nothing is stored
+    when compute raises, or when cacheable(result) is false (fallback
+    results that a retry may improve on).
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], version: str):
+        self.backend = backend
+        self.version = version
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        digest: str,
+        compute: Callable[[], Any],
+        cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        if self.backend is None:
+            return compute()
+
+        key = f"{namespace}:{self.version}:{digest}"
+        value = self.backend.get(key)
+        if value is not None:
+            metrics.increment(f'cache.{namespace}.hits')
+            return value
+
+        metrics.increment(f'cache.{namespace}.misses')
+        value = compute()
+        if cacheable is not None and not cacheable(value):
+            metrics.increment(f'cache.{namespace}.uncacheable')
+            return value
+        self.backend.set(key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        counters = metrics.snapshot()
+        return {
+            'entries': len(self.backend) if self.backend is not None else 0,
+            'counters': {name: value for name, value in counters.items() if name.startswith('cache.')}
+        }
@@ -0,0 +1,113 @@
+# Process-pool fan-out for batch resume analysis
+import logging
+import os
+import shutil
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+from werkzeug.utils import secure_filename
+
+logger = logging.getLogger(__name__)
+
+# Analyzer owned by each pool worker process, built once by the initializer
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_factory: Callable):
+    """Build the per-process analyzer when a pool worker starts"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer_factory()
+
+
+def _analyze_file(file_path: str, user_data: Dict) -> Dict:
+    """Extract and score one resume inside a pool worker"""
+    resume_text = _worker_analyzer.extract_text_from_resume(file_path)
+    return _worker_analyzer._analyze_with_fallback(resume_text, user_data)
+
+
+def collect_batch_files(
+    uploads: Iterable,
+    dest_dir: str,
+    allowed_extensions: Iterable[str],
+    max_files: int,
+    max_file_size: int
+) -> List[Tuple[str, str]]:
+    """Save uploaded resumes (and members of uploaded zip archives) into dest_dir
+
+    Returns (original_name, saved_path) pairs; unsupported files are skipped.
+    """
+    allowed_extensions = set(allowed_extensions)
+    files = []
+
+    def reserve_path(name: str) -> str:
+        return os.path.join(dest_dir, f"{len(files):05d}_{secure_filename(name) or 'resume'}")
+
+    def extension_of(name: str) -> str:
+        return name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+
+    for upload in uploads:
+        if len(files) >= max_files:
+            break
+        name = upload.filename or ''
+        extension = extension_of(name)
+
+        if extension == 'zip':
+            with zipfile.ZipFile(upload.stream) as archive:
+                for member in archive.infolist():
+                    if len(files) >= max_files:
+                        break
+                    member_name = os.path.basename(member.filename)
+                    if member.is_dir() or extension_of(member_name) not in allowed_extensions:
+                        continue
+                    if member.file_size > max_file_size:
+                        logger.warning(f"Skipping oversized batch file: {member_name}")
+                        continue
+                    path = reserve_path(member_name)
+                    with archive.open(member) as source, open(path, 'wb') as target:
+                        shutil.copyfileobj(source, target)
+                    files.append((member_name, path))
+        elif extension in allowed_extensions:
+            path = reserve_path(name)
+            upload.save(path)
+            files.append((name, path))
+        else:
+            logger.warning(f"Skipping unsupported batch file: {name}")
+
+    return files
+
+
+class BatchProcessor:
+    """Runs text extraction and fallback scoring for many resumes on a process pool"""
+
+    def __init__(self, analyzer_factory: Callable, max_workers: int = None):
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(analyzer_factory,)
+        )
+
+    def iter_results(self, files: Iterable[Tuple[str, str]], user_data: Dict) -> Iterator[Dict]:
+        """Yield one result per (name, path) pair, in completion order"""
+        futures = {
+            self.executor.submit(_analyze_file, path, user_data): name
+            for name, path in files
+        }
+
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                yield {
+                    'filename': name,
+                    'success': True,
+                    'resume_analysis': future.result()
+                }
+            except Exception as e:
+                logger.error(f"Batch analysis failed for {name}: {str(e)}")
+                yield {
+                    'filename': name,
+                    'success': False,
+                    'message': f'Analysis failed: {str(e)}'
+                }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
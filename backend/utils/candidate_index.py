@@ -0,0 +1,273 @@
+# Candidate pool index for ranking applicants against a job role
+import threading
+from array import array
+from typing import Dict, List, Optional, Set
+import numpy as np
+from scipy import sparse
+from backend.utils.job_matcher import (
+    MATCH_WEIGHTS, JobMatcher, JobRole, combine_match_scores, experience_range, experience_scores
+)
+
+# Degree keywords, checked in order, mapped onto JobMatcher education levels
+DEGREE_LEVELS = [
+    (('phd', 'ph.d', 'doctor'), 'phd'),
+    (('master', 'm.tech', 'mtech', 'm.sc', 'msc', 'mba', 'm.s.', 'm.e.'), 'master'),
+    (('bachelor', 'b.tech', 'btech', 'b.sc', 'bsc', 'b.e', 'bba', 'b.a', 'b.s.'), 'bachelor'),
+    (('associate', 'diploma'), 'associate'),
+    (('high school', 'secondary'), 'high school')
+]
+
+
+def _skill_names(skills: List) -> List[str]:
+    """Skill names from an analysis list; AI analyses may give {'skill': ..., 'proficiency': ...} entries"""
+    names = []
+    for skill in skills or []:
+        if isinstance(skill, dict):
+            skill = skill.get('skill') or skill.get('name')
+        if isinstance(skill, str) and skill:
+            names.append(skill)
+    return names
+
+
+def education_level(degree: str) -> str:
+    """JobMatcher education level for a free-text degree (defaults to bachelor)"""
+    degree = (degree or '').lower()
+    for keywords, level in DEGREE_LEVELS:
+        if any(keyword in degree for keyword in keywords):
+            return level
+    return 'bachelor'
+
+
+def candidate_profile(analysis: Dict, resume_text: Optional[str] = None) -> Dict:
+    """JobMatcher candidate profile from a run_profile_analysis result
+
+    Passing the extracted resume_text adds the semantic match component.
+    """
+    resume = analysis.get('resume_analysis') or {}
+    skills = resume.get('skills_analysis') or {}
+    experience = resume.get('experience_analysis') or {}
+    github = analysis.get('github_analysis') or {}
+
+    try:
+        experience_years = float(experience.get('total_years') or 0)
+    except (TypeError, ValueError):
+        experience_years = 0
+
+    profile = {
+        'technical_skills': _skill_names(skills.get('technical_skills')),
+        'soft_skills': _skill_names(skills.get('soft_skills')),
+        'experience_years': experience_years,
+        'education_level': education_level((resume.get('education_details') or {}).get('degree', '')),
+        'github_projects': github.get('public_repos', 0) or 0
+    }
+    if resume_text:
+        profile['resume_text'] = resume_text
+    return profile
+
+
+class CandidateIndex:
+    """Analyzed candidates as compact arrays, for ranking the pool against one job
+
+    Each skill keeps a posting list (array('I') of candidate rows), and the
+    job-independent parts of calculate_job_match (experience, education,
+    portfolio and soft skills) are stored as float arrays. Ranking a job only
+    touches the posting lists of its own skills. Profiles with resume_text
+    keep its TF-IDF row (over the job catalog's vocabulary), so the semantic
+    component is one sparse matrix-vector product per ranking. Re-adding a
+    candidate id overwrites its row in place, and rows of removed candidates
+    are reused by the next new ones, so the arrays only grow with the number
+    of candidates indexed at once.
+    """
+
+    def __init__(self, job_matcher: JobMatcher, capacity: int = 1024):
+        self.job_matcher = job_matcher
+        self._ids: List[str] = []
+        self._info: List[Dict] = []
+        self._skills: List[Set[str]] = []
+        self._versions: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._postings: Dict[str, array] = {}
+        self._years = np.zeros(capacity)
+        self._education = np.zeros(capacity)
+        self._portfolio = np.zeros(capacity)
+        self._soft_skills = np.zeros(capacity)
+        self._active = np.zeros(capacity, dtype=bool)
+        self._has_text = np.zeros(capacity, dtype=bool)
+        # TF-IDF row per candidate row (None without resume text), stacked lazily for ranking
+        self._text_vectors: List[Optional[sparse.csr_matrix]] = []
+        self._text_matrix: Optional[sparse.csr_matrix] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._rows
+
+    def _grow(self):
+        size = len(self._active) * 2
+        for name in ('_years', '_education', '_portfolio', '_soft_skills', '_active', '_has_text'):
+            values = getattr(self, name)
+            grown = np.zeros(size, dtype=values.dtype)
+            grown[:len(values)] = values
+            setattr(self, name, grown)
+
+    def is_current(self, candidate_id: str, version: Optional[str]) -> bool:
+        """Whether a candidate is indexed with this version of its analysis"""
+        with self._lock:
+            row = self._rows.get(candidate_id)
+            return version is not None and row is not None and self._versions[row] == version
+
+    def add(self, candidate_id: str, candidate_profile: Dict, info: Optional[Dict] = None,
+            version: Optional[str] = None) -> bool:
+        """Index (or re-index) a candidate's JobMatcher profile; info is returned with rankings
+
+        A version (such as the analysis timestamp) makes re-adding an
+        unchanged analysis a no-op. Returns whether the index changed.
+        """
+        if self.is_current(candidate_id, version):
+            return False
+        skills, years, education, portfolio, soft_skills = self.job_matcher.candidate_features(candidate_profile)
+        text_vector = None
+        if candidate_profile.get('resume_text'):
+            text_vector = self.job_matcher.semantic.resume_vectors([candidate_profile['resume_text']])
+
+        with self._lock:
+            row = self._rows.get(candidate_id)
+            if row is None and self._free:
+                row = self._free.pop()
+            if row is not None:
+                self._clear_row(row)
+            else:
+                row = len(self._ids)
+                if row == len(self._active):
+                    self._grow()
+                self._ids.append(candidate_id)
+                self._info.append({})
+                self._skills.append(set())
+                self._versions.append(None)
+                self._text_vectors.append(None)
+
+            self._ids[row] = candidate_id
+            self._info[row] = info or {}
+            self._skills[row] = skills
+            self._versions[row] = version
+            self._years[row] = years
+            self._education[row] = education
+            self._portfolio[row] = portfolio
+            self._soft_skills[row] = soft_skills
+            self._active[row] = True
+            self._has_text[row] = text_vector is not None
+            self._text_vectors[row] = text_vector
+            self._rows[candidate_id] = row
+
+            for skill in skills:
+                self._postings.setdefault(skill, array('I')).append(row)
+        return True
+
+    def remove(self, candidate_id: str) -> bool:
+        """Drop a candidate from future rankings; its row is reused by the next add"""
+        with self._lock:
+            row = self._rows.pop(candidate_id, None)
+            if row is None:
+                return False
+            self._clear_row(row)
+            self._free.append(row)
+            return True
+
+    def _clear_row(self, row: int):
+        """Take a row out of the posting lists and rankings (hold the lock)"""
+        for skill in self._skills[row]:
+            posting = self._postings[skill]
+            posting.remove(row)
+            if not posting:
+                del self._postings[skill]
+        self._skills[row] = set()
+        self._info[row] = {}
+        self._versions[row] = None
+        self._active[row] = False
+        self._has_text[row] = False
+        self._text_vectors[row] = None
+        if self._text_matrix is not None and row < self._text_matrix.shape[0]:
+            # The stacked TF-IDF rows are rebuilt at the next ranking
+            self._text_matrix = None
+
+    def _postings_for(self, skill: str) -> np.ndarray:
+        """Rows of the candidates with a skill (a view of the posting list; hold the lock)"""
+        posting = self._postings.get(skill)
+        if not posting:
+            return np.empty(0, dtype=np.uint32)
+        return np.frombuffer(posting, dtype=np.uint32)
+
+    def _semantic_scores(self, job_role: JobRole, size: int) -> Optional[np.ndarray]:
+        """Semantic component per row, NaN for rows without resume text; None if no row has any (hold the lock)"""
+        if not self._has_text[:size].any():
+            return None
+        semantic = self.job_matcher.semantic
+        stacked = 0 if self._text_matrix is None else self._text_matrix.shape[0]
+        if stacked < size:
+            # Rows reused in place drop the matrix, so only appended rows are stacked here
+            empty = sparse.csr_matrix((1, len(semantic.vectorizer.vocabulary_)))
+            new_rows = [vector if vector is not None else empty for vector in self._text_vectors[stacked:size]]
+            self._text_matrix = sparse.vstack(
+                ([self._text_matrix] if self._text_matrix is not None else []) + new_rows, format='csr'
+            )
+        scores = semantic.job_scores(self._text_matrix[:size], job_role)
+        return np.where(self._has_text[:size], scores, np.nan)
+
+    def score_candidates(self, job_role: JobRole) -> Dict[str, np.ndarray]:
+        """calculate_job_match component and overall scores for every indexed row"""
+        taxonomy = self.job_matcher.taxonomy
+        required_skills = set(taxonomy.canonical_id(skill) for skill in job_role.required_skills)
+        preferred_skills = set(taxonomy.canonical_id(skill) for skill in job_role.preferred_skills)
+
+        with self._lock:
+            size = len(self._ids)
+            weighted = np.zeros(size)
+            matched = np.zeros(size)
+            for skill in required_skills:
+                weighted[self._postings_for(skill)] += taxonomy.weight(skill)
+            for skill in preferred_skills:
+                matched[self._postings_for(skill)] += 1
+
+            weighted_required = weighted / len(required_skills) if required_skills else np.zeros(size)
+            preferred_score = matched / len(preferred_skills) if preferred_skills else np.zeros(size)
+            technical = np.minimum(1.0, (weighted_required * 0.7) + (preferred_score * 0.3))
+
+            low, high = experience_range(job_role.experience_level)
+            return combine_match_scores(
+                technical,
+                experience_scores(self._years[:size], low, high),
+                self._education[:size].copy(),
+                self._portfolio[:size].copy(),
+                self._soft_skills[:size].copy(),
+                self._semantic_scores(job_role, size)
+            )
+
+    def rank_candidates(self, job_role: JobRole, k: int = 10) -> List[Dict]:
+        """The k best-matching candidates for a job role, highest overall score first"""
+        scores = self.score_candidates(job_role)
+        with self._lock:
+            overall = np.where(self._active[:len(scores['overall'])], scores['overall'], -np.inf)
+            ids, info = list(self._ids), list(self._info)
+
+        k = min(k, int(np.count_nonzero(overall > -np.inf)))
+        if k <= 0:
+            return []
+        rows = np.argpartition(-overall, k - 1)[:k] if k < len(overall) else np.arange(len(overall))
+        rows = rows[np.lexsort((rows, -overall[rows]))][:k]
+
+        return [
+            {
+                **info[row],
+                'candidate_id': ids[row],
+                'match_percentage': int(scores['overall'][row] * 100),
+                'match_breakdown': {
+                    category: int(scores[category][row] * 100)
+                    for category in list(MATCH_WEIGHTS) + ['semantic']
+                    if category in scores and not np.isnan(scores[category][row])
+                }
+            }
+            for row in rows
+        ]
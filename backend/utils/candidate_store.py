@@ -0,0 +1,598 @@
+# Server-side store of job applications and their analysis results
+import base64
+import json
+import math
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+STATUS_PENDING = 'pending'
+STATUS_ANALYZED = 'analyzed'
+STATUS_SHORTLISTED = 'shortlisted'
+STATUS_REJECTED = 'rejected'
+APPLICATION_STATUSES = (STATUS_PENDING, STATUS_ANALYZED, STATUS_SHORTLISTED, STATUS_REJECTED)
+
+# API field -> column for the applicant details taken from the application form
+APPLICATION_FIELDS = {
+    'fullName': 'full_name',
+    'email': 'email',
+    'phone': 'phone',
+    'college': 'college',
+    'cgpa': 'cgpa',
+    'dob': 'dob',
+    'jobRole': 'job_role',
+    'github': 'github',
+    'linkedin': 'linkedin'
+}
+
+# Sort keys accepted by list_applications, mapped to indexed expressions
+# (NULL scores and CGPAs sort as -1 so keyset cursors can compare them)
+SORT_COLUMNS = {
+    'submissionDate': 'submitted_at',
+    'score': 'COALESCE(score, -1)',
+    'fullName': 'full_name',
+    'cgpa': 'COALESCE(cgpa, -1)'
+}
+
+# Lowest score for each grade, best first; matches get_grade_and_recommendation
+GRADE_THRESHOLDS = [('A+', 90), ('A', 80), ('B+', 70), ('B', 60), ('C', 50), ('D', None)]
+
+
+def grade_for_score(score: Optional[float]) -> Optional[str]:
+    if score is None:
+        return None
+    for grade, threshold in GRADE_THRESHOLDS:
+        if threshold is None or score >= threshold:
+            return grade
+
+
+def _score_ranges(expression: str, band: List[Tuple]) -> str:
+    """SQL for expression falling in any (low, high or None, high inclusive) range"""
+    return '(' + (' OR '.join(
+        f"({expression} >= ?" + ('' if high is None else f" AND {expression} {'<=' if inclusive else '<'} ?") + ')'
+        for _, high, inclusive in band
+    ) or '0') + ')'
+
+
+# Filters matching at least this many rows are too broad to drive a page query
+SELECTIVE_MATCHES = 5000
+
+# Filter columns whose indexes end in submitted_at, serving date-sorted pages directly
+INDEXED_BY_DATE = ('status', 'job_role', 'candidate_type', 'submitted_at')
+
+
+@dataclass
+class Condition:
+    """One filter as SQL over the applications table
+
+    sql may be answered from the filter's index; scan_sql is the same test
+    written so SQLite evaluates it per row (e.g. +column); probe selects the
+    matching rows, to estimate selectivity.
+    """
+    sql: str
+    scan_sql: str
+    values: List
+    probe: Optional[str] = None
+    column: Optional[str] = None
+
+
+def updated_at() -> str:
+    """Row update time, to the microsecond so (updated_at, id) orders changes made within one second"""
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+def parse_score(value) -> Optional[float]:
+    """A score from API input (a number, numeric string or None); ValueError otherwise"""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, bool):
+            raise TypeError
+        score = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid score: {value!r}")
+    if not math.isfinite(score):
+        raise ValueError(f"Invalid score: {value!r}")
+    return score
+
+
+def format_application_id(row_id: int) -> str:
+    return f"APP{row_id:06d}"
+
+
+def parse_application_id(application_id: str) -> Optional[int]:
+    """Row id from an 'APP000123' id; None when malformed"""
+    digits = application_id[3:] if application_id.upper().startswith('APP') else application_id
+    return int(digits) if digits.isdigit() else None
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    """Opaque keyset cursor for the row after which the next page starts"""
+    return base64.urlsafe_b64encode(json.dumps([sort_value, row_id]).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple:
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return sort_value, int(row_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+class CandidateRepository:
+    """Interface for application stores"""
+
+    def add_application(self, application: Dict) -> Dict:
+        """Store a new application (API field names) and return it with its id"""
+        raise NotImplementedError
+
+    def add_applications(self, applications: Iterable[Dict]) -> int:
+        """Bulk-store applications in one transaction; returns how many were added"""
+        raise NotImplementedError
+
+    def get_application(self, application_id: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def get_analysis(self, application_id: str) -> Optional[Dict]:
+        """The stored analysis of an application, if it has been analyzed"""
+        raise NotImplementedError
+
+    def update_application(self, application_id: str, changes: Dict) -> Optional[Dict]:
+        """Update status and/or score; None if the application does not exist"""
+        raise NotImplementedError
+
+    def record_analysis(self, user_data: Dict, analysis: Dict, skills: Optional[List[str]] = None) -> Dict:
+        """Attach an analysis (and its canonical skill ids) to the applicant's latest application
+
+        Creates the application when the applicant has none.
+        """
+        raise NotImplementedError
+
+    def list_applications(
+        self,
+        filters: Optional[Dict] = None,
+        sort: str = 'submissionDate',
+        descending: bool = True,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """One page of applications and the cursor of the next page (None on the last page)
+
+        filters may hold status, jobRole, candidateType and grade (each a
+        value or a list of values), minScore, maxScore, submittedFrom,
+        submittedTo, skills (canonical ids, all required) and q (text search
+        over name, email, college, role and skills).
+        """
+        raise NotImplementedError
+
+    def count_applications(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> int:
+        """Number of matching applications, counting no further than limit"""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Application counts by job role and by status"""
+        raise NotImplementedError
+
+    def iter_analyses(self, after: Optional[Tuple[str, str]] = None) -> Iterator[Tuple[Dict, Dict]]:
+        """(application, stored analysis) pairs, least recently updated first
+
+        Only analyzed applications are included. after is the (updatedAt, id)
+        of the last application already read; only later ones are returned.
+        """
+        raise NotImplementedError
+
+
+class SQLiteCandidateRepository(CandidateRepository):
+    """Applications in a SQLite file, indexed for the dashboard's list queries
+
+    Every sort key has an index ending in the row id, so keyset pages are
+    index range scans. Skills live in a (skill, application) table and text
+    search uses an FTS5 table, falling back to LIKE when SQLite lacks FTS5.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS applications ("
+            "id INTEGER PRIMARY KEY, full_name TEXT NOT NULL, email TEXT NOT NULL, phone TEXT, "
+            "college TEXT, cgpa REAL, dob TEXT, job_role TEXT, github TEXT, linkedin TEXT, "
+            "status TEXT NOT NULL, score REAL, candidate_type TEXT, skills TEXT, analysis TEXT, "
+            "submitted_at TEXT NOT NULL, updated_at TEXT NOT NULL)"
+        )
+        columns = [row['name'] for row in conn.execute("PRAGMA table_info(applications)")]
+        if 'skills' not in columns:
+            conn.execute("ALTER TABLE applications ADD COLUMN skills TEXT")
+
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS application_skills ("
+            "skill TEXT NOT NULL, application_id INTEGER NOT NULL, PRIMARY KEY (skill, application_id)) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_application_skills_app ON application_skills (application_id)")
+
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_submitted ON applications (submitted_at, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_score_sort ON applications (COALESCE(score, -1), id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_name ON applications (full_name, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_cgpa ON applications (COALESCE(cgpa, -1), id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status, submitted_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_role ON applications (job_role, submitted_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_type ON applications (candidate_type, submitted_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_email ON applications (email, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_updated ON applications (updated_at, id)")
+
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5("
+                "full_name, email, college, job_role, skills, tokenize = 'unicode61')"
+            )
+            self.full_text = True
+        except sqlite3.OperationalError:
+            self.full_text = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _to_dict(self, row: sqlite3.Row) -> Dict:
+        application = {'id': format_application_id(row['id'])}
+        for field, column in APPLICATION_FIELDS.items():
+            application[field] = row[column]
+        application.update({
+            'status': row['status'],
+            'analyzed': row['score'] is not None,
+            'score': row['score'],
+            'grade': grade_for_score(row['score']),
+            'candidateType': row['candidate_type'],
+            'skills': json.loads(row['skills']) if row['skills'] else [],
+            'submissionDate': row['submitted_at'],
+            'updatedAt': row['updated_at']
+        })
+        return application
+
+    def _get(self, row_id: Optional[int]) -> Optional[Dict]:
+        if row_id is None:
+            return None
+        row = self._connect().execute("SELECT * FROM applications WHERE id = ?", (row_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def _index_text(self, conn: sqlite3.Connection, row_id: int):
+        """Refresh the full-text row of an application"""
+        if not self.full_text:
+            return
+        row = conn.execute(
+            "SELECT full_name, email, college, job_role, skills FROM applications WHERE id = ?", (row_id,)
+        ).fetchone()
+        conn.execute("DELETE FROM applications_fts WHERE rowid = ?", (row_id,))
+        conn.execute(
+            "INSERT INTO applications_fts (rowid, full_name, email, college, job_role, skills) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (row_id, row['full_name'], row['email'], row['college'], row['job_role'],
+             ' '.join(json.loads(row['skills'])) if row['skills'] else '')
+        )
+
+    def _insert(self, conn: sqlite3.Connection, application: Dict, now: str) -> int:
+        columns = list(APPLICATION_FIELDS.values()) + ['status', 'submitted_at', 'updated_at']
+        values = [application.get(field) or None for field in APPLICATION_FIELDS] + [
+            STATUS_PENDING, application.get('submissionDate') or now, now
+        ]
+        cursor = conn.execute(
+            f"INSERT INTO applications ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            values
+        )
+        self._index_text(conn, cursor.lastrowid)
+        return cursor.lastrowid
+
+    def add_application(self, application: Dict) -> Dict:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row_id = self._insert(conn, application, datetime.now().isoformat(timespec='seconds'))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return self._get(row_id)
+
+    def add_applications(self, applications: Iterable[Dict]) -> int:
+        conn = self._connect()
+        now = datetime.now().isoformat(timespec='seconds')
+        added = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for application in applications:
+                row_id = self._insert(conn, application, now)
+                if application.get('score') is not None or application.get('skills'):
+                    self._set_analysis(conn, row_id, application.get('score'), application.get('candidateType'),
+                                       application.get('skills') or [], None, now)
+                added += 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def get_application(self, application_id: str) -> Optional[Dict]:
+        return self._get(parse_application_id(application_id))
+
+    def get_analysis(self, application_id: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT analysis FROM applications WHERE id = ?", (parse_application_id(application_id),)
+        ).fetchone()
+        return json.loads(row['analysis']) if row and row['analysis'] else None
+
+    def update_application(self, application_id: str, changes: Dict) -> Optional[Dict]:
+        row_id = parse_application_id(application_id)
+        assignments, values = [], []
+        if 'status' in changes:
+            if changes['status'] not in APPLICATION_STATUSES:
+                raise ValueError(f"Unknown application status: {changes['status']}")
+            assignments.append('status = ?')
+            values.append(changes['status'])
+        if 'score' in changes:
+            assignments.append('score = ?')
+            values.append(parse_score(changes['score']))
+            if 'status' not in changes and changes['score'] is not None:
+                assignments.append('status = ?')
+                values.append(STATUS_ANALYZED)
+
+        if row_id is not None and assignments:
+            self._connect().execute(
+                f"UPDATE applications SET {', '.join(assignments)}, updated_at = ? WHERE id = ?",
+                values + [updated_at(), row_id]
+            )
+        return self._get(row_id)
+
+    def _set_analysis(
+        self,
+        conn: sqlite3.Connection,
+        row_id: int,
+        score: Optional[float],
+        candidate_type: Optional[str],
+        skills: List[str],
+        analysis: Optional[Dict],
+        now: str
+    ):
+        skills = sorted(set(skills))
+        conn.execute(
+            "UPDATE applications SET status = ?, score = ?, candidate_type = ?, skills = ?, analysis = ?, "
+            "updated_at = ? WHERE id = ?",
+            (
+                STATUS_ANALYZED,
+                float(score) if score is not None else None,
+                candidate_type,
+                json.dumps(skills),
+                json.dumps(analysis) if analysis is not None else None,
+                now,
+                row_id
+            )
+        )
+        conn.execute("DELETE FROM application_skills WHERE application_id = ?", (row_id,))
+        conn.executemany(
+            "INSERT INTO application_skills (skill, application_id) VALUES (?, ?)",
+            [(skill, row_id) for skill in skills]
+        )
+        self._index_text(conn, row_id)
+
+    def record_analysis(self, user_data: Dict, analysis: Dict, skills: Optional[List[str]] = None) -> Dict:
+        resume_analysis = analysis.get('resume_analysis') or {}
+        score = (resume_analysis.get('scoring') or {}).get('overall_resume_score')
+        now = datetime.now().isoformat(timespec='seconds')
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Taken under the write lock, so analyses are stored in updated_at order
+            analyzed_at = updated_at()
+            row = conn.execute(
+                "SELECT id FROM applications WHERE email = ? ORDER BY id DESC LIMIT 1",
+                (user_data.get('email'),)
+            ).fetchone()
+            row_id = row['id'] if row else self._insert(conn, user_data, now)
+            self._set_analysis(
+                conn, row_id, score, resume_analysis.get('candidate_type'), skills or [], analysis, analyzed_at
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return self._get(row_id)
+
+    def _conditions(self, filters: Dict) -> List[Condition]:
+        conditions = []
+        for field, column in (('status', 'status'), ('jobRole', 'job_role'), ('candidateType', 'candidate_type')):
+            selected = filters.get(field)
+            if not selected:
+                continue
+            selected = [selected] if isinstance(selected, str) else list(selected)
+            placeholders = ', '.join('?' * len(selected))
+            conditions.append(Condition(
+                f"{column} IN ({placeholders})", f"+{column} IN ({placeholders})", selected,
+                f"SELECT 1 FROM applications WHERE {column} IN ({placeholders})", column
+            ))
+
+        # Score filters imply an analyzed application, so they are written
+        # against the score sort expression (NULL -> -1) with a lower bound of 0
+        score = SORT_COLUMNS['score']
+        bands = []
+        if filters.get('minScore') is not None or filters.get('maxScore') is not None:
+            bands.append([(max(filters.get('minScore') or 0, 0), filters.get('maxScore'), True)])
+        grades = filters.get('grade')
+        if grades:
+            grades = [grades] if isinstance(grades, str) else list(grades)
+            upper = None
+            grade_bands = []
+            for grade, threshold in GRADE_THRESHOLDS:
+                if grade in grades:
+                    grade_bands.append((threshold or 0, upper, False))
+                upper = threshold
+            bands.append(grade_bands)
+        for band in bands:
+            values = [bound for low, high, _ in band for bound in ([low] if high is None else [low, high])]
+            conditions.append(Condition(
+                _score_ranges(score, band), _score_ranges('+' + score, band), values,
+                f"SELECT 1 FROM applications WHERE {_score_ranges(score, band)}", score
+            ))
+
+        for field, operator in (('submittedFrom', '>='), ('submittedTo', '<=')):
+            if filters.get(field) is not None:
+                conditions.append(Condition(
+                    f"submitted_at {operator} ?", f"+submitted_at {operator} ?", [filters[field]],
+                    f"SELECT 1 FROM applications WHERE submitted_at {operator} ?", 'submitted_at'
+                ))
+
+        for skill in filters.get('skills') or []:
+            conditions.append(Condition(
+                "id IN (SELECT application_id FROM application_skills WHERE skill = ?)",
+                "EXISTS (SELECT 1 FROM application_skills WHERE skill = ? AND application_id = applications.id)",
+                [skill],
+                "SELECT 1 FROM application_skills WHERE skill = ?"
+            ))
+
+        terms = re.findall(r'\w+', (filters.get('q') or '').lower())
+        if terms and self.full_text:
+            query = ' '.join(f'"{term}"*' for term in terms)
+            conditions.append(Condition(
+                "id IN (SELECT rowid FROM applications_fts WHERE applications_fts MATCH ?)",
+                "+id IN (SELECT rowid FROM applications_fts WHERE applications_fts MATCH ?)",
+                [query],
+                "SELECT rowid FROM applications_fts WHERE applications_fts MATCH ?"
+            ))
+        elif terms:
+            for term in terms:
+                sql = "(full_name LIKE ? OR email LIKE ? OR college LIKE ? OR skills LIKE ?)"
+                conditions.append(Condition(sql, sql, [f'%{term}%'] * 4))
+
+        return conditions
+
+    def _selective(self, condition: Condition) -> bool:
+        """Whether a condition matches few enough rows to drive the query from its own index"""
+        if condition.probe is None:
+            return False
+        matches = self._connect().execute(
+            f"SELECT COUNT(*) FROM ({condition.probe} LIMIT ?)", condition.values + [SELECTIVE_MATCHES]
+        ).fetchone()[0]
+        return matches < SELECTIVE_MATCHES
+
+    def _where(self, filters: Dict, sort_expression: Optional[str] = None) -> Tuple[List[str], List]:
+        """WHERE clauses for filters, planned for a keyset walk of sort_expression's index
+
+        A filter that matches few rows is looked up through its own index
+        and its matches sorted; a broad one is checked row by row while
+        walking the sort index, which reaches a page after a few hundred
+        rows instead of sorting a large fraction of the table.
+        """
+        clauses, values = [], []
+        for condition in self._conditions(filters):
+            use_index = (
+                sort_expression is None
+                or condition.column == sort_expression
+                or (sort_expression == SORT_COLUMNS['submissionDate'] and condition.column in INDEXED_BY_DATE)
+                or self._selective(condition)
+            )
+            clauses.append(condition.sql if use_index else condition.scan_sql)
+            values.extend(condition.values)
+        return clauses, values
+
+    def list_applications(
+        self,
+        filters: Optional[Dict] = None,
+        sort: str = 'submissionDate',
+        descending: bool = True,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Unknown sort key: {sort}")
+        sort_expression = SORT_COLUMNS[sort]
+        direction = 'DESC' if descending else 'ASC'
+
+        clauses, values = self._where(filters or {}, sort_expression)
+        if cursor:
+            sort_value, row_id = decode_cursor(cursor)
+            clauses.append(f"({sort_expression}, id) {'<' if descending else '>'} (?, ?)")
+            values.extend([sort_value, row_id])
+        where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+
+        rows = self._connect().execute(
+            f"SELECT *, {sort_expression} AS sort_value FROM applications{where} "
+            f"ORDER BY {sort_expression} {direction}, id {direction} LIMIT ?",
+            values + [limit + 1]
+        ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]['sort_value'], rows[-1]['id'])
+        return [self._to_dict(row) for row in rows], next_cursor
+
+    def count_applications(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> int:
+        if limit is None:
+            clauses, values = self._where(filters or {})
+            where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+            return self._connect().execute(f"SELECT COUNT(*) FROM applications{where}", values).fetchone()[0]
+        # A capped count stops early, so broad filters are checked while walking an index
+        clauses, values = self._where(filters or {}, SORT_COLUMNS['submissionDate'])
+        where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+        return self._connect().execute(
+            f"SELECT COUNT(*) FROM (SELECT 1 FROM applications{where} LIMIT ?)", values + [limit]
+        ).fetchone()[0]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        conn = self._connect()
+        return {
+            'by_role': dict(conn.execute(
+                "SELECT job_role, COUNT(*) FROM applications WHERE job_role IS NOT NULL GROUP BY job_role"
+            ).fetchall()),
+            'by_status': dict(conn.execute("SELECT status, COUNT(*) FROM applications GROUP BY status").fetchall())
+        }
+
+    def iter_analyses(self, after: Optional[Tuple[str, str]] = None, batch_size: int = 500) -> Iterator[Tuple[Dict, Dict]]:
+        conn = self._connect()
+        # Keyset pages over (updated_at, id)
+        position = (after[0], parse_application_id(after[1]) or 0) if after else ('', 0)
+        while True:
+            rows = conn.execute(
+                "SELECT * FROM applications WHERE (updated_at, id) > (?, ?) AND analysis IS NOT NULL "
+                "ORDER BY updated_at, id LIMIT ?",
+                (*position, batch_size)
+            ).fetchall()
+            for row in rows:
+                yield self._to_dict(row), json.loads(row['analysis'])
+            if len(rows) < batch_size:
+                return
+            position = (rows[-1]['updated_at'], rows[-1]['id'])
+
+    def optimize(self):
+        """Refresh planner statistics and merge full-text segments (run after bulk loads)"""
+        conn = self._connect()
+        conn.execute("PRAGMA optimize")
+        if self.full_text:
+            conn.execute("INSERT INTO applications_fts (applications_fts) VALUES ('optimize')")
+
+
+# URL scheme -> factory taking the rest of the URL; register more engines with register_candidate_engine
+CANDIDATE_ENGINES: Dict[str, Callable[[str], CandidateRepository]] = {
+    'sqlite': SQLiteCandidateRepository
+}
+
+
+def register_candidate_engine(scheme: str, factory: Callable[[str], CandidateRepository]):
+    CANDIDATE_ENGINES[scheme] = factory
+
+
+def create_candidate_repository(database_url: str) -> CandidateRepository:
+    """Build the repository for a database URL such as sqlite:///resume_scanner.db"""
+    scheme, _, location = database_url.partition('://')
+    if scheme not in CANDIDATE_ENGINES or not location.strip('/'):
+        raise ValueError(f"Unsupported candidate database: {database_url}")
+    # sqlite:///relative.db and sqlite:////absolute/path.db, as in SQLAlchemy URLs
+    return CANDIDATE_ENGINES[scheme](location[1:] if location.startswith('/') else location)
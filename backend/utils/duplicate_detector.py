@@ -0,0 +1,209 @@
+# Near-duplicate resume detection with MinHash signatures and an LSH index
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import zlib
+from typing import Dict, List, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime for the (a * x + b) mod p permutation family; shingle
+# hashes are 32-bit, so a * x stays below 2**63 in uint64 arithmetic
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+def shingle_hashes(text: str, size: int = 5) -> np.ndarray:
+    """32-bit hashes of the distinct word size-shingles of a text (case and punctuation ignored)"""
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    shingles = {' '.join(words[index:index + size]) for index in range(max(1, len(words) - size + 1))}
+    return np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+
+
+def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    """Chance that two documents with this Jaccard similarity share an LSH bucket"""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+class MinHasher:
+    """MinHash signatures of num_perm seeded hash permutations"""
+
+    def __init__(self, num_perm: int, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self._b = generator.randint(0, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+
+    def signature(self, text: str, min_shingles: int = 1) -> Optional[np.ndarray]:
+        """uint32 signature, or None for a text with fewer than min_shingles distinct shingles"""
+        hashes = shingle_hashes(text, self.shingle_size)
+        if len(hashes) < max(1, min_shingles):
+            return None
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+class DuplicateIndex:
+    """Interface for near-duplicate indexes"""
+
+    def add(self, document_id: str, text: str):
+        """Index (or re-index) one document's text"""
+        raise NotImplementedError
+
+    def find(self, text: str, limit: int = 5) -> List[Dict]:
+        """Indexed documents similar to text, most similar first: [{'id', 'similarity'}]"""
+        raise NotImplementedError
+
+    def remove(self, document_id: str) -> bool:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class SQLiteDuplicateIndex(DuplicateIndex):
+    """MinHash signatures in SQLite, bucketed by LSH band for sublinear lookups
+
+    Signatures of bands * rows values are split into bands of rows values;
+    documents sharing any band hash are candidates, which are then kept
+    when their estimated Jaccard similarity (the share of equal signature
+    values) reaches threshold. More rows per band raise precision, more
+    bands raise recall: a pair with similarity s becomes a candidate with
+    probability 1 - (1 - s**rows)**bands (see candidate_probability).
+
+    Texts with fewer than min_shingles distinct shingles are neither
+    indexed nor matched: short texts (placeholders, failed extractions)
+    share most of their few shingles by chance.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        bands: int = 16,
+        rows: int = 8,
+        threshold: float = 0.8,
+        shingle_size: int = 5,
+        min_shingles: int = 50
+    ):
+        self.path = path
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        self.min_shingles = min_shingles
+        self.hasher = MinHasher(bands * rows, shingle_size)
+        self._local = threading.local()
+
+        conn = self._connect()
+        conn.execute("CREATE TABLE IF NOT EXISTS minhash_settings (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS minhash_documents ("
+            "id INTEGER PRIMARY KEY, document_id TEXT NOT NULL UNIQUE, signature BLOB NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS minhash_buckets ("
+            "band INTEGER NOT NULL, bucket INTEGER NOT NULL, document INTEGER NOT NULL, "
+            "PRIMARY KEY (band, bucket, document)) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_minhash_buckets_document ON minhash_buckets (document)")
+        self._check_settings(conn, shingle_size)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _check_settings(self, conn: sqlite3.Connection, shingle_size: int):
+        """Start a fresh index when the stored signatures were built with other parameters"""
+        settings = f"{self.bands}x{self.rows}/{shingle_size}"
+        row = conn.execute("SELECT value FROM minhash_settings WHERE key = 'layout'").fetchone()
+        if row and row[0] == settings:
+            return
+        if row:
+            logger.warning(f"MinHash layout changed from {row[0]} to {settings}; clearing duplicate index")
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM minhash_buckets")
+        conn.execute("DELETE FROM minhash_documents")
+        conn.execute("INSERT OR REPLACE INTO minhash_settings (key, value) VALUES ('layout', ?)", (settings,))
+        conn.execute("COMMIT")
+
+    def _band_keys(self, signature: np.ndarray) -> List[int]:
+        """One signed 64-bit hash per band of the signature"""
+        return [
+            int.from_bytes(
+                hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8).digest(),
+                'little', signed=True
+            )
+            for band in range(self.bands)
+        ]
+
+    def add(self, document_id: str, text: str):
+        signature = self.hasher.signature(text, self.min_shingles)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._delete(conn, document_id)
+            if signature is not None:
+                row_id = conn.execute(
+                    "INSERT INTO minhash_documents (document_id, signature) VALUES (?, ?)",
+                    (document_id, signature.tobytes())
+                ).lastrowid
+                conn.executemany(
+                    "INSERT OR IGNORE INTO minhash_buckets (band, bucket, document) VALUES (?, ?, ?)",
+                    [(band, key, row_id) for band, key in enumerate(self._band_keys(signature))]
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def find(self, text: str, limit: int = 5) -> List[Dict]:
+        signature = self.hasher.signature(text, self.min_shingles)
+        if signature is None:
+            return []
+
+        keys = self._band_keys(signature)
+        conn = self._connect()
+        candidates = conn.execute(
+            "SELECT d.document_id, d.signature FROM minhash_documents d WHERE d.id IN ("
+            "SELECT document FROM minhash_buckets WHERE "
+            + ' OR '.join('(band = ? AND bucket = ?)' for _ in keys) + ")",
+            [value for band, key in enumerate(keys) for value in (band, key)]
+        ).fetchall()
+
+        matches = []
+        for document_id, stored in candidates:
+            similarity = float(np.mean(np.frombuffer(stored, dtype=np.uint32) == signature))
+            if similarity >= self.threshold:
+                matches.append({'id': document_id, 'similarity': round(similarity, 4)})
+        matches.sort(key=lambda match: -match['similarity'])
+        return matches[:limit]
+
+    def _delete(self, conn: sqlite3.Connection, document_id: str) -> bool:
+        row = conn.execute("SELECT id FROM minhash_documents WHERE document_id = ?", (document_id,)).fetchone()
+        if row is None:
+            return False
+        conn.execute("DELETE FROM minhash_buckets WHERE document = ?", (row[0],))
+        conn.execute("DELETE FROM minhash_documents WHERE id = ?", (row[0],))
+        return True
+
+    def remove(self, document_id: str) -> bool:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = self._delete(conn, document_id)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM minhash_documents").fetchone()[0]
@@ -0,0 +1,193 @@
+# GitHub REST client with connection pooling, conditional requests and rate limiting
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+import requests
+from requests.adapters import HTTPAdapter
+from backend.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubRateLimited(Exception):
+    """Raised when the GitHub rate limit is exhausted and would not reset in time"""
+
+    def __init__(self, reset_at: float):
+        super().__init__(f"GitHub rate limit exhausted until {time.strftime('%H:%M:%S', time.localtime(reset_at))}")
+        self.reset_at = reset_at
+
+
+class TokenBucket:
+    """Token bucket whose refill rate follows GitHub's X-RateLimit-* headers
+
+    Starts permissive (capacity tokens, refilled at `rate` per second) and,
+    once the API reports how many calls remain until the window resets,
+    spreads those calls evenly over the rest of the window.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.default_rate = rate
+        self.rate = rate
+        self.tokens = capacity
+        self.reset_at = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        if self.reset_at and time.time() >= self.reset_at:
+            # A new rate-limit window has started
+            self.reset_at = 0.0
+            self.rate = self.default_rate
+            self.tokens = self.capacity
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, max_wait: float):
+        """Take one token, sleeping up to max_wait seconds for it
+
+        The lock is only held to compute the wait, so other callers and
+        update() are not blocked while this one sleeps.
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate if self.rate > 0 else float('inf')
+                if wait > deadline - time.monotonic():
+                    raise GitHubRateLimited(self.reset_at or time.time() + wait)
+            time.sleep(wait)
+
+    def update(self, remaining: int, reset_at: float):
+        """Align the bucket with the server-reported remaining budget"""
+        with self._lock:
+            self._refill()
+            window = max(1.0, reset_at - time.time())
+            self.reset_at = reset_at
+            self.tokens = min(self.tokens, float(remaining))
+            self.rate = remaining / window
+
+
+class GitHubClient:
+    """Pooled, cached and rate-limit-aware access to the GitHub REST API"""
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: str = 'https://api.github.com',
+        timeout: float = 10,
+        pool_size: int = 10,
+        cache_size: int = 1024,
+        max_rate_wait: float = 5,
+        max_workers: int = 8
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_rate_wait = max_rate_wait
+        self.max_workers = max_workers
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['Accept'] = 'application/vnd.github.v3+json'
+        if token:
+            self.session.headers['Authorization'] = f'token {token}'
+
+        # Unauthenticated clients get 60 calls/hour, authenticated 5000/hour
+        hourly_limit = 5000 if token else 60
+        self.limiter = TokenBucket(capacity=min(hourly_limit, 100), rate=hourly_limit / 3600)
+
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[str, Tuple[str, object]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cached(self, url: str) -> Optional[Tuple[str, object]]:
+        with self._cache_lock:
+            entry = self._cache.get(url)
+            if entry is not None:
+                self._cache.move_to_end(url)
+            return entry
+
+    def _store(self, url: str, etag: str, data):
+        with self._cache_lock:
+            self._cache[url] = (etag, data)
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def get(self, path: str, params: Optional[Dict] = None) -> Tuple[int, object]:
+        """GET an API path, revalidating cached responses with If-None-Match
+
+        Returns (status_code, json_body); a 304 is reported as 200 with the
+        cached body. Raises GitHubRateLimited when the budget is exhausted.
+        """
+        url = f"{self.base_url}{path}"
+        if params:
+            url += '?' + urlencode(params)
+
+        self.limiter.acquire(self.max_rate_wait)
+
+        cached = self._cached(url)
+        headers = {'If-None-Match': cached[0]} if cached else {}
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        metrics.increment('github.requests')
+
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is not None and reset is not None:
+            self.limiter.update(int(remaining), float(reset))
+
+        if response.status_code == 304 and cached:
+            metrics.increment('github.not_modified')
+            return 200, cached[1]
+
+        if response.status_code in (403, 429) and remaining == '0':
+            metrics.increment('github.rate_limited')
+            raise GitHubRateLimited(float(reset or time.time()))
+
+        if response.status_code != 200:
+            return response.status_code, None
+
+        data = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            self._store(url, etag, data)
+        return 200, data
+
+    def fetch_profile(self, username: str) -> Optional[Dict]:
+        """Fetch a user's profile and most recently updated repositories; None if unavailable"""
+        status, profile = self.get(f'/users/{username}')
+        if status != 200:
+            return None
+
+        status, repos = self.get(f'/users/{username}/repos', {'sort': 'updated', 'per_page': 20})
+        if status != 200:
+            return None
+
+        return {'profile': profile, 'repos': repos}
+
+    def fetch_profiles(self, usernames: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch many profiles concurrently over the shared connection pool
+
+        Profiles that fail (including rate limiting) map to None.
+        """
+        usernames = list(dict.fromkeys(usernames))
+
+        def fetch(username: str) -> Optional[Dict]:
+            try:
+                return self.fetch_profile(username)
+            except (GitHubRateLimited, requests.RequestException) as e:
+                logger.warning(f"Could not fetch GitHub profile {username}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(usernames, executor.map(fetch, usernames)))
@@ -0,0 +1,99 @@
+# Local stand-in for the GitHub REST API, for tests and load tests
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+
+class GitHubStubServer:
+    """Serves /users/<name> and /users/<name>/repos from in-memory fixtures
+
+    Responses carry ETags (answering If-None-Match with 304) and
+    X-RateLimit-* headers counting down from rate_limit. Point
+    GitHubClient(base_url=server.base_url) or GITHUB_API_URL at it.
+
+        with GitHubStubServer({'octocat': {'public_repos': 2, ...}}) as server:
+            client = GitHubClient(base_url=server.base_url)
+    """
+
+    def __init__(
+        self,
+        users: Dict[str, Dict],
+        repos: Optional[Dict[str, List[Dict]]] = None,
+        rate_limit: int = 5000,
+        port: int = 0
+    ):
+        self.users = users
+        self.repos = repos or {}
+        self.remaining = rate_limit
+        self.reset_at = int(time.time()) + 3600
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                with stub._lock:
+                    stub.requests += 1
+                    if stub.remaining <= 0:
+                        return self._send(403, {'message': 'API rate limit exceeded'})
+                    stub.remaining -= 1
+
+                match = re.fullmatch(r'/users/([^/]+)(/repos)?', path)
+                if not match or match.group(1) not in stub.users:
+                    return self._send(404, {'message': 'Not Found'})
+
+                username = match.group(1)
+                body = stub.repos.get(username, []) if match.group(2) else stub.users[username]
+                self._send(200, body)
+
+            def _send(self, status: int, body):
+                payload = json.dumps(body).encode('utf-8')
+                etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+                not_modified = status == 200 and self.headers.get('If-None-Match') == etag
+
+                self.send_response(304 if not_modified else status)
+                self.send_header('ETag', etag)
+                self.send_header('X-RateLimit-Remaining', str(max(0, stub.remaining)))
+                self.send_header('X-RateLimit-Reset', str(stub.reset_at))
+                self.send_header('Content-Type', 'application/json')
+                if not_modified:
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+    def start(self) -> 'GitHubStubServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'GitHubStubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -1,8 +1,46 @@
 # Job matching and recommendation utilities
+import heapq
 import json
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 import math
+import numpy as np
+from scipy import sparse
+from backend.utils.semantic_matcher import SemanticMatcher
+from backend.utils.skill_taxonomy import SkillTaxonomy, get_skill_taxonomy
+
+# Weight of each component in the overall match score
+MATCH_WEIGHTS = {
+    'technical_skills': 0.4,
+    'experience': 0.25,
+    'education': 0.15,
+    'portfolio': 0.1,
+    'soft_skills': 0.1
+}
+
+# Share of the overall score given to resume/job text similarity when the
+# profile carries 'resume_text'; the MATCH_WEIGHTS components share the rest
+SEMANTIC_WEIGHT = 0.2
+
+# Years of experience expected at each level
+EXPERIENCE_RANGES = {
+    'entry': (0, 2),
+    'mid': (2, 5),
+    'senior': (5, 10)
+}
+
+EDUCATION_SCORES = {
+    'high school': 0.3,
+    'associate': 0.5,
+    'bachelor': 0.8,
+    'master': 1.0,
+    'phd': 1.0
+}
+
+IMPORTANT_SOFT_SKILLS = [
+    'communication', 'teamwork', 'problem solving', 'leadership',
+    'time management', 'adaptability', 'critical thinking'
+]
 
 @dataclass
 class JobRole:
@@ -16,12 +54,186 @@ class JobRole:
     experience_level: str
     growth_potential: str
 
+def experience_range(experience_level: str) -> Tuple[int, int]:
+    """Expected (min, max) years of experience for a job's experience level"""
+    level = experience_level.lower()
+    if 'entry' in level:
+        return EXPERIENCE_RANGES['entry']
+    elif 'senior' in level:
+        return EXPERIENCE_RANGES['senior']
+    return EXPERIENCE_RANGES['mid']
+
+def experience_scores(experience_years, low, high) -> np.ndarray:
+    """calculate_job_match's experience score, broadcast over arrays of years and (low, high) ranges"""
+    years = np.asarray(experience_years, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.select(
+            [(low <= years) & (years <= high), years < low],
+            [1.0, np.maximum(0.3, years / low)],
+            np.maximum(0.7, high / years)
+        )
+
+def combine_match_scores(technical, experience, education, portfolio, soft_skills, semantic=None) -> Dict[str, np.ndarray]:
+    """Component and overall score arrays, summed in MATCH_WEIGHTS order like get_job_recommendations
+    
+    semantic, when given, is blended in with SEMANTIC_WEIGHT; NaN entries
+    (candidates without resume text) keep the unblended overall score.
+    """
+    components = (technical, experience, education, portfolio, soft_skills) + (() if semantic is None else (semantic,))
+    shape = np.broadcast(*components).shape
+    scores = {
+        'technical_skills': technical,
+        'experience': experience,
+        'education': education,
+        'portfolio': portfolio,
+        'soft_skills': soft_skills
+    }
+    scores = {category: np.broadcast_to(np.asarray(values, dtype=np.float64), shape) for category, values in scores.items()}
+    overall = 0
+    for category, weight in MATCH_WEIGHTS.items():
+        overall = overall + scores[category] * weight
+    if semantic is not None:
+        semantic = np.broadcast_to(np.asarray(semantic, dtype=np.float64), shape)
+        with np.errstate(invalid='ignore'):
+            overall = np.where(np.isnan(semantic), overall, overall * (1 - SEMANTIC_WEIGHT) + semantic * SEMANTIC_WEIGHT)
+        scores['semantic'] = semantic
+    scores['overall'] = overall
+    return scores
+
+def overall_match_score(match_scores: Dict[str, float]) -> float:
+    """Overall score for calculate_job_match components"""
+    overall = sum(match_scores[category] * weight for category, weight in MATCH_WEIGHTS.items())
+    if 'semantic' in match_scores:
+        overall = overall * (1 - SEMANTIC_WEIGHT) + match_scores['semantic'] * SEMANTIC_WEIGHT
+    return overall
+
+class JobMatrix:
+    """Job catalog as arrays, for scoring every role at once
+    
+    Required-skill weights and preferred skills are sparse (jobs x skills)
+    matrices over the catalog's skill vocabulary. A candidate is a 0/1 vector
+    over the same vocabulary, so one candidate is scored against all jobs with
+    a sparse matrix-vector product and a batch with one matrix product.
+    
+    skill_jobs is the same catalog column-major: the inverted index from each
+    skill to the jobs that ask for it.
+    """
+    
+    def __init__(self, jobs: List[JobRole], taxonomy: SkillTaxonomy):
+        required = [set(taxonomy.canonical_id(skill) for skill in job.required_skills) for job in jobs]
+        preferred = [set(taxonomy.canonical_id(skill) for skill in job.preferred_skills) for job in jobs]
+        
+        self.skill_index: Dict[str, int] = {}
+        for skills in required + preferred:
+            for skill in sorted(skills):
+                self.skill_index.setdefault(skill, len(self.skill_index))
+        
+        shape = (len(jobs), len(self.skill_index))
+        self.required_weights = self._matrix(required, shape, taxonomy.weight)
+        self.preferred = self._matrix(preferred, shape, lambda skill: 1.0)
+        self.skill_jobs = self._matrix(
+            [req | pref for req, pref in zip(required, preferred)], shape, lambda skill: 1.0
+        ).tocsc()
+        self.required_counts = np.array([len(skills) for skills in required], dtype=np.float64)
+        self.preferred_counts = np.array([len(skills) for skills in preferred], dtype=np.float64)
+        
+        ranges = np.array([experience_range(job.experience_level) for job in jobs], dtype=np.float64).reshape(-1, 2)
+        self.experience_min = ranges[:, 0]
+        self.experience_max = ranges[:, 1]
+    
+    def _matrix(self, skill_sets: List[Set[str]], shape: Tuple[int, int], value) -> sparse.csr_matrix:
+        rows, cols, data = [], [], []
+        for row, skills in enumerate(skill_sets):
+            for skill in skills:
+                rows.append(row)
+                cols.append(self.skill_index[skill])
+                data.append(value(skill))
+        return sparse.csr_matrix((data, (rows, cols)), shape=shape, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self.required_counts)
+    
+    def skill_columns(self, skill_ids: Set[str]) -> List[int]:
+        """Vocabulary columns of the skills any catalog job asks for"""
+        return [self.skill_index[skill] for skill in skill_ids if skill in self.skill_index]
+    
+    def candidate_vector(self, skill_ids: Set[str]) -> np.ndarray:
+        """0/1 vector of a candidate's skills over the catalog vocabulary"""
+        vector = np.zeros(len(self.skill_index), dtype=np.float64)
+        vector[self.skill_columns(skill_ids)] = 1.0
+        return vector
+    
+    def jobs_with_skills(self, columns: List[int]) -> np.ndarray:
+        """Sorted indices of the jobs sharing at least one of the skill columns"""
+        if not columns:
+            return np.empty(0, dtype=np.intp)
+        indptr, indices = self.skill_jobs.indptr, self.skill_jobs.indices
+        return np.unique(np.concatenate([indices[indptr[column]:indptr[column + 1]] for column in columns]))
+    
+    def candidate_matrix(self, skill_id_sets: List[Set[str]]) -> sparse.csc_matrix:
+        """Sparse (skills x candidates) 0/1 matrix for a batch of candidates"""
+        rows, cols = [], []
+        for col, skill_ids in enumerate(skill_id_sets):
+            for skill in skill_ids:
+                if skill in self.skill_index:
+                    rows.append(self.skill_index[skill])
+                    cols.append(col)
+        return sparse.csc_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(self.skill_index), len(skill_id_sets))
+        )
+    
+    def technical_scores(self, candidates, jobs: Optional[np.ndarray] = None) -> np.ndarray:
+        """Technical skill match of every job (or only the given jobs)
+        
+        Returns (jobs,) for a candidate vector and (jobs, candidates) for a matrix.
+        """
+        required_weights, preferred = self.required_weights, self.preferred
+        required_counts, preferred_counts = self.required_counts, self.preferred_counts
+        if jobs is not None:
+            required_weights, preferred = required_weights[jobs], preferred[jobs]
+            required_counts, preferred_counts = required_counts[jobs], preferred_counts[jobs]
+        
+        weighted = required_weights @ candidates
+        matched = preferred @ candidates
+        if sparse.issparse(weighted):
+            weighted, matched = weighted.toarray(), matched.toarray()
+        
+        required_counts = required_counts.reshape((-1,) + (1,) * (weighted.ndim - 1))
+        preferred_counts = preferred_counts.reshape(required_counts.shape)
+        weighted_required = np.divide(
+            weighted, required_counts, out=np.zeros_like(weighted), where=required_counts > 0
+        )
+        preferred_score = np.divide(
+            matched, preferred_counts, out=np.zeros_like(matched), where=preferred_counts > 0
+        )
+        return np.minimum(1.0, (weighted_required * 0.7) + (preferred_score * 0.3))
+    
+    def experience_scores(self, experience_years, jobs: Optional[np.ndarray] = None) -> np.ndarray:
+        """Experience match of every job (or only the given jobs) for a scalar or an array of candidate years"""
+        years = np.asarray(experience_years, dtype=np.float64)
+        low, high = self.experience_min, self.experience_max
+        if jobs is not None:
+            low, high = low[jobs], high[jobs]
+        low = low.reshape((-1,) + (1,) * years.ndim)
+        return experience_scores(years, low, high.reshape(low.shape))
+
 class JobMatcher:
     """Advanced job matching and recommendation system"""
     
-    def __init__(self):
-        self.job_database = self._load_job_database()
-        self.skill_weights = self._load_skill_weights()
+    def __init__(self, job_database: Optional[List[JobRole]] = None, semantic_model_path: Optional[str] = None):
+        self.taxonomy = get_skill_taxonomy()
+        self.job_database = job_database if job_database is not None else self._load_job_database()
+        self.job_matrix = JobMatrix(self.job_database, self.taxonomy)
+        self.important_soft_skills = self._skill_ids(IMPORTANT_SOFT_SKILLS)
+        self.semantic_model_path = semantic_model_path
+        self._semantic: Optional[SemanticMatcher] = None
+    
+    @property
+    def semantic(self) -> SemanticMatcher:
+        """TF-IDF job vectors, loaded (or fitted) the first time a profile has resume text"""
+        if self._semantic is None:
+            self._semantic = SemanticMatcher.load(self.job_database, self.semantic_model_path)
+        return self._semantic
     
     def _load_job_database(self) -> List[JobRole]:
         """Load comprehensive job database"""
@@ -180,68 +392,28 @@ class JobMatcher:
         
         return jobs
     
-    def _load_skill_weights(self) -> Dict[str, float]:
-        """Load weights for different skills based on market demand"""
-        return {
-            # Programming Languages
-            "Python": 1.0,
-            "JavaScript": 0.95,
-            "Java": 0.9,
-            "TypeScript": 0.85,
-            "Go": 0.8,
-            "Rust": 0.75,
-            "C++": 0.85,
-            "C#": 0.8,
-            "Swift": 0.75,
-            "Kotlin": 0.75,
-            
-            # Web Technologies
-            "React": 0.9,
-            "Angular": 0.8,
-            "Vue.js": 0.75,
-            "Node.js": 0.85,
-            "Express.js": 0.7,
-            "Django": 0.8,
-            "Flask": 0.75,
-            
-            # Cloud & DevOps
-            "AWS": 1.0,
-            "Azure": 0.85,
-            "Docker": 0.9,
-            "Kubernetes": 0.85,
-            "Terraform": 0.8,
-            
-            # Databases
-            "SQL": 0.9,
-            "MongoDB": 0.75,
-            "PostgreSQL": 0.8,
-            "Redis": 0.7,
-            
-            # Data Science & AI
-            "Machine Learning": 0.95,
-            "TensorFlow": 0.85,
-            "PyTorch": 0.8,
-            "Pandas": 0.8,
-            "NumPy": 0.75,
-            
-            # Default weight for unlisted skills
-            "default": 0.6
-        }
+    def _skill_ids(self, skills: List[str]) -> Set[str]:
+        """Map skill names onto canonical taxonomy ids"""
+        return set(self.taxonomy.canonical_id(skill) for skill in skills)
+    
+    def _skill_weight(self, skill_id: str) -> float:
+        """Market-demand weight for a skill, from the taxonomy"""
+        return self.taxonomy.weight(skill_id)
     
     def calculate_job_match(self, candidate_profile: Dict, job_role: JobRole) -> Dict[str, float]:
         """Calculate comprehensive job match score"""
         scores = {}
         
         # Extract candidate data
-        technical_skills = set(skill.lower() for skill in candidate_profile.get('technical_skills', []))
-        soft_skills = set(skill.lower() for skill in candidate_profile.get('soft_skills', []))
+        technical_skills = self._skill_ids(candidate_profile.get('technical_skills', []))
+        soft_skills = self._skill_ids(candidate_profile.get('soft_skills', []))
         experience_years = candidate_profile.get('experience_years', 0)
         education_level = candidate_profile.get('education_level', 'bachelor')
         github_projects = candidate_profile.get('github_projects', 0)
         
         # 1. Technical Skills Match (40% weight)
-        required_skills = set(skill.lower() for skill in job_role.required_skills)
-        preferred_skills = set(skill.lower() for skill in job_role.preferred_skills)
+        required_skills = self._skill_ids(job_role.required_skills)
+        preferred_skills = self._skill_ids(job_role.preferred_skills)
         
         required_matches = technical_skills.intersection(required_skills)
         preferred_matches = technical_skills.intersection(preferred_skills)
@@ -251,27 +423,14 @@ class JobMatcher:
         
         # Apply skill weights
         weighted_required_score = sum(
-            self.skill_weights.get(skill.title(), self.skill_weights['default'])
-            for skill in required_matches
+            self._skill_weight(skill) for skill in required_matches
         ) / len(required_skills) if required_skills else 0
         
         technical_score = (weighted_required_score * 0.7) + (preferred_score * 0.3)
         scores['technical_skills'] = min(1.0, technical_score)
         
         # 2. Experience Level Match (25% weight)
-        experience_mapping = {
-            'entry': (0, 2),
-            'mid': (2, 5),
-            'senior': (5, 10)
-        }
-        
-        job_exp_level = job_role.experience_level.lower()
-        if 'entry' in job_exp_level:
-            target_range = experience_mapping['entry']
-        elif 'senior' in job_exp_level:
-            target_range = experience_mapping['senior']
-        else:
-            target_range = experience_mapping['mid']
+        target_range = experience_range(job_role.experience_level)
         
         if target_range[0] <= experience_years <= target_range[1]:
             experience_score = 1.0
@@ -283,15 +442,7 @@ class JobMatcher:
         scores['experience'] = experience_score
         
         # 3. Education Match (15% weight)
-        education_scores = {
-            'high school': 0.3,
-            'associate': 0.5,
-            'bachelor': 0.8,
-            'master': 1.0,
-            'phd': 1.0
-        }
-        
-        education_score = education_scores.get(education_level.lower(), 0.5)
+        education_score = EDUCATION_SCORES.get(education_level.lower(), 0.5)
         scores['education'] = education_score
         
         # 4. Portfolio/Projects Match (10% weight)
@@ -299,81 +450,193 @@ class JobMatcher:
         scores['portfolio'] = project_score
         
         # 5. Soft Skills Match (10% weight)
-        important_soft_skills = {
-            'communication', 'teamwork', 'problem solving', 'leadership',
-            'time management', 'adaptability', 'critical thinking'
-        }
-        
-        soft_skill_matches = soft_skills.intersection(important_soft_skills)
-        soft_skill_score = len(soft_skill_matches) / len(important_soft_skills)
+        soft_skill_matches = soft_skills.intersection(self.important_soft_skills)
+        soft_skill_score = len(soft_skill_matches) / len(self.important_soft_skills)
         scores['soft_skills'] = soft_skill_score
         
+        # 6. Semantic similarity of resume and job text (blended in with SEMANTIC_WEIGHT)
+        if candidate_profile.get('resume_text'):
+            scores['semantic'] = self.semantic.score(candidate_profile['resume_text'], job_role)
+        
         return scores
     
+    def candidate_features(self, candidate_profile: Dict) -> Tuple[Set[str], float, float, float, float]:
+        """Job-independent parts of a profile: (skill ids, years, education, portfolio, soft skill scores)"""
+        technical_skills = self._skill_ids(candidate_profile.get('technical_skills', []))
+        soft_skills = self._skill_ids(candidate_profile.get('soft_skills', []))
+        github_projects = candidate_profile.get('github_projects', 0)
+        
+        education_score = EDUCATION_SCORES.get(candidate_profile.get('education_level', 'bachelor').lower(), 0.5)
+        project_score = min(1.0, github_projects / 5) if github_projects > 0 else 0.3
+        soft_skill_score = len(soft_skills.intersection(self.important_soft_skills)) / len(self.important_soft_skills)
+        return (
+            technical_skills, candidate_profile.get('experience_years', 0),
+            education_score, project_score, soft_skill_score
+        )
+    
+    def score_jobs(self, candidate_profile: Dict) -> Dict[str, np.ndarray]:
+        """Match scores of every catalog job for one candidate
+        
+        Returns arrays aligned with job_database for each calculate_job_match
+        component plus 'overall'.
+        """
+        skills, years, education, portfolio, soft_skills = self.candidate_features(candidate_profile)
+        return combine_match_scores(
+            self.job_matrix.technical_scores(self.job_matrix.candidate_vector(skills)),
+            self.job_matrix.experience_scores(years),
+            education, portfolio, soft_skills,
+            self._semantic_scores(candidate_profile)
+        )
+    
+    def _semantic_scores(self, candidate_profile: Dict) -> Optional[np.ndarray]:
+        """Semantic component of every job, or None without resume text"""
+        if not candidate_profile.get('resume_text'):
+            return None
+        return self.semantic.scores(candidate_profile['resume_text'])
+    
+    def score_jobs_batch(self, candidate_profiles: List[Dict]) -> Dict[str, np.ndarray]:
+        """Match scores of every catalog job for many candidates, as (jobs x candidates) arrays"""
+        features = [self.candidate_features(profile) for profile in candidate_profiles]
+        skills, years, education, portfolio, soft_skills = zip(*features) if features else ([], [], [], [], [])
+        
+        semantic = None
+        with_text = [column for column, profile in enumerate(candidate_profiles) if profile.get('resume_text')]
+        if with_text:
+            semantic = np.full((len(self.job_matrix), len(candidate_profiles)), np.nan)
+            semantic[:, with_text] = self.semantic.scores_batch(
+                [candidate_profiles[column]['resume_text'] for column in with_text]
+            )
+        
+        return combine_match_scores(
+            self.job_matrix.technical_scores(self.job_matrix.candidate_matrix(list(skills))),
+            self.job_matrix.experience_scores(np.array(years, dtype=np.float64)),
+            np.array(education), np.array(portfolio), np.array(soft_skills),
+            semantic
+        )
+    
     def get_job_recommendations(
         self, 
         candidate_profile: Dict, 
         max_recommendations: int = 5,
         min_score_threshold: float = 0.3
     ) -> List[Dict]:
-        """Get personalized job recommendations"""
-        
-        recommendations = []
-        
-        for job_role in self.job_database:
-            # Calculate match scores
-            match_scores = self.calculate_job_match(candidate_profile, job_role)
-            
-            # Calculate weighted overall score
-            weights = {
-                'technical_skills': 0.4,
-                'experience': 0.25,
-                'education': 0.15,
-                'portfolio': 0.1,
-                'soft_skills': 0.1
-            }
-            
-            overall_score = sum(
-                match_scores[category] * weight 
-                for category, weight in weights.items()
-            )
-            
-            # Only include jobs above threshold
-            if overall_score >= min_score_threshold:
-                # Calculate confidence level
-                confidence = self._calculate_confidence(match_scores, overall_score)
-                
-                # Generate personalized feedback
-                feedback = self._generate_feedback(match_scores, job_role, candidate_profile)
-                
-                recommendation = {
-                    'title': job_role.title,
-                    'category': job_role.category,
-                    'match_percentage': int(overall_score * 100),
-                    'confidence': confidence,
-                    'description': job_role.description,
-                    'salary_range': job_role.salary_range,
-                    'experience_level': job_role.experience_level,
-                    'growth_potential': job_role.growth_potential,
-                    'required_skills': job_role.required_skills[:5],
-                    'preferred_skills': job_role.preferred_skills[:5],
-                    'match_breakdown': {
-                        category: int(score * 100) 
-                        for category, score in match_scores.items()
-                    },
-                    'feedback': feedback,
-                    'next_steps': self._generate_next_steps(match_scores, job_role)
-                }
-                
-                recommendations.append(recommendation)
-        
-        # Sort by match percentage and confidence
-        recommendations.sort(
-            key=lambda x: (x['match_percentage'], x['confidence']), 
-            reverse=True
+        """Get personalized job recommendations
+        
+        Only jobs sharing a skill with the candidate (found through the
+        inverted skill index) are scored first. The rest score zero on
+        technical skills, so they are scored only when that bound could still
+        reach the top results.
+        """
+        skills, years, education, portfolio, soft_skills = self.candidate_features(candidate_profile)
+        candidate = self.job_matrix.candidate_vector(skills)
+        semantic = self._semantic_scores(candidate_profile)
+        
+        jobs = self.job_matrix.jobs_with_skills(self.job_matrix.skill_columns(skills))
+        scores = combine_match_scores(
+            self.job_matrix.technical_scores(candidate, jobs),
+            self.job_matrix.experience_scores(years, jobs),
+            education, portfolio, soft_skills,
+            None if semantic is None else semantic[jobs]
         )
+        ranked = self._rank_jobs(scores, max_recommendations, min_score_threshold)
+        
+        if len(jobs) < len(self.job_matrix):
+            # Best possible score of a job sharing no skill: no technical match, full experience
+            # match, and the best semantic score among those jobs
+            semantic_bound = None
+            if semantic is not None:
+                semantic_bound = np.delete(semantic, jobs).max(initial=0.0)
+            bound = float(combine_match_scores(
+                np.zeros(1), np.ones(1), education, portfolio, soft_skills, semantic_bound
+            )['overall'][0])
+            bound_key = (int(bound * 100), "Medium" if bound >= 0.4 else "Low")
+            if bound >= min_score_threshold and (
+                len(ranked) < max_recommendations or (ranked and ranked[-1][0] <= bound_key)
+            ):
+                jobs = np.arange(len(self.job_matrix))
+                scores = combine_match_scores(
+                    self.job_matrix.technical_scores(candidate),
+                    self.job_matrix.experience_scores(years),
+                    education, portfolio, soft_skills,
+                    semantic
+                )
+                ranked = self._rank_jobs(scores, max_recommendations, min_score_threshold)
+        
+        return [
+            self._build_recommendation(self.job_database[jobs[position]], scores, position, key[1], candidate_profile)
+            for key, position in ranked
+        ]
+    
+    def get_job_recommendations_batch(
+        self,
+        candidate_profiles: List[Dict],
+        max_recommendations: int = 5,
+        min_score_threshold: float = 0.3
+    ) -> List[List[Dict]]:
+        """Job recommendations for many candidates, scored with one matrix product"""
+        scores = self.score_jobs_batch(candidate_profiles)
+        recommendations = []
+        for column, profile in enumerate(candidate_profiles):
+            column_scores = {category: values[:, column] for category, values in scores.items()}
+            ranked = self._rank_jobs(column_scores, max_recommendations, min_score_threshold)
+            recommendations.append([
+                self._build_recommendation(self.job_database[position], column_scores, position, key[1], profile)
+                for key, position in ranked
+            ])
+        return recommendations
+    
+    def _rank_jobs(
+        self,
+        scores: Dict[str, np.ndarray],
+        max_recommendations: int,
+        min_score_threshold: float
+    ) -> List[Tuple[Tuple[int, str], int]]:
+        """Heap-select the best ((match_percentage, confidence), position) pairs above the threshold
+        
+        Ordered like a stable descending sort on match percentage and
+        confidence, so ties keep catalog order.
+        """
+        overall = scores['overall']
+        passing = np.flatnonzero(overall >= min_score_threshold)
+        percentages = (overall[passing] * 100).astype(int).tolist()
+        confidences = self._confidence_levels(scores['technical_skills'][passing], overall[passing]).tolist()
+        keys = list(zip(percentages, confidences))
+        
+        best = heapq.nlargest(max_recommendations, range(len(keys)), key=keys.__getitem__)
+        return [(keys[index], int(passing[index])) for index in best]
+    
+    def _build_recommendation(
+        self,
+        job_role: JobRole,
+        scores: Dict[str, np.ndarray],
+        position: int,
+        confidence: str,
+        candidate_profile: Dict
+    ) -> Dict:
+        """Full recommendation, with feedback and next steps, for one selected job"""
+        match_scores = {category: float(scores[category][position]) for category in MATCH_WEIGHTS}
+        if 'semantic' in scores and not np.isnan(scores['semantic'][position]):
+            match_scores['semantic'] = float(scores['semantic'][position])
+        overall_score = float(scores['overall'][position])
         
-        return recommendations[:max_recommendations]
+        return {
+            'title': job_role.title,
+            'category': job_role.category,
+            'match_percentage': int(overall_score * 100),
+            'confidence': confidence,
+            'description': job_role.description,
+            'salary_range': job_role.salary_range,
+            'experience_level': job_role.experience_level,
+            'growth_potential': job_role.growth_potential,
+            'required_skills': job_role.required_skills[:5],
+            'preferred_skills': job_role.preferred_skills[:5],
+            'match_breakdown': {
+                category: int(score * 100) 
+                for category, score in match_scores.items()
+            },
+            'feedback': self._generate_feedback(match_scores, job_role, candidate_profile),
+            'next_steps': self._generate_next_steps(match_scores, job_role)
+        }
     
     def _calculate_confidence(self, match_scores: Dict[str, float], overall_score: float) -> str:
         """Calculate confidence level for recommendation"""
@@ -389,6 +652,18 @@ class JobMatcher:
         else:
             return "Low"
     
+    def _confidence_levels(self, technical_scores: np.ndarray, overall_scores: np.ndarray) -> np.ndarray:
+        """_calculate_confidence over arrays of scores"""
+        return np.select(
+            [
+                (overall_scores >= 0.8) & (technical_scores >= 0.7),
+                (overall_scores >= 0.6) & (technical_scores >= 0.5),
+                overall_scores >= 0.4
+            ],
+            ["Very High", "High", "Medium"],
+            "Low"
+        )
+    
     def _generate_feedback(
         self, 
         match_scores: Dict[str, float], 
@@ -412,10 +687,11 @@ class JobMatcher:
         
         # Identify improvement areas
         if match_scores['technical_skills'] < 0.5:
-            missing_skills = set(skill.lower() for skill in job_role.required_skills) - \
-                           set(skill.lower() for skill in candidate_profile.get('technical_skills', []))
+            missing_skills = self._skill_ids(job_role.required_skills) - \
+                           self._skill_ids(candidate_profile.get('technical_skills', []))
+            missing_names = [self.taxonomy.display_name(skill) for skill in missing_skills]
             feedback['areas_to_improve'].append(
-                f"Strengthen technical skills, particularly: {', '.join(list(missing_skills)[:3])}"
+                f"Strengthen technical skills, particularly: {', '.join(missing_names[:3])}"
             )
         
         if match_scores['experience'] < 0.4:
@@ -472,7 +748,7 @@ class JobMatcher:
                 if job.title in [rec['title'] for rec in recommendations]
             ]
         
-        candidate_skills = set(skill.lower() for skill in candidate_profile.get('technical_skills', []))
+        candidate_skills = self._skill_ids(candidate_profile.get('technical_skills', []))
         
         skill_gap_analysis = {
             'missing_skills': {},
@@ -485,27 +761,27 @@ class JobMatcher:
         all_preferred_skills = set()
         
         for role in target_roles:
-            all_required_skills.update(skill.lower() for skill in role.required_skills)
-            all_preferred_skills.update(skill.lower() for skill in role.preferred_skills)
+            all_required_skills.update(self._skill_ids(role.required_skills))
+            all_preferred_skills.update(self._skill_ids(role.preferred_skills))
         
         missing_required = all_required_skills - candidate_skills
         missing_preferred = all_preferred_skills - candidate_skills
         
         skill_gap_analysis['missing_skills'] = {
-            'required': list(missing_required),
-            'preferred': list(missing_preferred)
+            'required': [self.taxonomy.display_name(skill) for skill in missing_required],
+            'preferred': [self.taxonomy.display_name(skill) for skill in missing_preferred]
         }
         
         # Prioritize skills based on frequency and weights
         skill_priority = {}
         for skill in missing_required:
-            skill_priority[skill] = self.skill_weights.get(skill.title(), self.skill_weights['default']) * 2
+            skill_priority[skill] = self._skill_weight(skill) * 2
         
         for skill in missing_preferred:
-            skill_priority[skill] = skill_priority.get(skill, 0) + self.skill_weights.get(skill.title(), self.skill_weights['default'])
+            skill_priority[skill] = skill_priority.get(skill, 0) + self._skill_weight(skill)
         
         # Sort by priority
         priority_skills = sorted(skill_priority.items(), key=lambda x: x[1], reverse=True)
-        skill_gap_analysis['priority_skills'] = [skill for skill, _ in priority_skills[:8]]
+        skill_gap_analysis['priority_skills'] = [self.taxonomy.display_name(skill) for skill, _ in priority_skills[:8]]
         
         return skill_gap_analysis
\ No newline at end of file
@@ -0,0 +1,295 @@
+# Background job queue for long-running analyses
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+
+
+class JobQueue:
+    """Interface for job queues; payloads and results must be JSON-serializable"""
+
+    def put(self, payload: Dict) -> str:
+        """Enqueue a job and return its id"""
+        raise NotImplementedError
+
+    def claim(self, timeout: float) -> Optional[Tuple[str, Dict]]:
+        """Take the next queued job, marking it running; None if none arrived in time
+
+        Durable queues also hand out running jobs whose lease has expired,
+        i.e. whose worker crashed or was restarted mid-job.
+        """
+        raise NotImplementedError
+
+    def complete(self, job_id: str, result: Dict):
+        raise NotImplementedError
+
+    def fail(self, job_id: str, error: str):
+        raise NotImplementedError
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return the job record (status, result, error, timestamps) or None"""
+        raise NotImplementedError
+
+    def purge(self, max_age: float):
+        """Drop finished jobs older than max_age seconds"""
+        raise NotImplementedError
+
+
+class InMemoryJobQueue(JobQueue):
+    """Process-local queue; jobs are lost on restart"""
+
+    def __init__(self):
+        self._pending = queue.Queue()
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def put(self, payload: Dict) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'status': STATUS_QUEUED,
+                'payload': payload,
+                'result': None,
+                'error': None,
+                'created_at': now,
+                'updated_at': now
+            }
+        self._pending.put(job_id)
+        return job_id
+
+    def claim(self, timeout: float) -> Optional[Tuple[str, Dict]]:
+        try:
+            job_id = self._pending.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job['status'] = STATUS_RUNNING
+            job['updated_at'] = time.time()
+            return job_id, job['payload']
+
+    def _finish(self, job_id: str, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields, payload=None, updated_at=time.time())
+
+    def complete(self, job_id: str, result: Dict):
+        self._finish(job_id, status=STATUS_COMPLETED, result=result)
+
+    def fail(self, job_id: str, error: str):
+        self._finish(job_id, status=STATUS_FAILED, error=error)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return {key: value for key, value in job.items() if key != 'payload'}
+
+    def purge(self, max_age: float):
+        cutoff = time.time() - max_age
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job['status'] in (STATUS_COMPLETED, STATUS_FAILED) and job['updated_at'] < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+class SQLiteJobQueue(JobQueue):
+    """Durable queue in a SQLite file; several processes may share it
+
+    A claimed job is leased to its worker for lease_seconds. Jobs still
+    running after that (their worker died) are queued again, up to
+    max_attempts claims in total, after which they are marked failed.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.5, lease_seconds: float = 900, max_attempts: int = 3):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, payload TEXT, "
+                "result TEXT, error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL, "
+                "claimed_at REAL, attempts INTEGER NOT NULL DEFAULT 0)"
+            )
+            # Queues created before leases were added
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if 'claimed_at' not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN claimed_at REAL")
+            if 'attempts' not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, payload: Dict) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._connect().execute(
+            "INSERT INTO jobs (job_id, status, payload, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (job_id, STATUS_QUEUED, json.dumps(payload), now, now)
+        )
+        self._wakeup.set()
+        return job_id
+
+    def _reclaim_expired(self, conn: sqlite3.Connection, now: float):
+        """Requeue running jobs whose lease expired, failing those out of attempts"""
+        expired_before = now - self.lease_seconds
+        conn.execute(
+            "UPDATE jobs SET status = ?, error = ?, payload = NULL, updated_at = ? "
+            "WHERE status = ? AND claimed_at < ? AND attempts >= ?",
+            (STATUS_FAILED, 'Worker stopped before the job finished', now,
+             STATUS_RUNNING, expired_before, self.max_attempts)
+        )
+        requeued = conn.execute(
+            "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND claimed_at < ?",
+            (STATUS_QUEUED, now, STATUS_RUNNING, expired_before)
+        ).rowcount
+        if requeued:
+            logger.warning(f"Requeued {requeued} job(s) whose lease expired")
+
+    def claim(self, timeout: float) -> Optional[Tuple[str, Dict]]:
+        deadline = time.monotonic() + timeout
+        conn = self._connect()
+        while True:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                self._reclaim_expired(conn, now)
+                row = conn.execute(
+                    "SELECT job_id, payload FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                    (STATUS_QUEUED,)
+                ).fetchone()
+                if row:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, claimed_at = ?, attempts = attempts + 1, updated_at = ? "
+                        "WHERE job_id = ?",
+                        (STATUS_RUNNING, now, now, row[0])
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            if row:
+                return row[0], json.loads(row[1])
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # Woken early by local submissions; other processes are picked up by polling
+            self._wakeup.wait(min(self.poll_interval, remaining))
+            self._wakeup.clear()
+
+    def complete(self, job_id: str, result: Dict):
+        self._connect().execute(
+            "UPDATE jobs SET status = ?, result = ?, payload = NULL, updated_at = ? WHERE job_id = ?",
+            (STATUS_COMPLETED, json.dumps(result), time.time(), job_id)
+        )
+
+    def fail(self, job_id: str, error: str):
+        self._connect().execute(
+            "UPDATE jobs SET status = ?, error = ?, payload = NULL, updated_at = ? WHERE job_id = ?",
+            (STATUS_FAILED, error, time.time(), job_id)
+        )
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT job_id, status, result, error, created_at, updated_at FROM jobs WHERE job_id = ?",
+            (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'job_id': row[0],
+            'status': row[1],
+            'result': json.loads(row[2]) if row[2] else None,
+            'error': row[3],
+            'created_at': row[4],
+            'updated_at': row[5]
+        }
+
+    def purge(self, max_age: float):
+        self._connect().execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+            (STATUS_COMPLETED, STATUS_FAILED, time.time() - max_age)
+        )
+
+
+def create_job_queue(backend: str, path: Optional[str] = None, lease_seconds: float = 900) -> JobQueue:
+    """Build a job queue from its configured backend name"""
+    if backend == 'memory':
+        return InMemoryJobQueue()
+    if backend == 'sqlite':
+        return SQLiteJobQueue(path, lease_seconds=lease_seconds)
+    raise ValueError(f"Unknown job queue backend: {backend}")
+
+
+class JobWorkerPool:
+    """Local worker threads that drain a JobQueue through a handler"""
+
+    def __init__(self, job_queue: JobQueue, handler: Callable[[Dict], Dict], num_workers: int = 4):
+        self.queue = job_queue
+        self.handler = handler
+        self._stopping = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._run, name=f'job-worker-{index}', daemon=True)
+            for index in range(num_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, payload: Dict) -> str:
+        return self.queue.put(payload)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                claimed = self.queue.claim(timeout=1.0)
+            except Exception as e:
+                logger.error(f"Error claiming job: {str(e)}")
+                time.sleep(1.0)
+                continue
+            if claimed is None:
+                continue
+
+            job_id, payload = claimed
+            try:
+                self.queue.complete(job_id, self.handler(payload))
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {str(e)}")
+                self.queue.fail(job_id, str(e))
+
+    def shutdown(self):
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join()
@@ -0,0 +1,257 @@
+# LLM client with response caching, bounded concurrency, retries and tolerant JSON parsing
+import asyncio
+import json
+import logging
+import random
+import re
+import threading
+import time
+import weakref
+from functools import cached_property
+from typing import Any, Iterator, List, Optional
+from backend.utils.analysis_cache import CacheBackend, content_hash
+from backend.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# ```json ... ``` blocks, which models often wrap their JSON in
+JSON_FENCE = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL | re.IGNORECASE)
+# Trailing commas before a closing bracket; string literals are matched too so they are left alone
+TRAILING_COMMA = re.compile(r'("(?:[^"\\]|\\.)*")|,\s*([}\]])')
+# Opening brackets tried when looking for JSON inside prose
+MAX_JSON_STARTS = 20
+
+
+class LLMError(Exception):
+    """Raised when the model cannot produce a usable response"""
+
+
+class LLMResponseError(LLMError):
+    """Raised when a response holds no parseable JSON"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Prompt with whitespace runs collapsed, so indentation changes share cache entries"""
+    return ' '.join(prompt.split())
+
+
+def strip_trailing_commas(text: str) -> str:
+    """JSON text with commas directly before a closing bracket removed, outside strings"""
+    return TRAILING_COMMA.sub(lambda match: match.group(1) or match.group(2), text)
+
+
+def extract_json(text: str) -> Any:
+    """The JSON value in a model response: bare, fenced, or surrounded by prose
+
+    Trailing commas before a closing bracket are tolerated as a last resort.
+    """
+    candidates = [text.strip()] + [block.strip() for block in JSON_FENCE.findall(text)]
+    for candidate in candidates:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            pass
+
+    # The first complete value starting at an opening bracket, ignoring what follows it
+    decoder = json.JSONDecoder()
+    starts = [match.start() for match in re.finditer(r'[{\[]', text)][:MAX_JSON_STARTS]
+    for start in starts:
+        try:
+            return decoder.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            pass
+
+    for candidate in candidates + [text[start:] for start in starts[:1]]:
+        try:
+            return decoder.raw_decode(strip_trailing_commas(candidate))[0]
+        except json.JSONDecodeError:
+            pass
+
+    raise LLMResponseError(f"No JSON found in model response ({len(text)} characters)")
+
+
+class LLMModel:
+    """Interface for text-generation models"""
+
+    name = 'model'
+
+    def generate(self, prompt: str, timeout: float) -> str:
+        raise NotImplementedError
+
+    async def generate_async(self, prompt: str, timeout: float) -> str:
+        """Async generation; runs generate on a thread unless overridden"""
+        return await asyncio.to_thread(self.generate, prompt, timeout)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether a failed call is worth repeating (timeouts, dropped connections, ...)"""
+        return isinstance(error, (TimeoutError, ConnectionError))
+
+
+class GeminiModel(LLMModel):
+    """Google Gemini through google-generativeai (imported on first use)"""
+
+    def __init__(self, api_key: str, model_name: str = 'gemini-pro'):
+        self.api_key = api_key
+        self.name = model_name
+
+    @cached_property
+    def _model(self):
+        import google.generativeai as genai
+        genai.configure(api_key=self.api_key)
+        return genai.GenerativeModel(self.name)
+
+    def generate(self, prompt: str, timeout: float) -> str:
+        return self._model.generate_content(prompt, request_options={'timeout': timeout}).text
+
+    async def generate_async(self, prompt: str, timeout: float) -> str:
+        response = await self._model.generate_content_async(prompt, request_options={'timeout': timeout})
+        return response.text
+
+    def is_retryable(self, error: Exception) -> bool:
+        from google.api_core import exceptions
+        return super().is_retryable(error) or isinstance(error, (
+            exceptions.TooManyRequests,
+            exceptions.InternalServerError,
+            exceptions.ServiceUnavailable,
+            exceptions.DeadlineExceeded
+        ))
+
+
+def create_llm_model(backend: str, api_key: Optional[str] = None, model_name: str = 'gemini-pro',
+                     stub_latency: float = 0.0) -> Optional[LLMModel]:
+    """Build a model from its configured name; None when disabled or not configured"""
+    if backend == 'none':
+        return None
+    if backend == 'gemini':
+        return GeminiModel(api_key, model_name) if api_key else None
+    if backend == 'stub':
+        from backend.utils.llm_stub import StubLLMModel
+        return StubLLMModel(latency=stub_latency)
+    raise ValueError(f"Unknown LLM backend: {backend}")
+
+
+class LLMClient:
+    """Cached, retried and concurrency-limited access to an LLM
+
+    Responses are cached by the hash of the whitespace-normalized prompt
+    (parsed JSON and raw text separately, and only once they parse). At
+    most max_concurrency calls are in flight per process for blocking
+    calls, and per event loop for async ones. Retryable failures are
+    repeated up to max_retries times with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        model: LLMModel,
+        cache: Optional[CacheBackend] = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        timeout: float = 30
+    ):
+        self.model = model
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._async_semaphores = weakref.WeakKeyDictionary()
+
+    def _cache_key(self, kind: str, prompt: str) -> str:
+        return f"llm-{kind}:{self.model.name}:{content_hash(normalize_prompt(prompt))}"
+
+    def _cached(self, key: str) -> Optional[Any]:
+        if self.cache is None:
+            return None
+        value = self.cache.get(key)
+        metrics.increment('llm.cache.hits' if value is not None else 'llm.cache.misses')
+        return value
+
+    def _store(self, key: str, value: Any):
+        if self.cache is not None:
+            self.cache.set(key, value)
+
+    def _retry_delays(self) -> Iterator[Optional[float]]:
+        """Backoff before each retry, then None once retries are exhausted"""
+        for attempt in range(self.max_retries):
+            yield self.backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+        yield None
+
+    def _should_retry(self, error: Exception, delay: Optional[float]) -> bool:
+        if delay is None or not self.model.is_retryable(error):
+            metrics.increment('llm.failures')
+            return False
+        metrics.increment('llm.retries')
+        logger.warning(f"LLM call failed ({str(error) or type(error).__name__}); retrying in {delay:.1f}s")
+        return True
+
+    def _generate(self, prompt: str) -> str:
+        for delay in self._retry_delays():
+            try:
+                with self._semaphore:
+                    metrics.increment('llm.calls')
+                    return self.model.generate(prompt, self.timeout)
+            except Exception as e:
+                if not self._should_retry(e, delay):
+                    raise
+            time.sleep(delay)
+
+    async def _generate_async(self, prompt: str) -> str:
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.setdefault(loop, asyncio.Semaphore(self.max_concurrency))
+        for delay in self._retry_delays():
+            try:
+                async with semaphore:
+                    metrics.increment('llm.calls')
+                    return await asyncio.wait_for(self.model.generate_async(prompt, self.timeout), self.timeout)
+            except Exception as e:
+                if not self._should_retry(e, delay):
+                    raise
+            await asyncio.sleep(delay)
+
+    def _parse(self, text: str) -> Any:
+        try:
+            return extract_json(text)
+        except LLMResponseError:
+            metrics.increment('llm.parse_errors')
+            raise
+
+    def complete(self, prompt: str) -> str:
+        """Response text for a prompt"""
+        key = self._cache_key('text', prompt)
+        text = self._cached(key)
+        if text is None:
+            text = self._generate(prompt)
+            self._store(key, text)
+        return text
+
+    def complete_json(self, prompt: str) -> Any:
+        """JSON value of the response to a prompt; LLMResponseError when there is none"""
+        key = self._cache_key('json', prompt)
+        value = self._cached(key)
+        if value is None:
+            value = self._parse(self._generate(prompt))
+            self._store(key, value)
+        return value
+
+    async def complete_json_async(self, prompt: str) -> Any:
+        key = self._cache_key('json', prompt)
+        value = self._cached(key)
+        if value is None:
+            value = self._parse(await self._generate_async(prompt))
+            self._store(key, value)
+        return value
+
+    def complete_json_batch(self, prompts: List[str]) -> List[Any]:
+        """complete_json for many prompts, max_concurrency at a time; failures are returned in place
+
+        Runs its own event loop, so call it from synchronous code (scripts,
+        bulk jobs), not from inside a running loop. The app's request path
+        analyzes one resume per request through complete_json.
+        """
+        async def run():
+            return await asyncio.gather(
+                *(self.complete_json_async(prompt) for prompt in prompts), return_exceptions=True
+            )
+        return asyncio.run(run())
@@ -0,0 +1,92 @@
+# Local stand-in for the LLM API, for tests and load tests
+import asyncio
+import json
+import random
+import threading
+import time
+from typing import Callable, Optional
+from backend.utils.llm_client import LLMModel
+
+# A complete resume analysis in the format the analysis prompt asks for
+SAMPLE_ANALYSIS = {
+    'candidate_type': 'Technical',
+    'skills_analysis': {
+        'technical_skills': ['Python', 'JavaScript', 'React', 'SQL', 'Docker'],
+        'soft_skills': ['Communication', 'Teamwork', 'Problem Solving'],
+        'domain_expertise': ['Web Development'],
+        'certifications': [],
+        'tools_technologies': ['Git', 'Linux']
+    },
+    'experience_analysis': {
+        'total_years': 1,
+        'internships': ['Software Engineering Intern'],
+        'work_experience': [],
+        'projects': ['Resume Screener web application'],
+        'leadership_roles': []
+    },
+    'achievements': ['Hackathon winner'],
+    'education_details': {
+        'degree': 'B.Tech',
+        'specialization': 'Computer Science',
+        'academic_projects': [],
+        'relevant_coursework': ['Data Structures', 'Algorithms']
+    },
+    'scoring': {
+        'technical_skills_score': 18,
+        'soft_skills_score': 10,
+        'experience_score': 10,
+        'projects_score': 12,
+        'achievements_score': 4,
+        'education_score': 8,
+        'overall_resume_score': 62
+    },
+    'strengths': ['Solid programming fundamentals'],
+    'improvement_areas': ['Limited professional experience'],
+    'job_recommendations': ['Full Stack Developer', 'Backend Developer']
+}
+
+
+def fenced_sample_analysis(prompt: str) -> str:
+    """SAMPLE_ANALYSIS as a fenced JSON block with some prose, as real models often answer"""
+    return f"Here is the analysis:\n```json\n{json.dumps(SAMPLE_ANALYSIS, indent=2)}\n```"
+
+
+class StubLLMModel(LLMModel):
+    """Answers every prompt after a simulated latency, without the network
+
+    responder(prompt) builds the response text. A failure_rate share of
+    calls raises a (retryable) TimeoutError instead. Point the app at it
+    with LLM_BACKEND=stub to load-test analysis.
+    """
+
+    name = 'stub'
+
+    def __init__(
+        self,
+        responder: Optional[Callable[[str], str]] = None,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.responder = responder or fenced_sample_analysis
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _respond(self, prompt: str) -> str:
+        with self._lock:
+            self.calls += 1
+            failed = self._random.random() < self.failure_rate
+        if failed:
+            raise TimeoutError("Simulated model timeout")
+        return self.responder(prompt)
+
+    def generate(self, prompt: str, timeout: float) -> str:
+        time.sleep(self.latency)
+        return self._respond(prompt)
+
+    async def generate_async(self, prompt: str, timeout: float) -> str:
+        await asyncio.sleep(self.latency)
+        return self._respond(prompt)
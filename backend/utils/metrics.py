@@ -0,0 +1,31 @@
+# Lightweight in-process metrics counters
+import threading
+from typing import Dict
+
+
+class Metrics:
+    """Thread-safe named counters, exposed through /api/metrics"""
+
+    def __init__(self):
+        self._counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+# Process-wide registry
+metrics = Metrics()
@@ -0,0 +1,205 @@
+# Full-text search over stored resume text
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Quoted phrase, parenthesis, or a bare word (possibly 'phrase:' or a trailing '*')
+QUERY_TOKEN = re.compile(r'"([^"]*)"|([()])|([^\s()"]+)')
+QUERY_OPERATORS = ('AND', 'OR', 'NOT')
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def parse_query(query: str) -> Tuple[str, List[str]]:
+    """FTS5 query for a recruiter search, and the words it looks for
+
+    Bare words are required (implicit AND); AND, OR, NOT and parentheses
+    combine them; "quoted text" or 'phrase: words ...' (up to the next
+    operator) matches a phrase; a trailing * matches a prefix. Words are
+    quoted, so punctuation such as 'c++' or 'node.js' is not FTS5 syntax.
+    """
+    parts, terms = [], []
+    phrase: Optional[List[str]] = None
+
+    def close_phrase():
+        nonlocal phrase
+        if phrase:
+            parts.append(_quote(' '.join(phrase)))
+            terms.append(' '.join(phrase))
+        phrase = None
+
+    for quoted, paren, word in QUERY_TOKEN.findall(query):
+        if word.lower() == 'phrase:':
+            close_phrase()
+            phrase = []
+        elif word.lower().startswith('phrase:'):
+            close_phrase()
+            phrase = [word[len('phrase:'):]]
+        elif phrase is not None and word and word not in QUERY_OPERATORS:
+            phrase.append(word)
+        else:
+            close_phrase()
+            if quoted.strip():
+                parts.append(_quote(quoted))
+                terms.append(quoted)
+            elif paren:
+                parts.append(paren)
+            elif word in QUERY_OPERATORS:
+                parts.append(word)
+            elif word.endswith('*') and word.strip('*'):
+                parts.append(_quote(word.strip('*')) + '*')
+                terms.append(word.strip('*'))
+            elif word.strip('*'):
+                parts.append(_quote(word))
+                terms.append(word)
+    close_phrase()
+
+    if not terms:
+        raise ValueError("Search query has no terms")
+    return ' '.join(parts), terms
+
+
+def snippet(text: str, terms: List[str], width: int = 200) -> str:
+    """Excerpt of text around the first occurrence of any term"""
+    lowered = text.lower()
+    positions = [lowered.find(term.lower()) for term in terms]
+    positions = [position for position in positions if position >= 0]
+    start = max(0, min(positions) - width // 4) if positions else 0
+    excerpt = ' '.join(text[start:start + width].split())
+    return ('...' if start > 0 else '') + excerpt + ('...' if start + width < len(text) else '')
+
+
+class ResumeIndex:
+    """Interface for resume full-text indexes"""
+
+    def add(self, document_id: str, text: str):
+        """Index (or re-index) the text of one resume"""
+        raise NotImplementedError
+
+    def remove(self, document_id: str) -> bool:
+        raise NotImplementedError
+
+    def get_text(self, document_id: str) -> Optional[str]:
+        """The indexed text of one resume, if any"""
+        raise NotImplementedError
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """Best-matching resumes first: [{'id', 'score', 'snippet'}]; ValueError for bad queries"""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class SQLiteResumeIndex(ResumeIndex):
+    """Resume text in a contentless FTS5 index with BM25 ranking
+
+    The FTS5 table keeps only the inverted index (with positions, for
+    phrase queries); the text itself is stored once, zlib-compressed, for
+    snippets and for removing the old postings when a resume is re-indexed.
+    Words are split on Unicode word boundaries, keeping '+' and '#' so that
+    C++ and C# stay searchable.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS resume_documents ("
+            "id INTEGER PRIMARY KEY, document_id TEXT NOT NULL UNIQUE, text BLOB NOT NULL, indexed_at TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS resume_fts USING fts5("
+            "text, content = '', tokenize = \"unicode61 tokenchars '+#'\")"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _unindex(self, conn: sqlite3.Connection, row_id: int, compressed: bytes):
+        conn.execute(
+            "INSERT INTO resume_fts (resume_fts, rowid, text) VALUES ('delete', ?, ?)",
+            (row_id, zlib.decompress(compressed).decode('utf-8'))
+        )
+
+    def add(self, document_id: str, text: str):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT id, text FROM resume_documents WHERE document_id = ?", (document_id,)
+            ).fetchone()
+            if row:
+                self._unindex(conn, row[0], row[1])
+                conn.execute("DELETE FROM resume_documents WHERE id = ?", (row[0],))
+            row_id = conn.execute(
+                "INSERT INTO resume_documents (document_id, text, indexed_at) VALUES (?, ?, ?)",
+                (document_id, zlib.compress(text.encode('utf-8')), datetime.now().isoformat(timespec='seconds'))
+            ).lastrowid
+            conn.execute("INSERT INTO resume_fts (rowid, text) VALUES (?, ?)", (row_id, text))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def remove(self, document_id: str) -> bool:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT id, text FROM resume_documents WHERE document_id = ?", (document_id,)
+            ).fetchone()
+            if row:
+                self._unindex(conn, row[0], row[1])
+                conn.execute("DELETE FROM resume_documents WHERE id = ?", (row[0],))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return row is not None
+
+    def get_text(self, document_id: str) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT text FROM resume_documents WHERE document_id = ?", (document_id,)
+        ).fetchone()
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        fts_query, terms = parse_query(query)
+        try:
+            rows = self._connect().execute(
+                "SELECT d.document_id, d.text, m.rank FROM "
+                "(SELECT rowid, bm25(resume_fts) AS rank FROM resume_fts WHERE resume_fts MATCH ? "
+                "ORDER BY rank LIMIT ?) m JOIN resume_documents d ON d.id = m.rowid ORDER BY m.rank",
+                (fts_query, limit)
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {str(e)}")
+
+        return [
+            {
+                'id': document_id,
+                # bm25() is lower-is-better; flip it so higher scores rank first
+                'score': round(-rank, 4),
+                'snippet': snippet(zlib.decompress(compressed).decode('utf-8'), terms)
+            }
+            for document_id, compressed, rank in rows
+        ]
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM resume_documents").fetchone()[0]
+
+    def optimize(self):
+        """Merge the index's segments into one (smaller and faster to query)"""
+        self._connect().execute("INSERT INTO resume_fts (resume_fts) VALUES ('optimize')")
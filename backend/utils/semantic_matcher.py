@@ -0,0 +1,121 @@
+# Semantic (TF-IDF) similarity between resume text and job roles
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from typing import List, Optional
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+# Cosine similarity counted as a full semantic match; long resumes rarely
+# score higher than this against a short job description
+FULL_MATCH_SIMILARITY = 0.3
+
+
+def job_document(job_role) -> str:
+    """Text describing a job role: title, category, description and skills"""
+    return ' '.join([
+        job_role.title,
+        job_role.category,
+        job_role.description,
+        ' '.join(job_role.required_skills),
+        ' '.join(job_role.preferred_skills)
+    ])
+
+
+def semantic_scores(similarity):
+    """Semantic match component (0-1) for cosine similarities"""
+    return np.minimum(1.0, np.asarray(similarity, dtype=np.float64) / FULL_MATCH_SIMILARITY)
+
+
+def _new_vectorizer() -> 'TfidfVectorizer':
+    # scikit-learn takes about a second to import; only needed once the matcher is built
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    return TfidfVectorizer(
+        lowercase=True,
+        stop_words='english',
+        ngram_range=(1, 2),
+        sublinear_tf=True,
+        # Keep tokens such as c++, c#, node.js and ci/cd whole
+        token_pattern=r'(?u)\b\w[\w+#./-]*[\w+#]|\b\w'
+    )
+
+
+class SemanticMatcher:
+    """TF-IDF vectors of every job role, for scoring a resume against all of them
+
+    Job vectors are L2-normalized and stacked into a sparse (jobs x terms)
+    matrix once, so a resume's cosine similarity to every job is a single
+    sparse matrix-vector product.
+    """
+
+    def __init__(self, vectorizer: 'TfidfVectorizer', job_documents: List[str]):
+        self.vectorizer = vectorizer
+        self.job_vectors: sparse.csr_matrix = vectorizer.transform(job_documents).tocsr()
+
+    @classmethod
+    def load(cls, job_roles: List, model_path: Optional[str] = None) -> 'SemanticMatcher':
+        """Fitted matcher for a job catalog, reusing the vectorizer persisted at model_path
+
+        The vectorizer is refit (and saved) when the file is missing or was
+        fitted on a different catalog.
+        """
+        documents = [job_document(job_role) for job_role in job_roles]
+        catalog_hash = hashlib.sha256('\0'.join(documents).encode('utf-8')).hexdigest()
+
+        if model_path and os.path.exists(model_path):
+            try:
+                with open(model_path, 'rb') as file:
+                    saved = pickle.load(file)
+                if saved.get('catalog_hash') == catalog_hash:
+                    return cls(saved['vectorizer'], documents)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable semantic model {model_path}: {str(e)}")
+
+        logger.info(f"Fitting TF-IDF model on {len(documents)} job roles")
+        vectorizer = _new_vectorizer().fit(documents)
+        if model_path:
+            try:
+                # Atomic replace so concurrently starting workers never read a partial file
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(model_path)), suffix='.tmp')
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump({'catalog_hash': catalog_hash, 'vectorizer': vectorizer}, file)
+                os.replace(temp_path, model_path)
+            except OSError as e:
+                logger.warning(f"Could not save semantic model to {model_path}: {str(e)}")
+        return cls(vectorizer, documents)
+
+    def similarities(self, resume_text: str) -> np.ndarray:
+        """Cosine similarity of a resume to every job, shape (jobs,)"""
+        resume_vector = self.vectorizer.transform([resume_text])
+        return (self.job_vectors @ resume_vector.T).toarray().ravel()
+
+    def similarities_batch(self, resume_texts: List[str]) -> np.ndarray:
+        """Cosine similarities as a (jobs x resumes) array"""
+        resume_vectors = self.vectorizer.transform(resume_texts)
+        return (self.job_vectors @ resume_vectors.T).toarray()
+
+    def scores(self, resume_text: str) -> np.ndarray:
+        """Semantic match component (0-1) of every job, shape (jobs,)"""
+        return semantic_scores(self.similarities(resume_text))
+
+    def scores_batch(self, resume_texts: List[str]) -> np.ndarray:
+        """Semantic match components as a (jobs x resumes) array"""
+        return semantic_scores(self.similarities_batch(resume_texts))
+
+    def resume_vectors(self, resume_texts: List[str]) -> sparse.csr_matrix:
+        """L2-normalized TF-IDF rows of resumes, for job_scores"""
+        return self.vectorizer.transform(resume_texts).tocsr()
+
+    def job_scores(self, resume_vectors: sparse.csr_matrix, job_role) -> np.ndarray:
+        """Semantic match component of each resume_vectors row for one job role"""
+        job_vector = self.vectorizer.transform([job_document(job_role)])
+        return semantic_scores((resume_vectors @ job_vector.T).toarray().ravel())
+
+    def score(self, resume_text: str, job_role) -> float:
+        """Semantic match component for one job role, which need not be in the catalog"""
+        vectors = self.vectorizer.transform([resume_text, job_document(job_role)])
+        return float(semantic_scores((vectors[0] @ vectors[1].T).toarray()[0, 0]))
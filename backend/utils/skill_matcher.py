@@ -0,0 +1,162 @@
+# Single-pass multi-pattern skill matching for resume analysis
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+NO_TERM = 0xFFFFFFFF
+
+# Characters that continue a token; a match touching one of these is a
+# fragment of a longer word ('go' in 'google', 'java' in 'javascript').
+WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789_')
+# A trailing '+' or '#' also extends a token ('c' must not match 'c++')
+TRAILING_WORD_CHARS = WORD_CHARS | frozenset('+#')
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds every skill term in one scan of the text.
+
+    The automaton is stored as flat integer arrays so it can be built once
+    per process, or serialized and memory-mapped (see skill_taxonomy);
+    lookups walk sorted edge lists with bisect.
+    """
+
+    def __init__(
+        self,
+        edge_start: Sequence[int],
+        edge_chars: Sequence[int],
+        edge_targets: Sequence[int],
+        fail: Sequence[int],
+        term: Sequence[int],
+        dict_link: Sequence[int],
+        term_lengths: Sequence[int]
+    ):
+        self.edge_start = edge_start
+        self.edge_chars = edge_chars
+        self.edge_targets = edge_targets
+        self.fail = fail
+        self.term = term
+        self.dict_link = dict_link
+        self.term_lengths = term_lengths
+
+    @classmethod
+    def build(cls, terms: Iterable[str]) -> 'SkillMatcher':
+        """Compile terms into an automaton; term ids follow iteration order"""
+        goto: List[Dict[str, int]] = [{}]
+        state_term: List[int] = [NO_TERM]
+        term_lengths = array('I')
+
+        for term_id, term in enumerate(terms):
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    state_term.append(NO_TERM)
+                state = next_state
+            if state_term[state] == NO_TERM:
+                state_term[state] = term_id
+            term_lengths.append(len(term))
+
+        # Breadth-first pass to compute failure and dictionary-suffix links
+        num_states = len(goto)
+        fail = array('I', [0]) * num_states
+        dict_link = array('I', [0]) * num_states
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[child] = target if target != child else 0
+                suffix = fail[child]
+                dict_link[child] = suffix if state_term[suffix] != NO_TERM else dict_link[suffix]
+
+        # Flatten transitions into sorted edge arrays
+        edge_start = array('I', [0]) * (num_states + 1)
+        edge_chars = array('I')
+        edge_targets = array('I')
+        for state, edges in enumerate(goto):
+            edge_start[state] = len(edge_chars)
+            for char in sorted(edges):
+                edge_chars.append(ord(char))
+                edge_targets.append(edges[char])
+        edge_start[num_states] = len(edge_chars)
+
+        return cls(edge_start, edge_chars, edge_targets, fail,
+                   array('I', state_term), dict_link, term_lengths)
+
+    @property
+    def num_states(self) -> int:
+        return len(self.fail)
+
+    def lookup(self, term: str) -> Optional[int]:
+        """Return the id of a term that exactly equals the given string"""
+        edge_start = self.edge_start
+        edge_chars = self.edge_chars
+        state = 0
+        for char in term:
+            code = ord(char)
+            lo = edge_start[state]
+            hi = edge_start[state + 1]
+            pos = bisect_left(edge_chars, code, lo, hi)
+            if pos >= hi or edge_chars[pos] != code:
+                return None
+            state = self.edge_targets[pos]
+        term_id = self.term[state]
+        return None if term_id == NO_TERM else term_id
+
+    def _step(self, state: int, code: int) -> int:
+        """Follow the goto/failure transitions for one character"""
+        edge_start = self.edge_start
+        edge_chars = self.edge_chars
+        while True:
+            lo = edge_start[state]
+            hi = edge_start[state + 1]
+            if lo != hi:
+                pos = bisect_left(edge_chars, code, lo, hi)
+                if pos < hi and edge_chars[pos] == code:
+                    return self.edge_targets[pos]
+            if state == 0:
+                return 0
+            state = self.fail[state]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """Return (start, end, term_id) for every whole-word term occurrence in text"""
+        matches = []
+        term = self.term
+        dict_link = self.dict_link
+        term_lengths = self.term_lengths
+        text_length = len(text)
+        state = 0
+
+        for index, char in enumerate(text):
+            state = self._step(state, ord(char))
+            if not state:
+                continue
+            end = index + 1
+            if end < text_length and text[end] in TRAILING_WORD_CHARS:
+                continue
+
+            output = state if term[state] != NO_TERM else dict_link[state]
+            while output:
+                term_id = term[output]
+                start = end - term_lengths[term_id]
+                if start == 0 or text[start - 1] not in WORD_CHARS:
+                    matches.append((start, end, term_id))
+                output = dict_link[output]
+
+        return matches
+
+    def find_terms(self, text: str) -> List[int]:
+        """Return distinct matched term ids in order of first appearance"""
+        seen = {}
+        for _, _, term_id in self.find_all(text):
+            seen.setdefault(term_id, None)
+        return list(seen)
@@ -0,0 +1,294 @@
+# Skill taxonomy loading and compiled, memory-mapped skill index
+import csv
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import tempfile
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional
+from backend.utils.skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+INDEX_MAGIC = b'SKIX'
+INDEX_FORMAT_VERSION = 1
+
+# magic, format version, source sha256, default weight,
+# skills, terms, states, edges, string blob size (padded to 8 bytes)
+HEADER = struct.Struct('<4sI32sd5I4x')
+
+SKILL_KINDS = ['technical', 'soft']
+
+# Keys used by TextProcessor.extract_skills for each kind
+SKILL_KIND_KEYS = {
+    'technical': 'technical_skills',
+    'soft': 'soft_skills'
+}
+
+FLAG_DETECT = 1
+
+
+def normalize_skill_name(name: str) -> str:
+    """Normalize a skill name or alias for lookup"""
+    return re.sub(r'\s+', ' ', name).strip().lower()
+
+
+def load_taxonomy_source(path: str) -> Dict:
+    """Read a taxonomy definition from a JSON, YAML or CSV file
+
+    JSON/YAML documents hold a top-level ``skills`` list; CSV files have the
+    columns id, name, category, kind, weight, aliases (pipe separated), detect.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.json':
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    if extension in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("PyYAML is required to load YAML skill taxonomies")
+        with open(path, 'r', encoding='utf-8') as file:
+            return yaml.safe_load(file)
+
+    if extension == '.csv':
+        skills = []
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            for row in csv.DictReader(file):
+                skill = {
+                    'id': row['id'],
+                    'name': row['name'],
+                    'category': row.get('category') or 'uncategorized',
+                    'kind': row.get('kind') or 'technical',
+                    'aliases': [alias for alias in (row.get('aliases') or '').split('|') if alias]
+                }
+                if row.get('weight'):
+                    skill['weight'] = float(row['weight'])
+                if row.get('detect'):
+                    skill['detect'] = row['detect'].strip().lower() not in ('0', 'false', 'no')
+                skills.append(skill)
+        return {'skills': skills}
+
+    raise ValueError(f"Unsupported taxonomy format: {extension}")
+
+
+def compile_taxonomy(definition: Dict, source_hash: bytes = b'') -> bytes:
+    """Compile a taxonomy definition into the binary index format"""
+    default_weight = float(definition.get('default_weight', 0.6))
+    skills = definition['skills']
+
+    strings: List[str] = []
+    categories: Dict[str, int] = {}
+    weights = array('d')
+    kinds = array('I')
+    flags = array('I')
+    skill_categories = array('I')
+    terms: Dict[str, int] = {}
+    seen_ids = set()
+
+    for ordinal, skill in enumerate(skills):
+        skill_id = skill['id']
+        if skill_id in seen_ids:
+            raise ValueError(f"Duplicate skill id in taxonomy: {skill_id}")
+        seen_ids.add(skill_id)
+
+        kind = skill.get('kind', 'technical')
+        if kind not in SKILL_KINDS:
+            raise ValueError(f"Unknown skill kind for {skill_id}: {kind}")
+
+        strings.append(skill_id)
+        strings.append(skill.get('name', skill_id))
+        weights.append(float(skill.get('weight', default_weight)))
+        kinds.append(SKILL_KINDS.index(kind))
+        flags.append(FLAG_DETECT if skill.get('detect', True) else 0)
+        category = skill.get('category', 'uncategorized')
+        skill_categories.append(categories.setdefault(category, len(categories)))
+
+        for alias in [skill.get('name', skill_id), skill_id.replace('_', ' ')] + list(skill.get('aliases', [])):
+            term = normalize_skill_name(alias)
+            if not term:
+                continue
+            owner = terms.setdefault(term, ordinal)
+            if owner != ordinal:
+                logger.warning(f"Skill alias '{term}' already maps to {skills[owner]['id']}; ignored for {skill_id}")
+
+    strings.extend(categories)
+
+    term_skills = array('I', terms.values())
+    matcher = SkillMatcher.build(terms)
+
+    encoded = [value.encode('utf-8') for value in strings]
+    string_offsets = array('I', [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+    blob = b''.join(encoded)
+
+    header = HEADER.pack(
+        INDEX_MAGIC, INDEX_FORMAT_VERSION, source_hash.ljust(32, b'\0'), default_weight,
+        len(skills), len(terms), matcher.num_states, len(matcher.edge_chars), len(blob)
+    )
+
+    sections = [
+        weights, kinds, flags, skill_categories,
+        array('I', [len(categories)]), string_offsets,
+        term_skills, matcher.term_lengths,
+        matcher.edge_start, matcher.edge_chars, matcher.edge_targets,
+        matcher.fail, matcher.term, matcher.dict_link
+    ]
+    return header + b''.join(section.tobytes() for section in sections) + blob
+
+
+class SkillTaxonomy:
+    """Read-only view over a compiled skill index
+
+    Skills are addressed by their canonical string id (e.g. 'nodejs'); names
+    and aliases from resumes or job descriptions resolve into that id space.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+
+        (magic, format_version, source_hash, default_weight,
+         num_skills, num_terms, num_states, num_edges, blob_size) = HEADER.unpack_from(view, 0)
+        if magic != INDEX_MAGIC or format_version != INDEX_FORMAT_VERSION:
+            raise ValueError("Not a compatible skill index")
+
+        self.source_hash = source_hash.rstrip(b'\0').hex()
+        self.default_weight = default_weight
+        offset = HEADER.size
+
+        def take(count: int, fmt: str = 'I'):
+            nonlocal offset
+            size = count * struct.calcsize(fmt)
+            section = view[offset:offset + size].cast(fmt)
+            offset += size
+            return section
+
+        self._weights = take(num_skills, 'd')
+        self._kinds = take(num_skills)
+        self._flags = take(num_skills)
+        self._categories = take(num_skills)
+        num_categories = take(1)[0]
+        self._string_offsets = take(2 * num_skills + num_categories + 1)
+        self._term_skills = take(num_terms)
+        term_lengths = take(num_terms)
+        edge_start = take(num_states + 1)
+        edge_chars = take(num_edges)
+        edge_targets = take(num_edges)
+        fail = take(num_states)
+        term = take(num_states)
+        dict_link = take(num_states)
+        self._blob = view[offset:offset + blob_size]
+
+        self.num_skills = num_skills
+        self.matcher = SkillMatcher(edge_start, edge_chars, edge_targets, fail, term, dict_link, term_lengths)
+        self._ordinals = {self._string(2 * ordinal): ordinal for ordinal in range(num_skills)}
+
+    @classmethod
+    def load(cls, source_path: str, index_path: Optional[str] = None) -> 'SkillTaxonomy':
+        """Load a taxonomy, compiling its index on first use and memory-mapping it afterwards"""
+        index_path = index_path or source_path + '.idx'
+        with open(source_path, 'rb') as file:
+            source_hash = hashlib.sha256(file.read()).digest()
+
+        taxonomy = cls._open_index(index_path, source_hash)
+        if taxonomy is not None:
+            return taxonomy
+
+        logger.info(f"Compiling skill index from {source_path}")
+        data = compile_taxonomy(load_taxonomy_source(source_path), source_hash)
+        try:
+            # Atomic replace so concurrently starting workers never see a partial file
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(index_path)), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            logger.warning(f"Could not write skill index {index_path}: {str(e)}")
+            return cls(data)
+
+        return cls._open_index(index_path, source_hash) or cls(data)
+
+    @classmethod
+    def _open_index(cls, index_path: str, source_hash: bytes) -> Optional['SkillTaxonomy']:
+        """Memory-map an existing index if it was compiled from the same source"""
+        try:
+            with open(index_path, 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            taxonomy = cls(mapped)
+        except (ValueError, struct.error, TypeError):
+            return None
+
+        if taxonomy.source_hash != source_hash.hex():
+            return None
+        return taxonomy
+
+    @property
+    def version(self) -> str:
+        """Identifier of the taxonomy contents, for cache keys"""
+        return self.source_hash[:16]
+
+    def _string(self, index: int) -> str:
+        start = self._string_offsets[index]
+        end = self._string_offsets[index + 1]
+        return bytes(self._blob[start:end]).decode('utf-8')
+
+    def _ordinal(self, skill_id: str) -> Optional[int]:
+        return self._ordinals.get(skill_id)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Return the canonical id for a skill name or alias, or None if unknown"""
+        term_id = self.matcher.lookup(normalize_skill_name(name))
+        if term_id is None:
+            return None
+        return self._string(2 * self._term_skills[term_id])
+
+    def canonical_id(self, name: str) -> str:
+        """Canonical id for a skill; unknown skills map to their normalized name"""
+        return self.resolve(name) or normalize_skill_name(name)
+
+    def display_name(self, skill_id: str) -> str:
+        ordinal = self._ordinal(skill_id)
+        return skill_id if ordinal is None else self._string(2 * ordinal + 1)
+
+    def weight(self, skill_id: str) -> float:
+        ordinal = self._ordinal(skill_id)
+        return self.default_weight if ordinal is None else self._weights[ordinal]
+
+    def kind(self, skill_id: str) -> Optional[str]:
+        ordinal = self._ordinal(skill_id)
+        return None if ordinal is None else SKILL_KINDS[self._kinds[ordinal]]
+
+    def category(self, skill_id: str) -> Optional[str]:
+        ordinal = self._ordinal(skill_id)
+        if ordinal is None:
+            return None
+        return self._string(2 * self.num_skills + self._categories[ordinal])
+
+    def find_skills(self, text: str) -> List[str]:
+        """Return canonical ids of detectable skills mentioned in text, in order of appearance"""
+        found = {}
+        for term_id in self.matcher.find_terms(normalize_skill_name(text)):
+            ordinal = self._term_skills[term_id]
+            if self._flags[ordinal] & FLAG_DETECT:
+                found.setdefault(ordinal, None)
+        return [self._string(2 * ordinal) for ordinal in found]
+
+
+@lru_cache(maxsize=None)
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Process-wide taxonomy loaded from the configured source"""
+    from backend.config import Config
+    return SkillTaxonomy.load(Config.SKILL_TAXONOMY_PATH, Config.SKILL_INDEX_PATH)
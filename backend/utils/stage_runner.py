@@ -0,0 +1,90 @@
+# Concurrent execution of independent analysis stages
+import logging
+import time
+from concurrent.futures import Executor, TimeoutError
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StageFailedError(Exception):
+    """A required stage failed or timed out"""
+
+    def __init__(self, stage: str, reason: str):
+        super().__init__(f"{stage} stage failed: {reason}")
+        self.stage = stage
+        self.reason = reason
+
+
+def _timed(func: Callable, timings: Dict[str, float], stage: str) -> Callable:
+    """Wrap a stage so it records its own wall-clock duration in milliseconds"""
+    def run():
+        started = time.perf_counter()
+        try:
+            return func()
+        finally:
+            timings[stage] = round((time.perf_counter() - started) * 1000, 1)
+    return run
+
+
+def _when_done(stage: str, callback: Callable[[], None]) -> Callable:
+    """Future done-callback that runs callback and logs, rather than raises, its errors"""
+    def run(future):
+        try:
+            callback()
+        except Exception as e:
+            logger.warning(f"Cleanup after stage '{stage}' failed: {str(e)}")
+    return run
+
+
+def run_stages(
+    executor: Executor,
+    stages: Dict[str, Tuple[Callable, float]],
+    required: Iterable[str] = (),
+    on_done: Optional[Dict[str, Callable[[], None]]] = None
+) -> Tuple[Dict, Dict[str, float], Dict[str, str]]:
+    """Run stages concurrently, each with its own timeout
+
+    stages maps a stage name to (callable, timeout_seconds). Optional stages
+    that fail or time out yield None and an entry in the errors dict, so the
+    caller still gets a partial result; a failing required stage raises
+    StageFailedError. Returns (results, timings_ms, errors).
+
+    on_done maps a stage name to a callable run once that stage's thread
+    has actually finished (or the stage was cancelled before starting),
+    which may be after run_stages returned or raised on a timeout. Use it to
+    release resources the stage reads, such as temporary files.
+    """
+    required = set(required)
+    started = time.perf_counter()
+    timings: Dict[str, float] = {}
+    futures = {
+        stage: executor.submit(_timed(func, timings, stage))
+        for stage, (func, _) in stages.items()
+    }
+    for stage, callback in (on_done or {}).items():
+        futures[stage].add_done_callback(_when_done(stage, callback))
+
+    results = {}
+    errors = {}
+    for stage, future in futures.items():
+        timeout = stages[stage][1]
+        remaining = max(0.0, timeout - (time.perf_counter() - started))
+        try:
+            results[stage] = future.result(timeout=remaining)
+        except TimeoutError:
+            # The worker thread cannot be interrupted; it keeps its executor slot
+            # until it finishes, and its result is discarded
+            future.cancel()
+            timings.setdefault(stage, round(timeout * 1000, 1))
+            errors[stage] = f'timed out after {timeout}s'
+        except Exception as e:
+            errors[stage] = str(e)
+
+        if stage in errors:
+            logger.warning(f"Stage '{stage}' did not complete: {errors[stage]}")
+            if stage in required:
+                raise StageFailedError(stage, errors[stage])
+            results[stage] = None
+
+    return results, dict(timings), errors
@@ -0,0 +1,307 @@
+# Bounded, streaming text extraction from resume documents
+import hashlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExtractionLimits:
+    """Per-document bounds on extraction work"""
+    max_pages: int = 5
+    max_chars: int = 100000
+    time_budget: float = 10.0
+
+
+def _bounded(chunks: Iterable[str], limits: ExtractionLimits, source: str) -> Iterator[str]:
+    """Pass chunks through until the character or time budget runs out
+
+    The time budget is checked between chunks; a single slow page is not
+    interrupted, but no further pages are started once it is spent.
+    """
+    deadline = time.monotonic() + limits.time_budget
+    remaining = limits.max_chars
+
+    for chunk in chunks:
+        if len(chunk) >= remaining:
+            yield chunk[:remaining]
+            logger.info(f"{source}: character limit of {limits.max_chars} reached")
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+        if time.monotonic() > deadline:
+            logger.warning(f"{source}: time budget of {limits.time_budget}s exhausted")
+            return
+
+
+def join_text(chunks: Iterable[str]) -> str:
+    """Build the document text from streamed chunks in a single join"""
+    return '\n'.join(chunks).strip()
+
+
+# Leading bytes of OLE2 (legacy .doc) and zip (.docx) containers
+OLE2_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+ZIP_MAGIC = b'PK\x03\x04'
+
+
+def sniff_file_type(file: BinaryIO) -> Optional[str]:
+    """Detect the document type from its leading bytes rather than its name
+
+    Returns 'pdf', 'docx', 'doc', 'rtf', 'txt' or None. The file position
+    is restored afterwards.
+    """
+    start = file.tell()
+    head = file.read(2048)
+    file.seek(start)
+
+    if head.lstrip(b'\r\n\t ').startswith(b'%PDF-'):
+        return 'pdf'
+    if head.startswith(OLE2_MAGIC):
+        return 'doc'
+    if head.startswith(b'{\\rtf'):
+        return 'rtf'
+    if head.startswith(ZIP_MAGIC):
+        try:
+            with zipfile.ZipFile(file) as archive:
+                is_docx = 'word/document.xml' in archive.namelist()
+        except zipfile.BadZipFile:
+            is_docx = False
+        file.seek(start)
+        return 'docx' if is_docx else None
+    if head and b'\0' not in head:
+        try:
+            head.decode('utf-8')
+            return 'txt'
+        except UnicodeDecodeError:
+            return None
+    return None
+
+
+class ExtractionError(Exception):
+    """Every installed backend failed to read a recognized document"""
+
+    def __init__(self, file_type: str, errors: List[str]):
+        super().__init__(f"Unable to extract text from {file_type.upper()} ({'; '.join(errors)})")
+        self.file_type = file_type
+
+
+@dataclass
+class ExtractionBackend:
+    """A text extractor for one or more file types
+
+    extract(file, path, limits) yields text chunks (pages or paragraphs);
+    backends that only work on files on disk set needs_path and read path.
+    """
+    name: str
+    file_types: Tuple[str, ...]
+    modules: Tuple[str, ...]
+    extract: Callable[[BinaryIO, Optional[str], ExtractionLimits], Iterator[str]]
+    needs_path: bool = False
+    priority: int = 100
+    _available: Optional[bool] = field(default=None, repr=False)
+
+    def available(self) -> bool:
+        """Whether the backend's optional dependencies are installed"""
+        if self._available is None:
+            self._available = all(importlib.util.find_spec(module) is not None for module in self.modules)
+        return self._available
+
+
+def _extract_pypdf2(file: BinaryIO, path: Optional[str], limits: ExtractionLimits) -> Iterator[str]:
+    import PyPDF2
+    reader = PyPDF2.PdfReader(file)
+    if len(reader.pages) > limits.max_pages:
+        logger.info(f"PDF has {len(reader.pages)} pages; reading the first {limits.max_pages}")
+    pages = (
+        reader.pages[index].extract_text() or ''
+        for index in range(min(len(reader.pages), limits.max_pages))
+    )
+    return _bounded(pages, limits, 'PDF')
+
+
+def _extract_pymupdf(file: BinaryIO, path: Optional[str], limits: ExtractionLimits) -> Iterator[str]:
+    import pymupdf
+    document = pymupdf.open(stream=file.read(), filetype='pdf')
+
+    def pages():
+        try:
+            for index in range(min(document.page_count, limits.max_pages)):
+                yield document[index].get_text()
+        finally:
+            document.close()
+    return _bounded(pages(), limits, 'PDF')
+
+
+def _extract_pdfminer(file: BinaryIO, path: Optional[str], limits: ExtractionLimits) -> Iterator[str]:
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+
+    pages = (
+        ''.join(element.get_text() for element in page if isinstance(element, LTTextContainer))
+        for page in extract_pages(file, maxpages=limits.max_pages)
+    )
+    return _bounded(pages, limits, 'PDF')
+
+
+def _extract_python_docx(file: BinaryIO, path: Optional[str], limits: ExtractionLimits) -> Iterator[str]:
+    import docx
+    document = docx.Document(file)
+    return _bounded((paragraph.text for paragraph in document.paragraphs), limits, 'DOCX')
+
+
+def _extract_textract(file: BinaryIO, path: Optional[str], limits: ExtractionLimits) -> Iterator[str]:
+    import textract
+    text = textract.process(path).decode('utf-8', errors='replace')
+    return _bounded([text], limits, 'textract')
+
+
+def _extract_plain_text(file: BinaryIO, path: Optional[str], limits: ExtractionLimits) -> Iterator[str]:
+    text = file.read(limits.max_chars * 4).decode('utf-8', errors='replace')
+    return _bounded(text.splitlines(), limits, 'TXT')
+
+
+EXTRACTION_BACKENDS: List[ExtractionBackend] = []
+
+
+def register_backend(backend: ExtractionBackend):
+    """Add an extraction backend; later lookups consider it for its file types"""
+    EXTRACTION_BACKENDS.append(backend)
+
+
+register_backend(ExtractionBackend('pymupdf', ('pdf',), ('pymupdf',), _extract_pymupdf, priority=10))
+register_backend(ExtractionBackend('pypdf2', ('pdf',), ('PyPDF2',), _extract_pypdf2, priority=20))
+register_backend(ExtractionBackend('pdfminer', ('pdf',), ('pdfminer',), _extract_pdfminer, priority=30))
+register_backend(ExtractionBackend('python-docx', ('docx',), ('docx',), _extract_python_docx, priority=10))
+register_backend(ExtractionBackend(
+    'textract', ('doc', 'docx', 'rtf', 'pdf'), ('textract',), _extract_textract, needs_path=True, priority=90
+))
+register_backend(ExtractionBackend('plain-text', ('txt',), (), _extract_plain_text, priority=10))
+
+
+def load_benchmark_results(path: Optional[str]) -> Dict[str, Dict[str, float]]:
+    """Read measured throughput ({file_type: {backend: docs_per_second}}), if present"""
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file).get('throughput', {})
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable extraction benchmark {path}: {str(e)}")
+        return {}
+
+
+def backends_for(file_type: str, benchmark: Optional[Dict[str, Dict[str, float]]] = None) -> List[ExtractionBackend]:
+    """Available backends for a file type, fastest measured first
+
+    Backends with benchmark results are ordered by throughput; the rest
+    follow in static priority order.
+    """
+    measured = (benchmark or {}).get(file_type, {})
+    candidates = [
+        backend for backend in EXTRACTION_BACKENDS
+        if file_type in backend.file_types and backend.available()
+    ]
+    return sorted(
+        candidates,
+        key=lambda backend: (backend.name not in measured, -measured.get(backend.name, 0), backend.priority)
+    )
+
+
+# A resume held in memory (bytes/memoryview) or spilled to a file on disk
+ResumeSource = Union[bytes, bytearray, memoryview, str]
+
+
+def open_source(source: ResumeSource) -> BinaryIO:
+    """Binary file object over a path or an in-memory buffer"""
+    if isinstance(source, str):
+        return open(source, 'rb')
+    return io.BytesIO(source)
+
+
+def source_hash(source: ResumeSource, chunk_size: int = 64 * 1024) -> str:
+    """SHA-256 hex digest of the document; spilled sources are read in chunks, not loaded whole"""
+    digest = hashlib.sha256()
+    if isinstance(source, str):
+        with open(source, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                digest.update(chunk)
+    else:
+        digest.update(source)
+    return digest.hexdigest()
+
+
+def spool_upload(stream: BinaryIO, threshold: int, spool_dir: str, suffix: str = '') -> ResumeSource:
+    """Keep an upload in memory when it is at most threshold bytes, else spill it to a temp file
+
+    Returns the bytes, or the path of the spilled file (which the caller
+    must delete).
+    """
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+
+    if size <= threshold:
+        return stream.read()
+
+    fd, path = tempfile.mkstemp(dir=spool_dir, suffix=suffix)
+    with os.fdopen(fd, 'wb') as file:
+        shutil.copyfileobj(stream, file)
+    return path
+
+
+class TextExtractor:
+    """Picks and runs extraction backends by sniffed file type"""
+
+    def __init__(self, limits: ExtractionLimits, benchmark_path: Optional[str] = None):
+        self.limits = limits
+        self.benchmark = load_benchmark_results(benchmark_path)
+
+    def extract(self, source: ResumeSource) -> str:
+        """Extract text from a path or in-memory document
+
+        Backends are tried fastest first, falling back to the next when one
+        fails. Raises ValueError for unrecognized file types or when no
+        backend is installed for the detected type, and ExtractionError when
+        every backend failed.
+        """
+        with open_source(source) as file:
+            file_type = sniff_file_type(file)
+            if file_type is None:
+                raise ValueError("Unsupported file format")
+
+            backends = backends_for(file_type, self.benchmark)
+            if not backends:
+                raise ValueError(f"No extraction backend installed for {file_type} files")
+
+            errors = []
+            for backend in backends:
+                file.seek(0)
+                try:
+                    if backend.needs_path and not isinstance(source, str):
+                        return self._extract_spilled(backend, file, file_type)
+                    path = source if isinstance(source, str) else None
+                    return join_text(backend.extract(file, path, self.limits))
+                except Exception as e:
+                    logger.warning(f"{backend.name} could not extract {file_type}: {str(e)}")
+                    errors.append(f"{backend.name}: {str(e)}")
+
+        raise ExtractionError(file_type, errors)
+
+    def _extract_spilled(self, backend: ExtractionBackend, file: BinaryIO, file_type: str) -> str:
+        """Run a path-only backend on an in-memory document via a temporary file"""
+        with tempfile.NamedTemporaryFile(suffix=f'.{file_type}') as spilled:
+            shutil.copyfileobj(file, spilled)
+            spilled.flush()
+            spilled.seek(0)
+            return join_text(backend.extract(spilled, spilled.name, self.limits))
@@ -1,33 +1,260 @@
 # Text processing utilities for resume analysis
+import logging
 import re
 import string
-from typing import List, Dict, Set
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.stem import WordNetLemmatizer
-import spacy
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Iterable, List, Dict, Optional, Set, Union
+from backend.utils.skill_taxonomy import SKILL_KIND_KEYS, get_skill_taxonomy
 
-# Download required NLTK data
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('wordnet', quiet=True)
-except:
-    pass
+logger = logging.getLogger(__name__)
+
+# NLTK (about a second to import) and spaCy are imported on first use, and
+# their data and models are loaded once per process and shared
+
+# spaCy components noun_chunks needs (part-of-speech tags and the dependency
+# parse); the rest of the pipeline, such as NER and the lemmatizer, is skipped
+NOUN_CHUNK_COMPONENTS = ('tok2vec', 'tagger', 'morphologizer', 'attribute_ruler', 'parser')
+
+# NLTK data used here: download name -> nltk.data path
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet'
+}
+
+@lru_cache(maxsize=None)
+def ensure_nltk_data(name: str) -> bool:
+    """Make an NLTK resource available, downloading it only if it is missing (once per process)"""
+    import nltk
+    try:
+        nltk.data.find(NLTK_RESOURCES[name])
+        return True
+    except LookupError:
+        pass
+    try:
+        return bool(nltk.download(name, quiet=True))
+    except Exception as e:
+        logger.warning(f"Could not download NLTK data '{name}': {str(e)}")
+        return False
+
+@lru_cache(maxsize=None)
+def get_stop_words() -> frozenset:
+    """English stop words, loaded on first use and shared by the process"""
+    from nltk.corpus import stopwords
+    ensure_nltk_data('stopwords')
+    return frozenset(stopwords.words('english'))
+
+@lru_cache(maxsize=None)
+def get_lemmatizer():
+    """WordNet lemmatizer shared by the process (WordNet itself loads on first lemmatize)"""
+    from nltk.stem import WordNetLemmatizer
+    ensure_nltk_data('wordnet')
+    return WordNetLemmatizer()
+
+@lru_cache(maxsize=None)
+def get_spacy_pipeline():
+    """The shared spaCy English pipeline, or None when spaCy or the model is not installed"""
+    try:
+        import spacy
+        return spacy.load('en_core_web_sm')
+    except (ImportError, OSError):
+        return None
+
+def preload_models():
+    """Load NLTK data, the lemmatizer and the spaCy pipeline now rather than on first use
+    
+    Call it in a parent process before forking workers (see
+    backend/gunicorn.conf.py) so that the workers share the loaded models
+    copy-on-write instead of each loading its own.
+    """
+    for name in NLTK_RESOURCES:
+        ensure_nltk_data(name)
+    try:
+        get_stop_words()
+        ParsedResume('Warm up the tokenizers. Then the lemmatizer.').words
+        get_lemmatizer().lemmatize('resumes')
+    except LookupError as e:
+        logger.warning(f"NLTK data unavailable, skipping preload: {str(e)}")
+    get_spacy_pipeline()
+
+# Sentence keywords for experience, project and achievement extraction
+EXPERIENCE_KEYWORDS = [
+    'experience', 'work', 'employment', 'position', 'role',
+    'job', 'career', 'professional', 'intern', 'internship'
+]
+PROJECT_KEYWORDS = [
+    'project', 'developed', 'built', 'created', 'designed',
+    'implemented', 'application', 'system', 'website', 'app'
+]
+ACHIEVEMENT_KEYWORDS = ['award', 'recognition', 'achievement', 'honor', 'medal', 'certificate', 'winner']
+
+# Compiled pattern bank. Alternatives are merged into one pattern per
+# extractor, with named groups telling them apart, so each extractor makes
+# a single pass over its text.
+
+# Characters clean_text replaces with spaces
+SPECIAL_CHARACTERS = re.compile(r'[^\w\s\.\,\;\:\-\(\)]')
+
+CONTACT_PATTERN = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<linkedin>(?i:linkedin\.com/in/)[^\s]+)'
+    r'|(?P<github>(?i:github\.com/)[^\s]+)'
+    r'|(?P<phone>\+\d{1,3}[-.\s]?\d{10,14}'  # International format
+    r'|\(\d{3}\)\s*\d{3}[-.]?\d{4}'  # (123) 456-7890
+    r'|\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)'  # 123-456-7890, 123.456.7890 or 1234567890
+)
+CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github')
+
+# Matched against lowercased text
+DEGREE_PATTERN = re.compile(
+    r'\b(?:(?P<degree>bachelor|master|phd|doctorate|diploma|certificate|b\.?tech|m\.?tech|mba|bba|bca|mca'
+    r'|b\.?sc|m\.?sc|b\.?com|m\.?com|b\.?a|m\.?a)'
+    r'|(?P<level>undergraduate|graduate|postgraduate))\b'
+)
+DEGREE_KINDS = ('degree', 'level')
+
+TIMEFRAME_PATTERN = re.compile(
+    r'\b(?:(?P<year>20\d{2})'  # Years like 2020, 2021
+    r'|(?P<month>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*'  # Months
+    r'|(?P<duration>\d{1,2}\s+(?:years?|months?)))\b'  # Duration
+)
+
+# Prompt compaction: rough token estimate, and the section headings that
+# start (low-information or regular) resume sections
+CHARS_PER_TOKEN = 4
+LOW_INFORMATION_SECTIONS = {
+    'declaration', 'references', 'hobbies', 'interests', 'hobbies and interests',
+    'personal details', 'personal information', 'personal data'
+}
+RESUME_SECTIONS = {
+    'summary', 'objective', 'profile', 'education', 'experience', 'work experience',
+    'professional experience', 'employment', 'internships', 'projects', 'skills',
+    'technical skills', 'soft skills', 'achievements', 'awards', 'certifications',
+    'certificates', 'publications', 'activities', 'extracurricular activities',
+    'languages', 'leadership', 'coursework', 'courses'
+}
+# Sections whose lines are never deduplicated: two roles or projects can
+# legitimately share a title or bullet
+NO_DEDUPE_SECTIONS = {
+    'experience', 'work experience', 'professional experience', 'employment',
+    'internships', 'projects'
+}
+# A line counts as a page header or footer when it occurs at least this often
+REPEATED_LINE_MIN_COUNT = 3
+# Short all-letter lines; a heading when upper case or ending in ':'
+HEADING_LINE = re.compile(r'[a-z][a-z &/]{2,40}:?')
+# Page numbers and boilerplate lines left behind by document extraction
+LOW_INFORMATION_LINE = re.compile(
+    r'^(?:page\s*)?\d{1,3}(?:\s*(?:of\s*)?\d{1,3})?$'  # clean_text has removed any '/'
+    r'|references (?:are )?available (?:up)?on request'
+    r'|^i hereby declare'
+)
+TRUNCATION_MARKER = '\n[...]'
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count (about four characters per token)"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+@dataclass
+class CompactedText:
+    """Resume text compacted for an LLM prompt, with its token savings"""
+    text: str
+    original_tokens: int
+    tokens: int
+    truncated: bool
+    
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.tokens
+
+class ParsedResume:
+    """Resume text tokenized once, with derived views computed on first use
+    
+    Sentences are split once and words are tokenized per sentence (what
+    word_tokenize does internally), so every TextProcessor extractor given
+    the same ParsedResume shares a single tokenization pass.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+    
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+    
+    @cached_property
+    def sentences(self) -> List[str]:
+        from nltk.tokenize import sent_tokenize
+        ensure_nltk_data('punkt')
+        return sent_tokenize(self.text)
+    
+    @cached_property
+    def sentences_lower(self) -> List[str]:
+        return [sentence.lower() for sentence in self.sentences]
+    
+    @cached_property
+    def words(self) -> List[str]:
+        from nltk.tokenize import word_tokenize
+        return [word for sentence in self.sentences for word in word_tokenize(sentence, preserve_line=True)]
+    
+    @cached_property
+    def alpha_words(self) -> List[str]:
+        """Lowercased alphabetic words, in order"""
+        return [word.lower() for word in self.words if word.isalpha()]
+    
+    @cached_property
+    def clean_words(self) -> List[str]:
+        """Lowercased alphabetic words of the cleaned text (see clean_text), in order"""
+        return [
+            piece.lower() for word in self.words
+            for piece in SPECIAL_CHARACTERS.split(word) if piece.isalpha()
+        ]
+    
+    def sentences_with(self, keywords: List[str]) -> List[str]:
+        """Sentences (original case) containing any keyword"""
+        return [
+            sentence for sentence, sentence_lower in zip(self.sentences, self.sentences_lower)
+            if any(keyword in sentence_lower for keyword in keywords)
+        ]
+
+def parse_resume(text: Union[str, ParsedResume]) -> ParsedResume:
+    """ParsedResume for raw text; an already parsed resume is returned as is"""
+    return text if isinstance(text, ParsedResume) else ParsedResume(text)
 
 class TextProcessor:
-    """Utilities for processing and analyzing text from resumes"""
+    """Utilities for processing and analyzing text from resumes
     
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
-        self.lemmatizer = WordNetLemmatizer()
-        
-        # Load spaCy model for advanced NLP (optional)
-        try:
-            self.nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            self.nlp = None
+    Extractors accept raw text or a ParsedResume; pass one ParsedResume to
+    several extractors to tokenize the resume only once. NLTK data and the
+    spaCy pipeline are loaded on first use and shared by every instance in
+    the process.
+    """
+    
+    def __init__(self, phrase_batch_size: int = 64, phrase_processes: int = 1):
+        self.taxonomy = get_skill_taxonomy()
+        # nlp.pipe settings for get_key_phrases_batch
+        self.phrase_batch_size = phrase_batch_size
+        self.phrase_processes = phrase_processes
+    
+    @cached_property
+    def stop_words(self) -> frozenset:
+        return get_stop_words()
+    
+    @cached_property
+    def lemmatizer(self):
+        return get_lemmatizer()
+    
+    @cached_property
+    def nlp(self):
+        """spaCy pipeline for noun-phrase extraction, or None to use n-grams"""
+        return get_spacy_pipeline()
+    
+    @cached_property
+    def _unused_components(self) -> List[str]:
+        """Pipeline components key-phrase extraction skips"""
+        return [name for name in self.nlp.pipe_names if name not in NOUN_CHUNK_COMPONENTS]
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
@@ -35,7 +262,7 @@ class TextProcessor:
         text = re.sub(r'\s+', ' ', text)
         
         # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\.\,\;\:\-\(\)]', ' ', text)
+        text = SPECIAL_CHARACTERS.sub(' ', text)
         
         # Convert to lowercase
         text = text.lower()
@@ -45,201 +272,169 @@ class TextProcessor:
         
         return text
     
-    def extract_contact_info(self, text: str) -> Dict[str, str]:
+    def compact_for_prompt(self, text: str, max_tokens: Optional[int] = None) -> CompactedText:
+        """Resume text with redundant and low-information lines removed, for LLM prompts
+        
+        Collapses whitespace, drops page numbers and boilerplate, and the
+        declaration, references, hobbies and personal-details sections (up
+        to the next section heading). Lines occurring at least
+        REPEATED_LINE_MIN_COUNT times (compared via clean_text) are page
+        headers and footers and kept once, except that within experience and
+        project sections only the ones already seen above the first section
+        heading (the page header) are dropped.
+        With max_tokens the result is then cut at the last sentence that
+        fits the budget.
+        """
+        entries = []
+        for line in text.splitlines():
+            line = ' '.join(line.split())
+            key = self.clean_text(line)
+            if key:
+                entries.append((line, key))
+        counts = Counter(key for _, key in entries)
+        
+        lines = []
+        seen = set()
+        page_header = set()
+        section = None
+        skipping_section = False
+        for line, key in entries:
+            heading = key.rstrip(':').strip()
+            if heading in LOW_INFORMATION_SECTIONS:
+                skipping_section = True
+                section = heading
+                continue
+            if heading in RESUME_SECTIONS or (
+                HEADING_LINE.fullmatch(key) and (line.isupper() or line.endswith(':'))
+            ):
+                # Any other section heading ends a skipped section
+                skipping_section = False
+                if heading in RESUME_SECTIONS:
+                    section = heading
+            if skipping_section or LOW_INFORMATION_LINE.search(key):
+                continue
+            if counts[key] >= REPEATED_LINE_MIN_COUNT:
+                if section is None:
+                    page_header.add(key)
+                if key in seen and (section not in NO_DEDUPE_SECTIONS or key in page_header):
+                    continue
+                seen.add(key)
+            lines.append(line)
+        
+        compacted = '\n'.join(lines)
+        truncated = max_tokens is not None and estimate_tokens(compacted) > max_tokens
+        if truncated:
+            compacted = self._truncate(compacted, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER))
+        
+        return CompactedText(
+            text=compacted,
+            original_tokens=estimate_tokens(text),
+            tokens=estimate_tokens(compacted),
+            truncated=truncated
+        )
+    
+    def _truncate(self, text: str, max_chars: int) -> str:
+        """Text cut after the last whole sentence within max_chars"""
+        end = 0
+        for sentence in ParsedResume(text).sentences:
+            start = text.find(sentence, end)
+            if start < 0 or start + len(sentence) > max_chars:
+                break
+            end = start + len(sentence)
+        return text[:end or max(0, max_chars)].rstrip() + TRUNCATION_MARKER
+    
+    def extract_contact_info(self, text: Union[str, ParsedResume]) -> Dict[str, str]:
         """Extract contact information from resume text"""
-        contact_info = {}
-        
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            contact_info['email'] = emails[0]
+        found = {}
         
-        # Phone pattern (various formats)
-        phone_patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # 123-456-7890 or 123.456.7890
-            r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',    # (123) 456-7890
-            r'\b\d{10}\b',                      # 1234567890
-            r'\+\d{1,3}[-.\s]?\d{10,14}'       # International format
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                contact_info['phone'] = phones[0]
+        # First email, phone and profile URLs in one scan, stopping once all are found
+        for match in CONTACT_PATTERN.finditer(parse_resume(text).text):
+            found.setdefault(match.lastgroup, match.group())
+            if len(found) == len(CONTACT_FIELDS):
                 break
         
-        # LinkedIn URL
-        linkedin_pattern = r'linkedin\.com/in/[^\s]+'
-        linkedin = re.search(linkedin_pattern, text, re.IGNORECASE)
-        if linkedin:
-            contact_info['linkedin'] = 'https://' + linkedin.group()
-        
-        # GitHub URL
-        github_pattern = r'github\.com/[^\s]+'
-        github = re.search(github_pattern, text, re.IGNORECASE)
-        if github:
-            contact_info['github'] = 'https://' + github.group()
+        contact_info = {}
+        for field in CONTACT_FIELDS:
+            if field in found:
+                contact_info[field] = 'https://' + found[field] if field in ('linkedin', 'github') else found[field]
         
         return contact_info
     
-    def extract_skills(self, text: str) -> Dict[str, List[str]]:
+    def extract_skills(self, text: Union[str, ParsedResume]) -> Dict[str, List[str]]:
         """Extract technical and soft skills from text"""
-        # Define skill categories
-        technical_skills = {
-            'programming_languages': [
-                'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'swift',
-                'kotlin', 'go', 'rust', 'scala', 'r', 'matlab', 'perl', 'typescript'
-            ],
-            'web_technologies': [
-                'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express',
-                'django', 'flask', 'laravel', 'spring', 'bootstrap', 'jquery'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'sqlite', 'oracle', 'redis',
-                'cassandra', 'elasticsearch', 'dynamodb'
-            ],
-            'cloud_platforms': [
-                'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean',
-                'docker', 'kubernetes', 'terraform'
-            ],
-            'tools_frameworks': [
-                'git', 'jenkins', 'docker', 'kubernetes', 'ansible', 'terraform',
-                'webpack', 'babel', 'jest', 'pytest', 'selenium'
-            ]
-        }
-        
-        soft_skills = [
-            'communication', 'leadership', 'teamwork', 'problem solving',
-            'project management', 'time management', 'analytical thinking',
-            'creativity', 'adaptability', 'attention to detail', 'critical thinking'
-        ]
-        
-        # Extract skills from text
-        text_lower = text.lower()
+        text = parse_resume(text).text
         found_skills = {
             'technical_skills': [],
             'soft_skills': []
         }
         
-        # Find technical skills
-        for category, skills in technical_skills.items():
-            for skill in skills:
-                if skill in text_lower:
-                    found_skills['technical_skills'].append(skill.title())
-        
-        # Find soft skills
-        for skill in soft_skills:
-            if skill in text_lower:
-                found_skills['soft_skills'].append(skill.title())
-        
-        # Remove duplicates
-        found_skills['technical_skills'] = list(set(found_skills['technical_skills']))
-        found_skills['soft_skills'] = list(set(found_skills['soft_skills']))
+        # Single scan over the text; matches are whole words only
+        for skill_id in self.taxonomy.find_skills(text):
+            skill_type = SKILL_KIND_KEYS[self.taxonomy.kind(skill_id)]
+            found_skills[skill_type].append(self.taxonomy.display_name(skill_id))
         
         return found_skills
     
-    def extract_education(self, text: str) -> List[Dict[str, str]]:
+    def extract_education(self, text: Union[str, ParsedResume]) -> List[Dict[str, str]]:
         """Extract education information from text"""
+        parsed = parse_resume(text)
+        text = parsed.text
         education = []
         
-        # Degree patterns
-        degree_patterns = [
-            r'\b(bachelor|master|phd|doctorate|diploma|certificate|b\.?tech|m\.?tech|mba|bba|bca|mca|b\.?sc|m\.?sc|b\.?com|m\.?com|b\.?a|m\.?a)\b',
-            r'\b(undergraduate|graduate|postgraduate)\b'
-        ]
-        
-        # Institution patterns
-        institution_patterns = [
-            r'\b(university|college|institute|school|academy)\b'
-        ]
-        
-        text_lower = text.lower()
-        
-        # Simple extraction (can be enhanced)
-        for degree_pattern in degree_patterns:
-            degrees = re.finditer(degree_pattern, text_lower)
-            for degree_match in degrees:
-                start_pos = max(0, degree_match.start() - 100)
-                end_pos = min(len(text), degree_match.end() + 100)
-                context = text[start_pos:end_pos]
-                
-                education.append({
-                    'degree': degree_match.group().title(),
-                    'context': context.strip()
-                })
+        # Simple extraction (can be enhanced): degrees first, then study levels
+        matches = sorted(DEGREE_PATTERN.finditer(parsed.lower), key=lambda match: DEGREE_KINDS.index(match.lastgroup))
+        for degree_match in matches:
+            start_pos = max(0, degree_match.start() - 100)
+            end_pos = min(len(text), degree_match.end() + 100)
+            context = text[start_pos:end_pos]
+            
+            education.append({
+                'degree': degree_match.group().title(),
+                'context': context.strip()
+            })
         
         return education
     
-    def extract_experience(self, text: str) -> List[Dict[str, str]]:
+    def extract_experience(self, text: Union[str, ParsedResume]) -> List[Dict[str, str]]:
         """Extract work experience from text"""
+        parsed = parse_resume(text)
         experience = []
         
-        # Experience keywords
-        experience_keywords = [
-            'experience', 'work', 'employment', 'position', 'role',
-            'job', 'career', 'professional', 'intern', 'internship'
-        ]
-        
-        # Company/organization patterns
-        company_patterns = [
-            r'\b(inc|corp|corporation|company|ltd|llc|pvt|private|limited)\b'
-        ]
-        
-        # Time period patterns
-        time_patterns = [
-            r'\b(20\d{2})\b',  # Years like 2020, 2021
-            r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b',  # Months
-            r'\b(\d{1,2})\s+(years?|months?)\b'  # Duration
-        ]
-        
-        # Simple experience extraction
-        sentences = sent_tokenize(text)
-        
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
+        # Simple experience extraction: sentences with experience keywords
+        for sentence, sentence_lower in zip(parsed.sentences, parsed.sentences_lower):
+            if not any(keyword in sentence_lower for keyword in EXPERIENCE_KEYWORDS):
+                continue
             
-            # Check if sentence contains experience keywords
-            if any(keyword in sentence_lower for keyword in experience_keywords):
-                # Extract time information
-                times = []
-                for pattern in time_patterns:
-                    times.extend(re.findall(pattern, sentence_lower))
-                
-                if times:  # Only include if we found time-related information
-                    experience.append({
-                        'description': sentence.strip(),
-                        'timeframe': ', '.join(set(times))
-                    })
+            # Extract time information (years, months and durations)
+            times = [match.group(match.lastgroup) for match in TIMEFRAME_PATTERN.finditer(sentence_lower)]
+            
+            if times:  # Only include if we found time-related information
+                experience.append({
+                    'description': sentence.strip(),
+                    'timeframe': ', '.join(dict.fromkeys(times))
+                })
         
         return experience[:5]  # Return top 5 experience items
     
-    def extract_projects(self, text: str) -> List[str]:
+    def extract_projects(self, text: Union[str, ParsedResume]) -> List[str]:
         """Extract project information from text"""
         projects = []
         
-        # Project keywords
-        project_keywords = [
-            'project', 'developed', 'built', 'created', 'designed',
-            'implemented', 'application', 'system', 'website', 'app'
-        ]
-        
-        sentences = sent_tokenize(text)
-        
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            
-            # Check if sentence contains project keywords
-            if any(keyword in sentence_lower for keyword in project_keywords):
-                if len(sentence) > 20:  # Filter out very short sentences
-                    projects.append(sentence.strip())
+        for sentence in parse_resume(text).sentences_with(PROJECT_KEYWORDS):
+            if len(sentence) > 20:  # Filter out very short sentences
+                projects.append(sentence.strip())
         
         return projects[:5]  # Return top 5 projects
     
-    def calculate_text_complexity(self, text: str) -> Dict[str, float]:
+    def extract_achievements(self, text: Union[str, ParsedResume]) -> List[str]:
+        """Sentences mentioning awards, honors and similar achievements"""
+        return [sentence.strip() for sentence in parse_resume(text).sentences_with(ACHIEVEMENT_KEYWORDS)]
+    
+    def calculate_text_complexity(self, text: Union[str, ParsedResume]) -> Dict[str, float]:
         """Calculate various text complexity metrics"""
-        words = word_tokenize(text)
-        sentences = sent_tokenize(text)
+        parsed = parse_resume(text)
+        words = parsed.words
+        sentences = parsed.sentences
         
         if not words or not sentences:
             return {
@@ -253,7 +448,7 @@ class TextProcessor:
         # Calculate metrics
         avg_words_per_sentence = len(words) / len(sentences)
         avg_word_length = sum(len(word) for word in words) / len(words)
-        unique_words = set(word.lower() for word in words if word.isalpha())
+        unique_words = set(parsed.alpha_words)
         vocabulary_diversity = len(unique_words) / len(words) if words else 0
         
         return {
@@ -264,40 +459,64 @@ class TextProcessor:
             'total_sentences': len(sentences)
         }
     
-    def get_key_phrases(self, text: str, num_phrases: int = 10) -> List[str]:
+    def get_key_phrases(self, text: Union[str, ParsedResume], num_phrases: int = 10) -> List[str]:
         """Extract key phrases from text using simple n-gram analysis"""
+        parsed = parse_resume(text)
         if self.nlp:
-            return self._extract_phrases_with_spacy(text, num_phrases)
+            return self._noun_phrases(self.nlp(parsed.text, disable=self._unused_components), num_phrases)
         else:
-            return self._extract_phrases_simple(text, num_phrases)
+            return self._extract_phrases_simple(parsed, num_phrases)
     
-    def _extract_phrases_with_spacy(self, text: str, num_phrases: int) -> List[str]:
-        """Extract phrases using spaCy NLP"""
-        doc = self.nlp(text)
-        
-        # Extract noun phrases
+    def get_key_phrases_batch(
+        self,
+        texts: Iterable[Union[str, ParsedResume]],
+        num_phrases: int = 10,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
+    ) -> List[List[str]]:
+        """Key phrases of many texts, in input order
+        
+        With spaCy the texts stream through nlp.pipe in batches of
+        batch_size across n_process processes (defaults from the
+        constructor), running only the components noun_chunks needs.
+        """
+        if not self.nlp:
+            return [self._extract_phrases_simple(parse_resume(text), num_phrases) for text in texts]
+        
+        docs = self.nlp.pipe(
+            (parse_resume(text).text for text in texts),
+            batch_size=batch_size or self.phrase_batch_size,
+            n_process=n_process or self.phrase_processes,
+            disable=self._unused_components
+        )
+        return [self._noun_phrases(doc, num_phrases) for doc in docs]
+    
+    def _noun_phrases(self, doc, num_phrases: int) -> List[str]:
+        """First distinct noun phrases of a spaCy doc"""
         phrases = []
+        seen = set()
         for chunk in doc.noun_chunks:
             phrase = chunk.text.lower().strip()
-            if len(phrase) > 5 and phrase not in phrases:
+            if len(phrase) > 5 and phrase not in seen:
+                seen.add(phrase)
                 phrases.append(phrase)
+                if len(phrases) == num_phrases:
+                    break
         
-        return phrases[:num_phrases]
+        return phrases
     
-    def _extract_phrases_simple(self, text: str, num_phrases: int) -> List[str]:
+    def _extract_phrases_simple(self, parsed: ParsedResume, num_phrases: int) -> List[str]:
         """Simple phrase extraction using word frequency"""
-        # Clean and tokenize
-        words = word_tokenize(self.clean_text(text))
-        words = [word for word in words if word.isalpha() and word not in self.stop_words]
+        # Reuse the resume's word tokens: cleaned, alphabetic, no stop words
+        words = [word for word in parsed.clean_words if word not in self.stop_words]
         
         # Create bigrams and trigrams
         bigrams = [f"{words[i]} {words[i+1]}" for i in range(len(words)-1)]
         trigrams = [f"{words[i]} {words[i+1]} {words[i+2]}" for i in range(len(words)-2)]
         
         # Count frequencies
-        from collections import Counter
         all_phrases = bigrams + trigrams
         phrase_counts = Counter(all_phrases)
         
         # Return most common phrases
-        return [phrase for phrase, count in phrase_counts.most_common(num_phrases)]
\ No newline at end of file
+        return [phrase for phrase, count in phrase_counts.most_common(num_phrases)]
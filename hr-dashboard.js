@@ -1,111 +1,130 @@
 // HR Dashboard JavaScript
-let allApplications = [];
+// Backend API (override with window.API_BASE_URL when served elsewhere)
+const API_BASE_URL = window.API_BASE_URL || 'http://localhost:5000';
+const PAGE_SIZE = 20;
+
+let currentApplications = [];
 let currentFilter = 'all';
+let currentQuery = {};
+let pageCursors = [null];  // cursor of each visited page; pageCursors[0] is the first page
+let currentPage = 1;
+let nextCursor = null;
+let totalMatches = 0;
+let totalExact = true;
+let searchTimer = null;
 
-// Initialize dashboard
+// Initialize dashboard (applicant data is only served to logged-in HR users)
 document.addEventListener('DOMContentLoaded', function() {
-    loadApplications();
+    if (!sessionStorage.getItem('hrToken')) {
+        window.location.href = 'hr-login.html';
+        return;
+    }
     updateStats();
-    displayApplications();
+    loadApplications();
 });
 
-// Load applications from localStorage
-function loadApplications() {
-    const storedApplications = localStorage.getItem('hrApplications');
-    if (storedApplications) {
-        allApplications = JSON.parse(storedApplications);
-    } else {
-        // Generate some sample applications for demo
-        allApplications = generateSampleApplications();
-        saveApplications();
+// Escape applicant-supplied text before it is placed in HTML
+function escapeHtml(value) {
+    return String(value ?? '')
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#39;');
+}
+
+// Call the backend API with the HR token and unwrap its JSON response
+async function apiRequest(path, options = {}) {
+    const response = await fetch(`${API_BASE_URL}${path}`, {
+        headers: {
+            'Content-Type': 'application/json',
+            'Authorization': `Bearer ${sessionStorage.getItem('hrToken') || ''}`
+        },
+        ...options
+    });
+    if (response.status === 401) {
+        // Missing or expired HR session
+        sessionStorage.removeItem('hrToken');
+        sessionStorage.removeItem('hrLoggedIn');
+        window.location.href = 'hr-login.html';
+    }
+    const result = await response.json();
+    if (!response.ok || !result.success) {
+        throw new Error(result.message || `Request failed with status ${response.status}`);
     }
+    return result;
 }
 
-// Save applications to localStorage
-function saveApplications() {
-    localStorage.setItem('hrApplications', JSON.stringify(allApplications));
+// Load one page of applications from the backend (page 1 restarts paging)
+async function loadApplications(page = 1) {
+    if (page === 1) {
+        pageCursors = [null];
+    }
+    const params = new URLSearchParams({ limit: PAGE_SIZE, ...currentQuery });
+    if (currentFilter !== 'all') {
+        params.set('jobRole', currentFilter);
+    }
+    if (pageCursors[page - 1]) {
+        params.set('cursor', pageCursors[page - 1]);
+    }
+    if (page === 1) {
+        params.set('count', 'true');
+    }
+    
+    try {
+        const result = await apiRequest(`/api/applications?${params}`);
+        currentApplications = result.applications;
+        currentPage = page;
+        nextCursor = result.next_cursor;
+        pageCursors[page] = nextCursor;
+        if (result.total !== undefined) {
+            totalMatches = result.total;
+            totalExact = result.total_exact;
+        }
+    } catch (error) {
+        console.error('Error loading applications:', error);
+        showNotification('Could not load applications. Is the backend running?', 'error');
+        currentApplications = [];
+        nextCursor = null;
+        totalMatches = 0;
+    }
+    displayApplications();
 }
 
-// Generate sample applications for demo
-function generateSampleApplications() {
-    const sampleApplications = [
-        {
-            id: 'APP001',
-            fullName: 'John Doe',
-            email: 'john.doe@email.com',
-            phone: '+1234567890',
-            college: 'MIT',
-            cgpa: '8.5',
-            jobRole: 'AI Engineer',
-            github: 'https://github.com/johndoe',
-            linkedin: 'https://linkedin.com/in/johndoe',
-            submissionDate: '2024-01-15',
-            analyzed: false,
-            score: null
-        },
-        {
-            id: 'APP002',
-            fullName: 'Jane Smith',
-            email: 'jane.smith@email.com',
-            phone: '+1234567891',
-            college: 'Stanford University',
-            cgpa: '9.2',
-            jobRole: 'Software Developer',
-            github: 'https://github.com/janesmith',
-            linkedin: 'https://linkedin.com/in/janesmith',
-            submissionDate: '2024-01-16',
-            analyzed: true,
-            score: 85
-        },
-        {
-            id: 'APP003',
-            fullName: 'Mike Johnson',
-            email: 'mike.johnson@email.com',
-            phone: '+1234567892',
-            college: 'UC Berkeley',
-            cgpa: '7.8',
-            jobRole: 'DevOps',
-            github: 'https://github.com/mikejohnson',
-            linkedin: '',
-            submissionDate: '2024-01-17',
-            analyzed: false,
-            score: null
-        },
-        {
-            id: 'APP004',
-            fullName: 'Sarah Wilson',
-            email: 'sarah.wilson@email.com',
-            phone: '+1234567893',
-            college: 'Carnegie Mellon',
-            cgpa: '8.9',
-            jobRole: 'IOT Engineer',
-            github: '',
-            linkedin: 'https://linkedin.com/in/sarahwilson',
-            submissionDate: '2024-01-18',
-            analyzed: true,
-            score: 78
-        },
-        {
-            id: 'APP005',
-            fullName: 'David Brown',
-            email: 'david.brown@email.com',
-            phone: '+1234567894',
-            college: 'Georgia Tech',
-            cgpa: '8.1',
-            jobRole: 'AI Engineer',
-            github: 'https://github.com/davidbrown',
-            linkedin: 'https://linkedin.com/in/davidbrown',
-            submissionDate: '2024-01-19',
-            analyzed: false,
-            score: null
+// Read the search, sort and filter controls into query parameters
+function applyQueryControls() {
+    const query = {};
+    const controls = {
+        q: 'searchInput',
+        sort: 'sortSelect',
+        grade: 'gradeFilter',
+        candidateType: 'candidateTypeFilter',
+        skills: 'skillsFilter',
+        minScore: 'minScoreInput',
+        maxScore: 'maxScoreInput'
+    };
+    Object.entries(controls).forEach(([param, id]) => {
+        const element = document.getElementById(id);
+        const value = element ? element.value.trim() : '';
+        if (value) {
+            query[param] = value;
         }
-    ];
-    
-    return sampleApplications;
+    });
+    if (query.sort === 'fullName') {
+        query.order = 'asc';
+    }
+    currentQuery = query;
+    loadApplications(1);
+}
+
+// Re-query shortly after the user stops typing
+function scheduleSearch() {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(applyQueryControls, 300);
 }
 
 // Update statistics
-function updateStats() {
+async function updateStats() {
     const stats = {
         'AI Engineer': 0,
         'IOT Engineer': 0,
@@ -113,11 +132,14 @@ function updateStats() {
         'Software Developer': 0
     };
     
-    allApplications.forEach(app => {
-        if (stats.hasOwnProperty(app.jobRole)) {
-            stats[app.jobRole]++;
-        }
-    });
+    try {
+        const result = await apiRequest('/api/applications/stats');
+        Object.keys(stats).forEach(role => {
+            stats[role] = result.by_role[role] || 0;
+        });
+    } catch (error) {
+        console.error('Error loading statistics:', error);
+    }
     
     document.getElementById('aiEngineerCount').textContent = stats['AI Engineer'];
     document.getElementById('iotEngineerCount').textContent = stats['IOT Engineer'];
@@ -145,19 +167,15 @@ function filterApplications(role) {
         });
     }
     
-    displayApplications();
+    loadApplications(1);
 }
 
 // Display applications
 function displayApplications() {
     const container = document.getElementById('applicationsGrid');
+    displayPagination();
     
-    let filteredApplications = allApplications;
-    if (currentFilter !== 'all') {
-        filteredApplications = allApplications.filter(app => app.jobRole === currentFilter);
-    }
-    
-    if (filteredApplications.length === 0) {
+    if (currentApplications.length === 0) {
         container.innerHTML = `
             <div class="empty-state">
                 <i class="fas fa-inbox"></i>
@@ -168,22 +186,23 @@ function displayApplications() {
         return;
     }
     
-    container.innerHTML = filteredApplications.map(app => `
+    // Every applicant field is escaped: applications are submitted by anyone
+    container.innerHTML = currentApplications.map(app => `
         <div class="application-card">
             <div class="application-header">
                 <div class="applicant-info">
-                    <h3>${app.fullName}</h3>
-                    <p><i class="fas fa-envelope"></i> ${app.email}</p>
-                    <p><i class="fas fa-graduation-cap"></i> ${app.college} (CGPA: ${app.cgpa})</p>
-                    <p><i class="fas fa-calendar"></i> Applied: ${new Date(app.submissionDate).toLocaleDateString()}</p>
+                    <h3>${escapeHtml(app.fullName)}</h3>
+                    <p><i class="fas fa-envelope"></i> ${escapeHtml(app.email)}</p>
+                    <p><i class="fas fa-graduation-cap"></i> ${escapeHtml(app.college)} (CGPA: ${escapeHtml(app.cgpa)})</p>
+                    <p><i class="fas fa-calendar"></i> Applied: ${escapeHtml(new Date(app.submissionDate).toLocaleDateString())}</p>
                 </div>
                 <div class="application-actions">
-                    <span class="role-badge ${app.jobRole.toLowerCase().replace(' ', '-')}">${app.jobRole}</span>
+                    <span class="role-badge ${escapeHtml((app.jobRole || '').toLowerCase().replace(' ', '-'))}">${escapeHtml(app.jobRole || 'Unspecified')}</span>
                     ${app.analyzed ? 
                         `<div class="score-display" style="background: #48bb78; color: white; padding: 8px 16px; border-radius: 8px; font-weight: 600;">
-                            Score: ${app.score}/100
+                            Score: ${escapeHtml(app.score)}/100 (${escapeHtml(app.grade)})
                         </div>` : 
-                        `<button class="analyze-btn" onclick="analyzeApplication('${app.id}')">
+                        `<button class="analyze-btn" data-application-id="${escapeHtml(app.id)}" onclick="analyzeApplication(this.dataset.applicationId)">
                             <i class="fas fa-chart-line"></i>
                             Analyze
                         </button>`
@@ -194,7 +213,7 @@ function displayApplications() {
             <div class="application-details">
                 <div class="detail-item">
                     <i class="fas fa-phone"></i>
-                    <span>${app.phone}</span>
+                    <span>${escapeHtml(app.phone)}</span>
                 </div>
                 <div class="detail-item">
                     <i class="fab fa-github"></i>
@@ -206,16 +225,46 @@ function displayApplications() {
                 </div>
                 <div class="detail-item">
                     <i class="fas fa-id-badge"></i>
-                    <span>ID: ${app.id}</span>
+                    <span>ID: ${escapeHtml(app.id)}</span>
                 </div>
+                ${app.skills && app.skills.length ? `
+                <div class="detail-item">
+                    <i class="fas fa-code"></i>
+                    <span>${escapeHtml(app.skills.join(', '))}</span>
+                </div>` : ''}
             </div>
         </div>
     `).join('');
 }
 
+// Previous/next page controls
+function displayPagination() {
+    const pagination = document.getElementById('pagination');
+    if (!pagination) return;
+    
+    if (currentPage === 1 && !nextCursor) {
+        pagination.innerHTML = '';
+        return;
+    }
+    
+    // Totals past the server's count limit are lower bounds
+    const summary = totalExact ?
+        `Page ${currentPage} of ${Math.max(1, Math.ceil(totalMatches / PAGE_SIZE))} (${totalMatches} applications)` :
+        `Page ${currentPage} (${totalMatches}+ applications)`;
+    pagination.innerHTML = `
+        <button class="filter-btn" onclick="loadApplications(${currentPage - 1})" ${currentPage <= 1 ? 'disabled' : ''}>
+            <i class="fas fa-chevron-left"></i> Previous
+        </button>
+        <span>${summary}</span>
+        <button class="filter-btn" onclick="loadApplications(${currentPage + 1})" ${nextCursor ? '' : 'disabled'}>
+            Next <i class="fas fa-chevron-right"></i>
+        </button>
+    `;
+}
+
 // Analyze application
 async function analyzeApplication(applicationId) {
-    const application = allApplications.find(app => app.id === applicationId);
+    const application = currentApplications.find(app => app.id === applicationId);
     if (!application) return;
     
     // Show loading state
@@ -231,12 +280,12 @@ async function analyzeApplication(applicationId) {
         // Generate mock score based on application data
         const score = generateMockScore(application);
         
-        // Update application
-        application.analyzed = true;
-        application.score = score;
-        
-        // Save updated applications
-        saveApplications();
+        // Save the score on the server
+        const result = await apiRequest(`/api/applications/${encodeURIComponent(applicationId)}`, {
+            method: 'PATCH',
+            body: JSON.stringify({ score })
+        });
+        Object.assign(application, result.application);
         
         // Refresh display
         displayApplications();
@@ -352,24 +401,20 @@ style.textContent = `
 document.head.appendChild(style);
 
 // Add new application from main form
-function addNewApplication(applicationData) {
-    const newApplication = {
-        id: 'APP' + String(allApplications.length + 1).padStart(3, '0'),
-        ...applicationData,
-        submissionDate: new Date().toISOString().split('T')[0],
-        analyzed: false,
-        score: null
-    };
-    
-    allApplications.push(newApplication);
-    saveApplications();
+async function addNewApplication(applicationData) {
+    await apiRequest('/api/applications', {
+        method: 'POST',
+        body: JSON.stringify(applicationData)
+    });
     updateStats();
-    displayApplications();
+    loadApplications(1);
 }
 
 // Export function for use in other scripts
 window.addNewApplication = addNewApplication;
 
 function goBack() {
+    sessionStorage.removeItem('hrToken');
+    sessionStorage.removeItem('hrLoggedIn');
     window.location.href = 'hr-login.html';
 }
\ No newline at end of file
@@ -1,3 +1,6 @@
+// Backend API (override with window.API_BASE_URL when served elsewhere)
+const API_BASE_URL = window.API_BASE_URL || 'http://localhost:5000';
+
 // DOM Elements
 const form = document.getElementById('resumeForm');
 const loadingOverlay = document.getElementById('loadingOverlay');
@@ -313,20 +316,26 @@ async function handleFormSubmit(e) {
         jobRole: formData.get('jobRole')
     };
     
-    // Store application data and redirect to acknowledgment page
-    localStorage.setItem('applicationData', JSON.stringify(applicationData));
+    // Submit the application to the HR backend
+    try {
+        const response = await fetch(`${API_BASE_URL}/api/applications`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(applicationData)
+        });
+        const result = await response.json();
+        if (!response.ok || !result.success) {
+            throw new Error(result.message || `Request failed with status ${response.status}`);
+        }
+        applicationData.id = result.application.id;
+    } catch (error) {
+        console.error('Error submitting application:', error);
+        alert('We could not submit your application. Please try again in a moment.');
+        return;
+    }
     
-    // Add to HR applications
-    const existingApplications = JSON.parse(localStorage.getItem('hrApplications') || '[]');
-    const newApplication = {
-        id: 'APP' + String(existingApplications.length + 1).padStart(3, '0'),
-        ...applicationData,
-        submissionDate: new Date().toISOString().split('T')[0],
-        analyzed: false,
-        score: null
-    };
-    existingApplications.push(newApplication);
-    localStorage.setItem('hrApplications', JSON.stringify(existingApplications));
+    // Keep this application's details for the acknowledgment page
+    localStorage.setItem('applicationData', JSON.stringify(applicationData));
     
     // Redirect to acknowledgment page
     window.location.href = 'acknowledgment.html';
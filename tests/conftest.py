@@ -0,0 +1,14 @@
+# Shared test setup: point the app's stores at a scratch directory before it is imported
+import os
+import tempfile
+
+_scratch = tempfile.mkdtemp(prefix='resume-scanner-tests-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(_scratch, 'applications.db')}")
+os.environ.setdefault('RESUME_INDEX_PATH', os.path.join(_scratch, 'resume_index.db'))
+os.environ.setdefault('DUPLICATE_INDEX_PATH', os.path.join(_scratch, 'duplicates.db'))
+os.environ.setdefault('JOB_QUEUE_PATH', os.path.join(_scratch, 'jobs.db'))
+os.environ.setdefault('LLM_BACKEND', 'none')
+os.environ.setdefault('CACHE_BACKEND', 'none')
+os.environ.setdefault('LLM_CACHE_BACKEND', 'none')
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
+os.environ.setdefault('HR_PASSWORD', 'test-hr-password')
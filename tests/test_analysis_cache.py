@@ -0,0 +1,112 @@
+# Cache backends and the namespaced analysis cache
+import sqlite3
+import time
+import pytest
+from backend.utils.analysis_cache import AnalysisCache, MemoryLRUCache, SQLiteCache, content_hash, create_cache_backend
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def backend(request, tmp_path):
+    return create_cache_backend(request.param, str(tmp_path / 'cache.db'), max_entries=3, ttl=60)
+
+
+def test_least_recently_used_entries_are_evicted(backend):
+    for key in 'abc':
+        backend.set(key, {'key': key})
+        time.sleep(0.01)
+    assert backend.get('a') == {'key': 'a'}
+    backend.set('d', {'key': 'd'})
+
+    assert len(backend) == 3
+    assert backend.get('b') is None
+    assert backend.get('a') == {'key': 'a'}
+
+
+def test_overwriting_a_key_keeps_one_entry(backend):
+    for value in range(5):
+        backend.set('a', value)
+    assert len(backend) == 1
+    assert backend.get('a') == 4
+    backend.clear()
+    assert len(backend) == 0
+
+
+def test_expired_entries_are_misses(tmp_path):
+    for backend in (MemoryLRUCache(ttl=0.01), SQLiteCache(str(tmp_path / 'cache.db'), ttl=0.01)):
+        backend.set('a', 1)
+        time.sleep(0.02)
+        assert backend.get('a') is None
+        assert len(backend) == 0
+
+
+def test_sqlite_size_is_counted_once_for_existing_caches(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+        "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+    )
+    conn.executemany("INSERT INTO cache VALUES (?, '1', ?, 0)", [(str(key), time.time() + 60) for key in range(4)])
+    conn.commit()
+    conn.close()
+
+    cache = SQLiteCache(path, max_entries=10)
+    assert len(cache) == 4
+    assert len(SQLiteCache(path, max_entries=10)) == 4
+
+
+def test_unknown_backend_and_disabled_cache(tmp_path):
+    assert create_cache_backend('none', str(tmp_path / 'cache.db'), 10, 60) is None
+    with pytest.raises(ValueError):
+        create_cache_backend('redis', str(tmp_path / 'cache.db'), 10, 60)
+
+
+def test_get_or_compute_reuses_values_per_version():
+    backend = MemoryLRUCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'score': 80}
+
+    cache = AnalysisCache(backend, 'v1')
+    assert cache.get_or_compute('analysis', content_hash('resume'), compute) == {'score': 80}
+    assert cache.get_or_compute('analysis', content_hash('resume'), compute) == {'score': 80}
+    assert len(calls) == 1
+    AnalysisCache(backend, 'v2').get_or_compute('analysis', content_hash('resume'), compute)
+    assert len(calls) == 2
+
+
+def test_failures_and_uncacheable_values_are_not_stored():
+    backend = MemoryLRUCache()
+    cache = AnalysisCache(backend, 'v1')
+
+    def broken():
+        raise ValueError('unreadable')
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute('text', 'digest', broken)
+    fallback = {'analysis_tier': 'llm_failed'}
+    uncacheable = lambda analysis: analysis.get('analysis_tier') != 'llm_failed'
+    assert cache.get_or_compute('analysis', 'digest', lambda: fallback, cacheable=uncacheable) == fallback
+    assert len(backend) == 0
+
+    answered = {'analysis_tier': 'llm'}
+    cache.get_or_compute('analysis', 'digest', lambda: answered, cacheable=uncacheable)
+    assert cache.get_or_compute('analysis', 'digest', lambda: fallback, cacheable=uncacheable) == answered
+
+
+def test_content_hash_treats_text_and_bytes_alike():
+    assert content_hash('résumé') == content_hash('résumé'.encode('utf-8'))
+
+
+def test_unreadable_uploads_are_not_cached(monkeypatch):
+    import backend.app as app_module
+    from backend.utils.text_extraction import ExtractionError
+
+    analyzer = app_module.get_analyzer()
+    backend = MemoryLRUCache()
+    monkeypatch.setattr(analyzer, 'cache', AnalysisCache(backend, 'test'))
+    with pytest.raises(ExtractionError):
+        analyzer.extract_text_from_resume(b'%PDF-1.4 truncated')
+    assert len(backend) == 0
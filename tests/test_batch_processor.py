@@ -0,0 +1,87 @@
+# Batch upload collection and the process-pool batch runner
+import io
+import os
+import zipfile
+import pytest
+from werkzeug.datastructures import FileStorage
+from backend.utils.batch_processor import BatchProcessor, collect_batch_files
+
+ALLOWED = {'pdf', 'docx', 'txt'}
+
+
+def upload(name, data=b'resume'):
+    return FileStorage(stream=io.BytesIO(data), filename=name)
+
+
+def zip_upload(name, members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for member, data in members.items():
+            archive.writestr(member, data)
+    buffer.seek(0)
+    return FileStorage(stream=buffer, filename=name)
+
+
+def test_collects_files_and_zip_members(tmp_path):
+    files = collect_batch_files(
+        [
+            upload('a.pdf'),
+            upload('notes.exe'),
+            zip_upload('more.zip', {'dir/b.docx': b'b', 'c.txt': b'c', 'd.png': b'd', 'dir/': b''})
+        ],
+        str(tmp_path), ALLOWED, max_files=10, max_file_size=1024
+    )
+    assert [name for name, _ in files] == ['a.pdf', 'b.docx', 'c.txt']
+    for _, path in files:
+        assert os.path.dirname(path) == str(tmp_path)
+        assert os.path.exists(path)
+
+
+def test_member_paths_stay_inside_the_batch_dir(tmp_path):
+    files = collect_batch_files(
+        [zip_upload('evil.zip', {'../../escape.pdf': b'x'}), upload('../up.pdf')],
+        str(tmp_path), ALLOWED, max_files=10, max_file_size=1024
+    )
+    assert len(files) == 2
+    assert all(os.path.dirname(path) == str(tmp_path) for _, path in files)
+
+
+def test_file_count_and_size_limits(tmp_path):
+    files = collect_batch_files(
+        [zip_upload('big.zip', {'big.pdf': b'x' * 2048, 'ok.pdf': b'x'}), upload('1.pdf'), upload('2.pdf')],
+        str(tmp_path), ALLOWED, max_files=2, max_file_size=1024
+    )
+    assert [name for name, _ in files] == ['ok.pdf', '1.pdf']
+
+
+class LengthAnalyzer:
+    """Stand-in analyzer for pool workers: 'scores' a file by its length"""
+
+    def extract_text_from_resume(self, path):
+        with open(path, 'r', encoding='utf-8') as file:
+            text = file.read()
+        if not text:
+            raise ValueError('empty resume')
+        return text
+
+    def _analyze_with_fallback(self, resume_text, user_data):
+        return {'length': len(resume_text), 'college': user_data.get('college')}
+
+
+def test_batch_processor_reports_every_file(tmp_path):
+    files = []
+    for name, text in (('a.txt', 'abc'), ('b.txt', ''), ('c.txt', 'abcdef')):
+        path = tmp_path / name
+        path.write_text(text, encoding='utf-8')
+        files.append((name, str(path)))
+
+    processor = BatchProcessor(LengthAnalyzer, max_workers=2)
+    try:
+        results = {result['filename']: result for result in processor.iter_results(files, {'college': 'MIT'})}
+    finally:
+        processor.shutdown()
+
+    assert results['a.txt']['resume_analysis'] == {'length': 3, 'college': 'MIT'}
+    assert results['c.txt']['resume_analysis']['length'] == 6
+    assert results['b.txt']['success'] is False
+    assert 'empty resume' in results['b.txt']['message']
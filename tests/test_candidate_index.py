@@ -0,0 +1,132 @@
+# CandidateIndex rows and the app's sync from the application store
+import pytest
+import backend.app as app_module
+from backend.utils.candidate_index import CandidateIndex, candidate_profile
+from backend.utils.candidate_store import SQLiteCandidateRepository
+from backend.utils.job_matcher import JobRole
+from backend.utils.resume_index import SQLiteResumeIndex
+
+
+def make_analysis(email, skills, timestamp='2024-01-01T00:00:00'):
+    return {
+        'user_data': {'fullName': email.split('@')[0], 'email': email},
+        'resume_analysis': {
+            'skills_analysis': {'technical_skills': skills, 'soft_skills': ['communication']},
+            'experience_analysis': {'total_years': 3},
+            'education_details': {'degree': 'B.Tech'},
+            'scoring': {'overall_resume_score': 70}
+        },
+        'analysis_timestamp': timestamp
+    }
+
+
+@pytest.fixture
+def job_matcher():
+    return app_module.get_analyzer().job_matcher
+
+
+@pytest.fixture
+def backend_role():
+    return JobRole(
+        title='Backend Developer', category='Engineering', required_skills=['python', 'sql'],
+        preferred_skills=['docker'], description='Python and SQL backend services',
+        salary_range='', experience_level='Mid', growth_potential='High'
+    )
+
+
+def test_readding_a_candidate_reuses_its_row(job_matcher, backend_role):
+    index = CandidateIndex(job_matcher, capacity=2)
+    index.add('a@x.com', candidate_profile(make_analysis('a@x.com', ['python'])))
+    index.add('b@x.com', candidate_profile(make_analysis('b@x.com', ['java'])))
+    for _ in range(5):
+        index.add('a@x.com', candidate_profile(make_analysis('a@x.com', ['python', 'sql'])))
+
+    assert len(index) == 2
+    assert len(index._ids) == 2
+    assert len(index._postings_for('python')) == 1
+    ranked = index.rank_candidates(backend_role)
+    assert [candidate['candidate_id'] for candidate in ranked] == ['a@x.com', 'b@x.com']
+
+
+def test_readded_row_drops_its_old_skills(job_matcher, backend_role):
+    index = CandidateIndex(job_matcher)
+    index.add('a@x.com', candidate_profile(make_analysis('a@x.com', ['python', 'sql'])))
+    index.add('a@x.com', candidate_profile(make_analysis('a@x.com', ['java'])))
+    assert len(index._postings_for('python')) == 0
+    assert index.rank_candidates(backend_role)[0]['match_breakdown']['technical_skills'] == 0
+
+
+def test_removed_rows_are_reused(job_matcher):
+    index = CandidateIndex(job_matcher)
+    for round_number in range(3):
+        for name in ('a', 'b', 'c'):
+            index.add(f'{name}{round_number}@x.com', candidate_profile(make_analysis('x@x.com', ['python'])))
+        for name in ('a', 'b', 'c'):
+            assert index.remove(f'{name}{round_number}@x.com')
+    assert len(index) == 0
+    assert len(index._ids) == 3
+    assert len(index._postings_for('python')) == 0
+
+
+def test_same_version_is_not_readded(job_matcher):
+    index = CandidateIndex(job_matcher)
+    profile = candidate_profile(make_analysis('a@x.com', ['python']))
+    assert index.add('a@x.com', profile, version='v1')
+    assert not index.add('a@x.com', profile, version='v1')
+    assert index.is_current('a@x.com', 'v1')
+    assert index.add('a@x.com', profile, version='v2')
+    assert not index.is_current('a@x.com', 'v1')
+
+
+def test_semantic_scores_follow_rows_reused_in_place(job_matcher, backend_role):
+    index = CandidateIndex(job_matcher)
+    index.add('a@x.com', candidate_profile(make_analysis('a@x.com', ['python']), 'python sql backend developer'))
+    index.add('b@x.com', candidate_profile(make_analysis('b@x.com', ['python'])))
+    assert 'semantic' in index.rank_candidates(backend_role)[0]['match_breakdown']
+    index.add('a@x.com', candidate_profile(make_analysis('a@x.com', ['python'])))
+    assert all('semantic' not in candidate['match_breakdown'] for candidate in index.rank_candidates(backend_role))
+
+
+@pytest.fixture
+def app_stores(tmp_path, monkeypatch):
+    """The app's repository, resume index and candidate index, fresh for one test"""
+    monkeypatch.setattr(app_module, 'candidate_repository', SQLiteCandidateRepository(str(tmp_path / 'apps.db')))
+    monkeypatch.setattr(app_module, 'resume_index', SQLiteResumeIndex(str(tmp_path / 'resumes.db')))
+    monkeypatch.setattr(app_module, '_candidate_index', None)
+    monkeypatch.setattr(app_module, '_candidate_index_synced', None)
+    return app_module.candidate_repository
+
+
+def test_repeated_syncs_keep_the_row_count_steady(app_stores):
+    for number in range(3):
+        analysis = make_analysis(f'c{number}@x.com', ['python'], f'2024-01-01T00:00:0{number}')
+        app_stores.record_analysis(analysis['user_data'], analysis)
+
+    for _ in range(5):
+        index = app_module.get_candidate_index()
+    assert len(index) == 3
+    assert len(index._ids) == 3
+
+
+def test_sync_does_not_readd_directly_indexed_analyses(app_stores):
+    index = app_module.get_candidate_index()
+    analysis = make_analysis('d@x.com', ['python'])
+    app_module._index_candidate(index, analysis)
+    application = app_stores.record_analysis(analysis['user_data'], analysis)
+    app_stores.update_application(application['id'], {'status': 'shortlisted'})
+
+    for _ in range(3):
+        app_module.get_candidate_index()
+    assert len(index._ids) == 1
+
+
+def test_sync_picks_up_reanalyzed_applicants(app_stores):
+    first = make_analysis('e@x.com', ['java'], '2024-01-01T00:00:00')
+    app_stores.record_analysis(first['user_data'], first)
+    index = app_module.get_candidate_index()
+    second = make_analysis('e@x.com', ['python'], '2024-01-02T00:00:00')
+    app_stores.record_analysis(second['user_data'], second)
+
+    app_module.get_candidate_index()
+    assert len(index._ids) == 1
+    assert index._info[0]['analysis_timestamp'] == '2024-01-02T00:00:00'
@@ -0,0 +1,133 @@
+# SQLite application store: keyset pages, updates and the PATCH route
+import pytest
+import backend.app as app_module
+from backend.utils.candidate_store import SQLiteCandidateRepository, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def repository(tmp_path):
+    return SQLiteCandidateRepository(str(tmp_path / 'applications.db'))
+
+
+def add(repository, number, score=None, submitted='2024-01-01T00:00:00'):
+    application = repository.add_application({
+        'fullName': f'Applicant {number:02}', 'email': f'a{number}@x.com', 'submissionDate': submitted
+    })
+    if score is not None:
+        application = repository.update_application(application['id'], {'score': score})
+    return application
+
+
+def all_pages(repository, limit, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page, cursor = repository.list_applications(limit=limit, cursor=cursor, **kwargs)
+        pages.append([application['id'] for application in page])
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize('descending', [True, False])
+def test_pages_split_ties_on_the_sort_key_by_id(repository, descending):
+    # Every row shares its score with others, so only the id separates page boundaries
+    ids = [add(repository, number, score=70 + number % 3)['id'] for number in range(10)]
+    pages = all_pages(repository, 3, sort='score', descending=descending)
+
+    listed = [application_id for page in pages for application_id in page]
+    assert sorted(listed) == sorted(ids)
+    assert len(set(listed)) == len(ids)
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+
+
+def test_page_of_exactly_limit_rows_has_no_next_cursor(repository):
+    for number in range(4):
+        add(repository, number)
+    page, cursor = repository.list_applications(limit=4)
+    assert len(page) == 4
+    assert cursor is None
+    page, cursor = repository.list_applications(limit=3)
+    assert cursor is not None
+    assert len(repository.list_applications(limit=3, cursor=cursor)[0]) == 1
+
+
+def test_unscored_applications_sort_below_scored_ones(repository):
+    unscored = add(repository, 0)['id']
+    scored = add(repository, 1, score=0)['id']
+    assert all_pages(repository, 1, sort='score', descending=True) == [[scored], [unscored]]
+
+
+def test_cursor_round_trip_and_invalid_cursor(repository):
+    assert decode_cursor(encode_cursor('2024-01-01T00:00:00', 7)) == ('2024-01-01T00:00:00', 7)
+    with pytest.raises(ValueError):
+        repository.list_applications(cursor='not-a-cursor')
+
+
+@pytest.mark.parametrize('score', [[], {}, True, 'high', 'nan', float('inf')])
+def test_update_rejects_non_numeric_scores(repository, score):
+    application = add(repository, 0)
+    with pytest.raises(ValueError):
+        repository.update_application(application['id'], {'score': score})
+
+
+def test_update_accepts_numeric_scores(repository):
+    application = add(repository, 0)
+    assert repository.update_application(application['id'], {'score': '82.5'})['score'] == 82.5
+    assert repository.update_application(application['id'], {'score': None})['score'] is None
+
+
+def test_iter_analyses_resumes_after_the_cursor(repository):
+    for number in range(3):
+        repository.record_analysis({'fullName': f'A{number}', 'email': f'a{number}@x.com'}, {'n': number})
+    read = list(repository.iter_analyses())
+    assert [analysis['n'] for _, analysis in read] == [0, 1, 2]
+
+    last, _ = read[-1]
+    assert list(repository.iter_analyses((last['updatedAt'], last['id']))) == []
+    repository.record_analysis({'fullName': 'A0', 'email': 'a0@x.com'}, {'n': 3})
+    assert [analysis['n'] for _, analysis in repository.iter_analyses((last['updatedAt'], last['id']))] == [3]
+
+
+@pytest.fixture
+def hr_client(repository, monkeypatch):
+    monkeypatch.setattr(app_module, 'candidate_repository', repository)
+    client = app_module.app.test_client()
+    token = client.post('/api/hr/login', json={'password': app_module.Config.HR_PASSWORD}).get_json()['token']
+    client.environ_base['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+    return client
+
+
+@pytest.mark.parametrize('body', [{'score': []}, {'score': {'value': 1}}, {'score': True}, {'status': 'hired'}, [1, 2]])
+def test_patch_with_invalid_values_is_a_bad_request(hr_client, repository, body):
+    application = add(repository, 0)
+    response = hr_client.patch(f"/api/applications/{application['id']}", json=body)
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_patch_updates_score_and_status(hr_client, repository):
+    application = add(repository, 0)
+    response = hr_client.patch(f"/api/applications/{application['id']}", json={'score': 75, 'status': 'shortlisted'})
+    assert response.status_code == 200
+    assert response.get_json()['application']['score'] == 75
+    assert response.get_json()['application']['status'] == 'shortlisted'
+
+
+def test_hr_routes_need_a_valid_token(repository, monkeypatch):
+    monkeypatch.setattr(app_module, 'candidate_repository', repository)
+    client = app_module.app.test_client()
+    assert client.get('/api/applications').status_code == 401
+    assert client.get('/api/applications', headers={'Authorization': 'Bearer forged'}).status_code == 401
+    assert client.post('/api/hr/login', json={'password': 'wrong'}).status_code == 401
+
+    login = client.post('/api/hr/login', json={'username': 'Priya', 'password': app_module.Config.HR_PASSWORD})
+    assert login.get_json()['username'] == 'Priya'
+    headers = {'Authorization': f"Bearer {login.get_json()['token']}"}
+    assert client.get('/api/applications', headers=headers).status_code == 200
+
+
+def test_hr_login_without_a_password_configured(repository, monkeypatch):
+    monkeypatch.setattr(app_module, 'candidate_repository', repository)
+    monkeypatch.setattr(app_module.Config, 'HR_PASSWORD', '')
+    client = app_module.app.test_client()
+    assert client.post('/api/hr/login', json={'password': ''}).status_code == 503
+    assert client.get('/api/applications', headers={'Authorization': 'Bearer anything'}).status_code == 401
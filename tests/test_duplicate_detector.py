@@ -0,0 +1,102 @@
+# MinHash signatures and the LSH near-duplicate index
+import random
+import re
+import numpy as np
+import pytest
+from backend.utils.duplicate_detector import MinHasher, SQLiteDuplicateIndex, candidate_probability
+
+VOCABULARY = (
+    'python java react kubernetes docker aws sql postgres team lead built designed shipped scaled '
+    'service api pipeline data model latency users revenue migrated automated tested reviewed '
+    'mentored improved reduced cost million requests daily cloud platform backend frontend mobile'
+).split()
+
+
+def resume_text(seed, words=300):
+    generator = random.Random(seed)
+    return ' '.join(generator.choice(VOCABULARY) for _ in range(words))
+
+
+def edited(text, changes, seed=0):
+    generator = random.Random(seed)
+    words = text.split()
+    for _ in range(changes):
+        words[generator.randrange(len(words))] = 'edited'
+    return ' '.join(words)
+
+
+def jaccard(first, second, size=5):
+    def shingles(text):
+        words = re.findall(r'\w+', text.lower())
+        return {' '.join(words[index:index + size]) for index in range(max(1, len(words) - size + 1))}
+    first, second = shingles(first), shingles(second)
+    return len(first & second) / len(first | second)
+
+
+def test_signature_similarity_estimates_jaccard():
+    hasher = MinHasher(256)
+    base = resume_text(1)
+    for changes in (0, 3, 10, 40):
+        other = edited(base, changes)
+        estimate = np.mean(hasher.signature(base) == hasher.signature(other))
+        assert estimate == pytest.approx(jaccard(base, other), abs=0.1)
+
+
+def test_signature_ignores_case_and_punctuation():
+    hasher = MinHasher(64)
+    assert (hasher.signature('Python, Java; SQL!') == hasher.signature('python java sql')).all()
+
+
+def test_short_texts_have_no_signature():
+    hasher = MinHasher(64)
+    assert hasher.signature('') is None
+    assert hasher.signature('Resume content could not be extracted', min_shingles=50) is None
+    assert hasher.signature(resume_text(1), min_shingles=50) is not None
+
+
+def test_candidate_probability_is_an_s_curve():
+    assert candidate_probability(0.9, 16, 8) > 0.99
+    assert candidate_probability(0.3, 16, 8) < 0.01
+    assert candidate_probability(1.0, 16, 8) == 1.0
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SQLiteDuplicateIndex(str(tmp_path / 'duplicates.db'))
+    for number in range(20):
+        index.add(f'APP{number}', resume_text(number))
+    return index
+
+
+def test_near_duplicates_are_found_and_unrelated_resumes_are_not(index):
+    matches = index.find(edited(resume_text(3), 2))
+    assert [match['id'] for match in matches] == ['APP3']
+    assert matches[0]['similarity'] >= 0.8
+    assert index.find(resume_text(99)) == []
+
+
+def test_identical_resume_is_an_exact_match(index):
+    assert index.find(resume_text(5)) == [{'id': 'APP5', 'similarity': 1.0}]
+
+
+def test_placeholder_texts_are_not_indexed_or_matched(index):
+    placeholder = 'Resume content could not be extracted. Please try again.'
+    index.add('BROKEN1', placeholder)
+    index.add('BROKEN2', placeholder)
+    assert len(index) == 20
+    assert index.find(placeholder) == []
+
+
+def test_reindex_and_remove(index):
+    index.add('APP3', resume_text(50))
+    assert index.find(resume_text(3)) == []
+    assert [match['id'] for match in index.find(resume_text(50))] == ['APP3']
+    assert index.remove('APP3')
+    assert not index.remove('APP3')
+    assert index.find(resume_text(50)) == []
+    assert len(index) == 19
+
+
+def test_changing_the_band_layout_clears_the_index(index, tmp_path):
+    assert len(SQLiteDuplicateIndex(str(tmp_path / 'duplicates.db'))) == 20
+    assert len(SQLiteDuplicateIndex(str(tmp_path / 'duplicates.db'), bands=32, rows=4)) == 0
@@ -0,0 +1,71 @@
+# GitHub client: token bucket, conditional requests and rate limiting (against the local stub)
+import threading
+import time
+import pytest
+from backend.utils.github_client import GitHubClient, GitHubRateLimited, TokenBucket
+from backend.utils.github_stub import GitHubStubServer
+
+USERS = {'octocat': {'login': 'octocat', 'public_repos': 2}}
+REPOS = {'octocat': [{'name': 'hello-world', 'stargazers_count': 5}]}
+
+
+def test_bucket_paces_calls_beyond_its_capacity():
+    bucket = TokenBucket(capacity=2, rate=10)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire(max_wait=5)
+    assert 0.3 <= time.monotonic() - started < 1.0
+
+
+def test_bucket_raises_when_the_wait_is_too_long():
+    bucket = TokenBucket(capacity=1, rate=1)
+    bucket.acquire(max_wait=0)
+    with pytest.raises(GitHubRateLimited):
+        bucket.acquire(max_wait=0.1)
+
+
+def test_waiting_caller_does_not_block_updates():
+    bucket = TokenBucket(capacity=1, rate=2)
+    bucket.acquire(max_wait=0)
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(bucket.acquire(max_wait=2)))
+    waiter.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    bucket.update(remaining=100, reset_at=time.time() + 10)
+    assert time.monotonic() - started < 0.1
+    waiter.join()
+    assert acquired == [None]
+
+
+@pytest.fixture
+def stub():
+    with GitHubStubServer(USERS, REPOS) as server:
+        yield server
+
+
+def test_fetch_profile_and_revalidate_with_etags(stub):
+    client = GitHubClient(base_url=stub.base_url)
+    first = client.fetch_profile('octocat')
+    assert first == {'profile': USERS['octocat'], 'repos': REPOS['octocat']}
+
+    assert client.fetch_profile('octocat') == first
+    assert stub.requests == 4
+    assert client.fetch_profile('nobody') is None
+
+
+def test_exhausted_rate_limit():
+    with GitHubStubServer(USERS, REPOS, rate_limit=2) as server:
+        client = GitHubClient(base_url=server.base_url, max_rate_wait=0)
+        assert client.fetch_profile('octocat') is not None
+        with pytest.raises(GitHubRateLimited):
+            client.get('/users/octocat')
+
+
+def test_fetch_profiles_maps_failures_to_none(stub):
+    client = GitHubClient(base_url=stub.base_url)
+    profiles = client.fetch_profiles(['octocat', 'nobody', 'octocat'])
+    assert list(profiles) == ['octocat', 'nobody']
+    assert profiles['octocat']['repos'] == REPOS['octocat']
+    assert profiles['nobody'] is None
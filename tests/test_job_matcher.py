@@ -0,0 +1,88 @@
+# Vectorized job scoring checked against the per-role calculate_job_match
+import random
+import numpy as np
+import pytest
+from backend.utils.job_matcher import JobMatcher, overall_match_score
+
+EDUCATION_LEVELS = ['high school', 'associate', 'bachelor', 'master', 'phd']
+SOFT_SKILLS = ['communication', 'leadership', 'teamwork', 'problem solving', 'creativity']
+
+
+@pytest.fixture(scope='module')
+def job_matcher():
+    return JobMatcher()
+
+
+def random_profiles(job_matcher, count, seed=7):
+    generator = random.Random(seed)
+    skills = sorted({skill for job in job_matcher.job_database for skill in job.required_skills + job.preferred_skills})
+    return [
+        {
+            'technical_skills': generator.sample(skills, generator.randint(0, 12)),
+            'soft_skills': generator.sample(SOFT_SKILLS, generator.randint(0, 3)),
+            'experience_years': generator.choice([0, 0.5, 1, 2, 3.5, 5, 8, 12, 20]),
+            'education_level': generator.choice(EDUCATION_LEVELS),
+            'github_projects': generator.randint(0, 10)
+        }
+        for _ in range(count)
+    ]
+
+
+def reference_scores(job_matcher, profile):
+    return [overall_match_score(job_matcher.calculate_job_match(profile, job)) for job in job_matcher.job_database]
+
+
+def test_score_jobs_matches_calculate_job_match(job_matcher):
+    for profile in random_profiles(job_matcher, 40):
+        scores = job_matcher.score_jobs(profile)
+        np.testing.assert_allclose(scores['overall'], reference_scores(job_matcher, profile), atol=1e-9)
+
+
+def test_batch_scores_match_single_scores(job_matcher):
+    profiles = random_profiles(job_matcher, 10)
+    batch = job_matcher.score_jobs_batch(profiles)
+    for column, profile in enumerate(profiles):
+        np.testing.assert_allclose(batch['overall'][:, column], job_matcher.score_jobs(profile)['overall'])
+
+
+def test_zero_experience_does_not_divide_by_zero(job_matcher):
+    profile = {'technical_skills': [], 'soft_skills': [], 'experience_years': 0}
+    assert np.isfinite(job_matcher.score_jobs(profile)['overall']).all()
+
+
+def reference_recommendations(job_matcher, profile, max_recommendations, min_score_threshold):
+    """The original loop: score every role, then a stable sort on (match percentage, confidence)"""
+    ranked = []
+    for job in job_matcher.job_database:
+        match_scores = job_matcher.calculate_job_match(profile, job)
+        overall = overall_match_score(match_scores)
+        if overall >= min_score_threshold:
+            ranked.append((int(overall * 100), job_matcher._calculate_confidence(match_scores, overall), job.title))
+    ranked.sort(key=lambda entry: (entry[0], entry[1]), reverse=True)
+    return ranked[:max_recommendations]
+
+
+@pytest.mark.parametrize('max_recommendations, min_score_threshold', [(5, 0.3), (1, 0.3), (50, 0.0), (3, 0.6)])
+def test_recommendations_match_a_full_sort(job_matcher, max_recommendations, min_score_threshold):
+    for profile in random_profiles(job_matcher, 30, seed=max_recommendations):
+        recommendations = job_matcher.get_job_recommendations(profile, max_recommendations, min_score_threshold)
+        assert [
+            (recommendation['match_percentage'], recommendation['confidence'], recommendation['title'])
+            for recommendation in recommendations
+        ] == reference_recommendations(job_matcher, profile, max_recommendations, min_score_threshold)
+
+
+def test_candidate_without_skills_still_gets_recommendations(job_matcher):
+    profile = {'technical_skills': [], 'soft_skills': ['communication'], 'experience_years': 3,
+               'education_level': 'master', 'github_projects': 5}
+    recommendations = job_matcher.get_job_recommendations(profile, 3, 0.3)
+    assert [(r['match_percentage'], r['confidence'], r['title']) for r in recommendations] == \
+        reference_recommendations(job_matcher, profile, 3, 0.3)
+    assert recommendations
+
+
+def test_batch_recommendations_match_single_ones(job_matcher):
+    profiles = random_profiles(job_matcher, 8, seed=11)
+    batch = job_matcher.get_job_recommendations_batch(profiles)
+    for profile, recommendations in zip(profiles, batch):
+        assert [r['title'] for r in recommendations] == [r['title'] for r in job_matcher.get_job_recommendations(profile)]
@@ -0,0 +1,117 @@
+# Job queues: claiming, leases and the worker pool
+import sqlite3
+import time
+import pytest
+from backend.utils.job_queue import (
+    STATUS_COMPLETED, STATUS_FAILED, STATUS_QUEUED, STATUS_RUNNING,
+    InMemoryJobQueue, JobWorkerPool, SQLiteJobQueue, create_job_queue
+)
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def job_queue(request, tmp_path):
+    return create_job_queue(request.param, str(tmp_path / 'jobs.db'))
+
+
+def test_jobs_are_claimed_in_order_and_finished(job_queue):
+    first = job_queue.put({'n': 1})
+    second = job_queue.put({'n': 2})
+    assert job_queue.get(first)['status'] == STATUS_QUEUED
+
+    assert job_queue.claim(timeout=0.1) == (first, {'n': 1})
+    assert job_queue.get(first)['status'] == STATUS_RUNNING
+    job_queue.complete(first, {'score': 80})
+    assert job_queue.get(first)['result'] == {'score': 80}
+
+    assert job_queue.claim(timeout=0.1) == (second, {'n': 2})
+    job_queue.fail(second, 'boom')
+    assert job_queue.get(second)['status'] == STATUS_FAILED
+    assert job_queue.get(second)['error'] == 'boom'
+    assert job_queue.claim(timeout=0.05) is None
+    assert job_queue.get('missing') is None
+
+
+def test_purge_drops_only_finished_jobs(job_queue):
+    done = job_queue.put({})
+    job_queue.claim(timeout=0.1)
+    job_queue.complete(done, {})
+    waiting = job_queue.put({})
+    time.sleep(0.02)
+    job_queue.purge(max_age=0.01)
+    assert job_queue.get(done) is None
+    assert job_queue.get(waiting) is not None
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        create_job_queue('redis')
+
+
+def test_expired_lease_is_claimed_again(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    crashed_worker = SQLiteJobQueue(path, lease_seconds=0.05)
+    other_worker = SQLiteJobQueue(path, lease_seconds=0.05)
+    job_id = crashed_worker.put({'n': 1})
+    assert crashed_worker.claim(timeout=0.1)[0] == job_id
+
+    assert other_worker.claim(timeout=0) is None
+    time.sleep(0.1)
+    assert other_worker.claim(timeout=0) == (job_id, {'n': 1})
+
+
+def test_job_fails_after_max_attempts(tmp_path):
+    job_queue = SQLiteJobQueue(str(tmp_path / 'jobs.db'), lease_seconds=0.02, max_attempts=2)
+    job_id = job_queue.put({})
+    for _ in range(2):
+        assert job_queue.claim(timeout=0)[0] == job_id
+        time.sleep(0.05)
+
+    assert job_queue.claim(timeout=0) is None
+    job = job_queue.get(job_id)
+    assert job['status'] == STATUS_FAILED
+    assert 'Worker stopped' in job['error']
+
+
+def test_unexpired_lease_is_not_reclaimed(tmp_path):
+    job_queue = SQLiteJobQueue(str(tmp_path / 'jobs.db'), lease_seconds=60)
+    job_queue.put({})
+    job_queue.claim(timeout=0)
+    assert job_queue.claim(timeout=0) is None
+
+
+def test_queue_files_without_leases_are_migrated(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, status TEXT NOT NULL, payload TEXT, "
+        "result TEXT, error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO jobs VALUES ('old', 'queued', '{\"n\": 1}', NULL, NULL, 1, 1)")
+    conn.commit()
+    conn.close()
+
+    assert SQLiteJobQueue(path).claim(timeout=0) == ('old', {'n': 1})
+
+
+def test_worker_pool_runs_jobs_and_records_failures():
+    def handler(payload):
+        if payload.get('fail'):
+            raise RuntimeError('bad resume')
+        return {'doubled': payload['n'] * 2}
+
+    job_queue = InMemoryJobQueue()
+    pool = JobWorkerPool(job_queue, handler, num_workers=2)
+    try:
+        good = pool.submit({'n': 21})
+        bad = pool.submit({'fail': True})
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and any(
+            job_queue.get(job_id)['status'] in (STATUS_QUEUED, STATUS_RUNNING) for job_id in (good, bad)
+        ):
+            time.sleep(0.01)
+    finally:
+        pool.shutdown()
+
+    assert job_queue.get(good)['status'] == STATUS_COMPLETED
+    assert job_queue.get(good)['result'] == {'doubled': 42}
+    assert job_queue.get(bad)['error'] == 'bad resume'
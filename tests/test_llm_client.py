@@ -0,0 +1,105 @@
+# Tolerant JSON parsing, retries and caching in the LLM client
+import pytest
+from backend.utils.analysis_cache import MemoryLRUCache
+from backend.utils.llm_client import LLMClient, LLMResponseError, create_llm_model, extract_json
+from backend.utils.llm_stub import SAMPLE_ANALYSIS, StubLLMModel, fenced_sample_analysis
+
+
+@pytest.mark.parametrize('text, value', [
+    ('{"score": 62}', {'score': 62}),
+    ('  [1, 2]\n', [1, 2]),
+    ('```json\n{"score": 62}\n```', {'score': 62}),
+    ('Sure!\n```\n{"score": 62}\n```\nAnything else?', {'score': 62}),
+    ('The result is {"score": 62} as requested. {"ignored": true}', {'score': 62}),
+    ('{"skills": ["Python", "SQL",], "score": 62,}', {'skills': ['Python', 'SQL'], 'score': 62}),
+    ('```json\n{"skills": ["Python",],\n "score": 62,\n}\n```', {'skills': ['Python'], 'score': 62}),
+    ('Here you go: {"score": 62,}', {'score': 62}),
+])
+def test_extract_json(text, value):
+    assert extract_json(text) == value
+
+
+def test_commas_inside_strings_are_kept():
+    assert extract_json('{"note": "a, }", "n": 1,}') == {'note': 'a, }', 'n': 1}
+    assert extract_json('{"quote": "say \\"hi\\", ]", "tags": ["x",],}') == {'quote': 'say "hi", ]', 'tags': ['x']}
+
+
+@pytest.mark.parametrize('text', ['', 'No JSON here', '{"score": ', '```json\n{oops}\n```'])
+def test_responses_without_json(text):
+    with pytest.raises(LLMResponseError):
+        extract_json(text)
+
+
+def test_fenced_sample_analysis_parses():
+    assert extract_json(fenced_sample_analysis('prompt')) == SAMPLE_ANALYSIS
+
+
+def flaky(failures: int, error: Exception, response: str = '{"ok": true}'):
+    """Responder that raises error for the first failures calls"""
+    calls = []
+
+    def respond(prompt):
+        calls.append(prompt)
+        if len(calls) <= failures:
+            raise error
+        return response
+    return respond
+
+
+def test_retryable_failures_are_retried():
+    model = StubLLMModel(responder=flaky(2, TimeoutError('slow')))
+    client = LLMClient(model, max_retries=3, backoff=0)
+    assert client.complete_json('prompt') == {'ok': True}
+    assert model.calls == 3
+
+
+def test_retries_are_bounded():
+    model = StubLLMModel(responder=flaky(10, ConnectionError('reset')))
+    client = LLMClient(model, max_retries=2, backoff=0)
+    with pytest.raises(ConnectionError):
+        client.complete_json('prompt')
+    assert model.calls == 3
+
+
+def test_other_errors_are_not_retried():
+    model = StubLLMModel(responder=flaky(1, ValueError('bad request')))
+    client = LLMClient(model, max_retries=3, backoff=0)
+    with pytest.raises(ValueError):
+        client.complete('prompt')
+    assert model.calls == 1
+
+
+def test_responses_are_cached_by_normalized_prompt():
+    model = StubLLMModel()
+    client = LLMClient(model, cache=MemoryLRUCache())
+    assert client.complete_json('Analyze\n    this resume') == SAMPLE_ANALYSIS
+    assert client.complete_json('Analyze this   resume ') == SAMPLE_ANALYSIS
+    assert model.calls == 1
+    assert client.complete('Analyze this resume') == fenced_sample_analysis('')
+    assert model.calls == 2
+
+
+def test_unparseable_responses_are_not_cached():
+    model = StubLLMModel(responder=lambda prompt: 'I cannot help with that.')
+    client = LLMClient(model, cache=MemoryLRUCache())
+    for _ in range(2):
+        with pytest.raises(LLMResponseError):
+            client.complete_json('prompt')
+    assert model.calls == 2
+
+
+def test_batch_returns_failures_in_place():
+    model = StubLLMModel(responder=lambda prompt: '{"n": %s}' % prompt if prompt.isdigit() else 'no json')
+    client = LLMClient(model, max_concurrency=2, backoff=0)
+    results = client.complete_json_batch(['1', 'oops', '3'])
+    assert results[0] == {'n': 1}
+    assert isinstance(results[1], LLMResponseError)
+    assert results[2] == {'n': 3}
+
+
+def test_create_llm_model():
+    assert create_llm_model('none') is None
+    assert create_llm_model('gemini') is None
+    assert isinstance(create_llm_model('stub'), StubLLMModel)
+    with pytest.raises(ValueError):
+        create_llm_model('gpt-unknown')
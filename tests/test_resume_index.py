@@ -0,0 +1,88 @@
+# Recruiter query parsing and BM25 resume search
+import pytest
+from backend.utils.resume_index import SQLiteResumeIndex, parse_query, snippet
+
+
+@pytest.mark.parametrize('query, fts_query, terms', [
+    ('python django', '"python" "django"', ['python', 'django']),
+    ('kubernetes AND (terraform OR ansible)', '"kubernetes" AND ( "terraform" OR "ansible" )',
+     ['kubernetes', 'terraform', 'ansible']),
+    ('java NOT javascript', '"java" NOT "javascript"', ['java', 'javascript']),
+    ('"machine learning" c++', '"machine learning" "c++"', ['machine learning', 'c++']),
+    ('phrase: data science OR node.js', '"data science" OR "node.js"', ['data science', 'node.js']),
+    ('phrase:deep learning', '"deep learning"', ['deep learning']),
+    ('pyth*', '"pyth"*', ['pyth']),
+    ('say "hi""', '"say" "hi"', ['say', 'hi'])
+])
+def test_parse_query(query, fts_query, terms):
+    assert parse_query(query) == (fts_query, terms)
+
+
+@pytest.mark.parametrize('query', ['', '   ', 'AND OR', '* ()', '""'])
+def test_queries_without_terms_are_rejected(query):
+    with pytest.raises(ValueError):
+        parse_query(query)
+
+
+def test_snippet_centres_on_the_first_term():
+    text = 'filler ' * 100 + 'Kubernetes operator experience'
+    excerpt = snippet(text, ['kubernetes'], width=60)
+    assert excerpt.startswith('...')
+    assert 'Kubernetes' in excerpt
+    assert snippet('short text', ['missing']) == 'short text'
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SQLiteResumeIndex(str(tmp_path / 'resumes.db'))
+    index.add('APP1', 'Backend engineer: Python, Django, PostgreSQL. Machine learning side projects.')
+    index.add('APP2', 'Python Python Python data scientist. Machine learning and deep learning with PyTorch.')
+    index.add('APP3', 'Frontend developer: JavaScript, React and C++ game engines.')
+    index.add('APP4', 'Java developer, Spring Boot, C# tooling.')
+    return index
+
+
+def ids(results):
+    return [result['id'] for result in results]
+
+
+def test_search_ranks_by_bm25(index):
+    # BM25's IDF is only positive for terms in fewer than half of the documents
+    for number in range(5, 9):
+        index.add(f'APP{number}', 'Accountant with Excel and SAP experience')
+    results = index.search('python')
+    assert ids(results) == ['APP2', 'APP1']
+    assert results[0]['score'] > results[1]['score'] > 0
+
+
+def test_boolean_phrase_and_symbol_queries(index):
+    assert ids(index.search('python AND django')) == ['APP1']
+    assert set(ids(index.search('react OR spring'))) == {'APP3', 'APP4'}
+    assert ids(index.search('"deep learning"')) == ['APP2']
+    assert ids(index.search('learning NOT deep')) == ['APP1']
+    assert ids(index.search('c++')) == ['APP3']
+    assert ids(index.search('c#')) == ['APP4']
+    assert ids(index.search('java')) == ['APP4']
+    assert set(ids(index.search('java*'))) == {'APP3', 'APP4'}
+
+
+def test_reindexing_replaces_the_old_text(index):
+    index.add('APP1', 'Rust systems programmer')
+    assert len(index) == 4
+    assert 'APP1' not in ids(index.search('django'))
+    assert ids(index.search('rust')) == ['APP1']
+    assert index.get_text('APP1') == 'Rust systems programmer'
+
+
+def test_remove(index):
+    assert index.remove('APP3')
+    assert not index.remove('APP3')
+    assert index.search('react') == []
+    assert index.get_text('APP3') is None
+    assert len(index) == 3
+
+
+def test_limit_and_optimize(index):
+    index.optimize()
+    assert len(index.search('developer', limit=1)) == 1
+    assert ids(index.search('learning', limit=5)) == ['APP2', 'APP1']
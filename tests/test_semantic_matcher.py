@@ -0,0 +1,89 @@
+# TF-IDF similarity of resumes and job roles
+import numpy as np
+import pytest
+from backend.utils.candidate_index import CandidateIndex
+from backend.utils.job_matcher import JobMatcher, overall_match_score
+from backend.utils.semantic_matcher import SemanticMatcher, job_document
+
+RESUMES = [
+    'Data scientist building machine learning models in Python with pandas, scikit-learn and TensorFlow',
+    'Frontend developer: React, TypeScript, CSS and accessibility audits',
+    'DevOps engineer running Kubernetes, Terraform and CI/CD pipelines on AWS',
+    ''
+]
+
+
+@pytest.fixture(scope='module')
+def job_matcher():
+    return JobMatcher()
+
+
+@pytest.fixture(scope='module')
+def semantic(job_matcher):
+    return job_matcher.semantic
+
+
+@pytest.mark.parametrize('resume, title', list(zip(RESUMES, ['Data Scientist', 'Frontend Developer', 'DevOps Engineer'])))
+def test_resume_ranks_the_related_job_first(job_matcher, semantic, resume, title):
+    scores = semantic.scores(resume)
+    assert job_matcher.job_database[int(np.argmax(scores))].title == title
+
+
+def test_empty_resume_matches_nothing(semantic):
+    assert semantic.scores('').max() == 0
+
+
+def test_single_batch_and_per_job_scores_agree(job_matcher, semantic):
+    batch = semantic.scores_batch(RESUMES)
+    vectors = semantic.resume_vectors(RESUMES)
+    for column, resume in enumerate(RESUMES):
+        np.testing.assert_allclose(batch[:, column], semantic.scores(resume))
+    for position in (0, 7, len(job_matcher.job_database) - 1):
+        job = job_matcher.job_database[position]
+        np.testing.assert_allclose(semantic.job_scores(vectors, job), batch[position], atol=1e-12)
+        assert semantic.score(RESUMES[0], job) == pytest.approx(batch[position, 0])
+    assert ((batch >= 0) & (batch <= 1)).all()
+
+
+def test_model_is_saved_and_refit_for_another_catalog(job_matcher, tmp_path):
+    path = str(tmp_path / 'semantic.pkl')
+    jobs = job_matcher.job_database
+    fitted = SemanticMatcher.load(jobs, path)
+    reloaded = SemanticMatcher.load(jobs, path)
+    np.testing.assert_allclose(reloaded.scores(RESUMES[0]), fitted.scores(RESUMES[0]))
+
+    smaller = SemanticMatcher.load(jobs[:5], path)
+    assert smaller.job_vectors.shape[0] == 5
+
+
+def test_unreadable_model_is_refit(job_matcher, tmp_path):
+    path = tmp_path / 'semantic.pkl'
+    path.write_bytes(b'not a pickle')
+    matcher = SemanticMatcher.load(job_matcher.job_database[:3], str(path))
+    assert matcher.job_vectors.shape[0] == 3
+
+
+def test_resume_text_blends_into_job_scores(job_matcher):
+    profile = {'technical_skills': ['python', 'machine learning'], 'experience_years': 2, 'resume_text': RESUMES[0]}
+    scores = job_matcher.score_jobs(profile)
+    for position, job in enumerate(job_matcher.job_database):
+        match = job_matcher.calculate_job_match(profile, job)
+        assert scores['semantic'][position] == pytest.approx(match['semantic'])
+        assert scores['overall'][position] == pytest.approx(overall_match_score(match))
+
+
+def test_candidate_ranking_uses_resume_text_like_calculate_job_match(job_matcher):
+    index = CandidateIndex(job_matcher)
+    profiles = {
+        'ml@x.com': {'technical_skills': ['python'], 'experience_years': 3, 'resume_text': RESUMES[0]},
+        'web@x.com': {'technical_skills': ['python'], 'experience_years': 3, 'resume_text': RESUMES[1]},
+        'plain@x.com': {'technical_skills': ['python'], 'experience_years': 3}
+    }
+    for candidate_id, profile in profiles.items():
+        index.add(candidate_id, profile)
+
+    job = job_matcher.job_database[0]
+    for candidate in index.rank_candidates(job, k=3):
+        expected = overall_match_score(job_matcher.calculate_job_match(profiles[candidate['candidate_id']], job))
+        assert candidate['match_percentage'] == int(expected * 100)
+        assert ('semantic' in candidate['match_breakdown']) == ('resume_text' in profiles[candidate['candidate_id']])
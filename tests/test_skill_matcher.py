@@ -0,0 +1,51 @@
+# Aho-Corasick skill matching
+from backend.utils.skill_matcher import SkillMatcher
+
+
+def matched(matcher, terms, text):
+    return [terms[term_id] for _, _, term_id in matcher.find_all(text)]
+
+
+def test_finds_overlapping_and_nested_terms():
+    terms = ['machine learning', 'learning', 'deep learning', 'python']
+    matcher = SkillMatcher.build(terms)
+    assert matched(matcher, terms, 'deep learning and machine learning in python') == [
+        'deep learning', 'learning', 'machine learning', 'learning', 'python'
+    ]
+
+
+def test_only_whole_words_match():
+    terms = ['go', 'java', 'c', 'c++', 'r']
+    matcher = SkillMatcher.build(terms)
+    assert matched(matcher, terms, 'google javascript c++ go, java') == ['c++', 'go', 'java']
+    assert matched(matcher, terms, 'c# and r.') == ['r']
+
+
+def test_match_offsets_cover_the_term():
+    terms = ['sql', 'nosql']
+    matcher = SkillMatcher.build(terms)
+    text = 'sql/nosql'
+    assert [(text[start:end], terms[term_id]) for start, end, term_id in matcher.find_all(text)] == [
+        ('sql', 'sql'), ('nosql', 'nosql')
+    ]
+
+
+def test_failure_links_recover_after_a_partial_match():
+    terms = ['abcd', 'bce']
+    matcher = SkillMatcher.build(terms)
+    assert matched(matcher, terms, 'x abce') == []
+    assert matched(matcher, terms, 'a bce') == ['bce']
+
+
+def test_lookup_is_exact_and_find_terms_is_distinct():
+    terms = ['react', 'react native', 'node']
+    matcher = SkillMatcher.build(terms)
+    assert matcher.lookup('react native') == 1
+    assert matcher.lookup('react nat') is None
+    assert matcher.lookup('') is None
+    assert matcher.find_terms('node react node react native') == [2, 0, 1]
+
+
+def test_duplicate_terms_keep_the_first_id():
+    matcher = SkillMatcher.build(['k8s', 'k8s'])
+    assert matcher.find_terms('k8s') == [0]
@@ -0,0 +1,85 @@
+# Skill taxonomy sources and the compiled binary index
+import json
+import pytest
+from backend.utils.skill_taxonomy import SkillTaxonomy, compile_taxonomy, load_taxonomy_source
+
+DEFINITION = {
+    'default_weight': 0.5,
+    'skills': [
+        {'id': 'nodejs', 'name': 'Node.js', 'category': 'backend', 'weight': 0.9, 'aliases': ['node', 'node js']},
+        {'id': 'machine_learning', 'name': 'Machine Learning', 'category': 'data'},
+        {'id': 'teamwork', 'name': 'Teamwork', 'kind': 'soft', 'category': 'interpersonal'},
+        {'id': 'excel', 'name': 'Excel', 'category': 'office', 'detect': False}
+    ]
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'skills.json'
+    path.write_text(json.dumps(DEFINITION), encoding='utf-8')
+    return path
+
+
+def test_compiled_index_round_trips():
+    taxonomy = SkillTaxonomy(compile_taxonomy(DEFINITION, b'\x01' * 32))
+    assert taxonomy.num_skills == 4
+    assert taxonomy.resolve('Node JS') == 'nodejs'
+    assert taxonomy.resolve('machine   learning') == 'machine_learning'
+    assert taxonomy.resolve('cobol') is None
+    assert taxonomy.canonical_id('COBOL') == 'cobol'
+    assert taxonomy.display_name('nodejs') == 'Node.js'
+    assert taxonomy.weight('nodejs') == 0.9
+    assert taxonomy.weight('machine_learning') == 0.5
+    assert taxonomy.weight('unknown') == 0.5
+    assert taxonomy.kind('teamwork') == 'soft'
+    assert taxonomy.category('machine_learning') == 'data'
+    assert taxonomy.source_hash == '01' * 32
+
+
+def test_find_skills_skips_undetectable_skills():
+    taxonomy = SkillTaxonomy(compile_taxonomy(DEFINITION))
+    assert taxonomy.find_skills('Excel, Node and teamwork; more node') == ['nodejs', 'teamwork']
+
+
+def test_invalid_definitions_are_rejected():
+    with pytest.raises(ValueError):
+        compile_taxonomy({'skills': [{'id': 'a'}, {'id': 'a'}]})
+    with pytest.raises(ValueError):
+        compile_taxonomy({'skills': [{'id': 'a', 'kind': 'magic'}]})
+    with pytest.raises(ValueError):
+        SkillTaxonomy(b'NOPE' + bytes(100))
+
+
+def test_load_writes_the_index_and_recompiles_when_the_source_changes(source, tmp_path):
+    index_path = tmp_path / 'skills.idx'
+    first = SkillTaxonomy.load(str(source), str(index_path))
+    assert index_path.exists()
+    assert SkillTaxonomy.load(str(source), str(index_path)).version == first.version
+
+    changed = dict(DEFINITION, skills=DEFINITION['skills'] + [{'id': 'rust', 'name': 'Rust'}])
+    source.write_text(json.dumps(changed), encoding='utf-8')
+    reloaded = SkillTaxonomy.load(str(source), str(index_path))
+    assert reloaded.version != first.version
+    assert reloaded.resolve('rust') == 'rust'
+
+
+def test_load_ignores_a_corrupt_index(source, tmp_path):
+    index_path = tmp_path / 'skills.idx'
+    index_path.write_bytes(b'garbage')
+    assert SkillTaxonomy.load(str(source), str(index_path)).resolve('node') == 'nodejs'
+
+
+def test_csv_source(tmp_path):
+    path = tmp_path / 'skills.csv'
+    path.write_text(
+        'id,name,category,kind,weight,aliases,detect\n'
+        'k8s,Kubernetes,devops,technical,0.8,kube|k8s,\n'
+        'ms_word,Word,office,technical,,,no\n',
+        encoding='utf-8'
+    )
+    definition = load_taxonomy_source(str(path))
+    assert definition['skills'][0]['aliases'] == ['kube', 'k8s']
+    assert definition['skills'][0]['weight'] == 0.8
+    assert definition['skills'][1]['detect'] is False
+    assert SkillTaxonomy(compile_taxonomy(definition)).resolve('kube') == 'k8s'
@@ -0,0 +1,92 @@
+# Concurrent analysis stages with per-stage timeouts
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from backend.utils.stage_runner import StageFailedError, run_stages
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_stages_run_concurrently(executor):
+    def slow(value):
+        def run():
+            time.sleep(0.2)
+            return value
+        return run
+
+    started = time.perf_counter()
+    results, timings, errors = run_stages(executor, {'a': (slow(1), 5), 'b': (slow(2), 5), 'c': (slow(3), 5)})
+    assert time.perf_counter() - started < 0.5
+    assert results == {'a': 1, 'b': 2, 'c': 3}
+    assert errors == {}
+    assert set(timings) == {'a', 'b', 'c'}
+
+
+def test_optional_stage_failures_leave_partial_results(executor):
+    def broken():
+        raise RuntimeError('profile not found')
+
+    release = threading.Event()
+    results, timings, errors = run_stages(executor, {
+        'resume': (lambda: 'ok', 5),
+        'github': (broken, 5),
+        'linkedin': (lambda: release.wait(5), 0.1)
+    }, required=['resume'])
+    release.set()
+
+    assert results == {'resume': 'ok', 'github': None, 'linkedin': None}
+    assert errors['github'] == 'profile not found'
+    assert errors['linkedin'].startswith('timed out')
+    assert timings['linkedin'] == 100.0
+
+
+def test_required_stage_timeout_raises(executor):
+    release = threading.Event()
+    with pytest.raises(StageFailedError) as raised:
+        run_stages(executor, {'resume': (lambda: release.wait(5), 0.05)}, required=['resume'])
+    release.set()
+    assert raised.value.stage == 'resume'
+
+
+def test_spilled_file_outlives_a_timed_out_stage(executor, tmp_path):
+    spilled = tmp_path / 'upload.pdf'
+    spilled.write_bytes(b'%PDF-1.4')
+    reading = threading.Event()
+    release = threading.Event()
+    read = []
+
+    def slow_extraction():
+        reading.set()
+        release.wait(5)
+        read.append(spilled.read_bytes())
+
+    with pytest.raises(StageFailedError):
+        run_stages(
+            executor, {'resume': (slow_extraction, 0.05)}, required=['resume'],
+            on_done={'resume': lambda: os.remove(spilled)}
+        )
+    assert reading.is_set()
+    # The stage is still running, so its file must still be there
+    assert spilled.exists()
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while spilled.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert read == [b'%PDF-1.4']
+    assert not spilled.exists()
+
+
+def test_cleanup_errors_are_not_raised(executor, tmp_path):
+    results, _, _ = run_stages(
+        executor, {'resume': (lambda: 'ok', 5)},
+        on_done={'resume': lambda: os.remove(tmp_path / 'missing')}
+    )
+    assert results == {'resume': 'ok'}
@@ -0,0 +1,169 @@
+# Bounded, streaming resume text extraction
+import io
+import zipfile
+import pytest
+from backend.utils import text_extraction
+from backend.utils.analysis_cache import content_hash
+from backend.utils.text_extraction import (
+    ExtractionBackend, ExtractionError, ExtractionLimits, TextExtractor, _bounded,
+    backends_for, load_benchmark_results, sniff_file_type, source_hash, spool_upload
+)
+
+
+def make_pdf(pages):
+    pymupdf = pytest.importorskip('pymupdf')
+    document = pymupdf.open()
+    for text in pages:
+        document.new_page().insert_text((72, 72), text)
+    data = document.tobytes()
+    document.close()
+    return data
+
+
+def test_bounded_stops_at_the_character_limit():
+    chunks = list(_bounded(['abcd', 'efgh', 'ijkl'], ExtractionLimits(max_chars=6), 'test'))
+    assert chunks == ['abcd', 'ef']
+
+
+def test_bounded_stops_after_the_chunk_that_spends_the_time_budget():
+    consumed = []
+
+    def pages():
+        for index in range(5):
+            consumed.append(index)
+            yield f'page {index}'
+
+    chunks = list(_bounded(pages(), ExtractionLimits(time_budget=-1), 'test'))
+    assert chunks == ['page 0']
+    assert consumed == [0]
+
+
+def test_pdf_pages_beyond_max_pages_are_not_read():
+    data = make_pdf([f'Page number {index}' for index in range(1, 8)])
+    text = TextExtractor(ExtractionLimits(max_pages=3)).extract(data)
+    assert 'Page number 3' in text
+    assert 'Page number 4' not in text
+
+
+def test_pdf_text_is_cut_at_max_chars():
+    data = make_pdf(['x' * 60, 'y' * 60])
+    text = TextExtractor(ExtractionLimits(max_chars=80)).extract(data)
+    assert len(text) <= 81
+    assert text.startswith('x' * 60)
+
+
+def make_docx(paragraphs):
+    docx = pytest.importorskip('docx')
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('head, file_type', [
+    (b'%PDF-1.7\n', 'pdf'),
+    (b'\r\n %PDF-1.4', 'pdf'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + bytes(8), 'doc'),
+    (b'{\\rtf1\\ansi hello}', 'rtf'),
+    ('Jane Doe — Python developer'.encode('utf-8'), 'txt'),
+    (b'PK\x03\x04not really a zip', None),
+    (b'\x89PNG\r\n\x1a\n\0\0', None),
+    (b'', None)
+])
+def test_sniff_file_type(head, file_type):
+    file = io.BytesIO(head)
+    assert sniff_file_type(file) == file_type
+    assert file.tell() == 0
+
+
+def test_docx_is_told_apart_from_other_zip_files():
+    assert sniff_file_type(io.BytesIO(make_docx(['Hello']))) == 'docx'
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('resume.pdf', b'%PDF-1.4')
+    assert sniff_file_type(buffer) is None
+
+
+def test_file_type_comes_from_content_not_name():
+    extractor = TextExtractor(ExtractionLimits())
+    assert extractor.extract(make_docx(['Senior engineer', 'Python'])) == 'Senior engineer\nPython'
+    assert extractor.extract('Plain text resume\nSkills: SQL'.encode('utf-8')) == 'Plain text resume\nSkills: SQL'
+    with pytest.raises(ValueError):
+        extractor.extract(b'\x89PNG\r\n\x1a\n\0\0')
+
+
+def test_backends_are_ordered_by_measured_throughput_then_priority(monkeypatch):
+    def extract(file, path, limits):
+        return iter([])
+
+    monkeypatch.setattr(text_extraction, 'EXTRACTION_BACKENDS', [
+        ExtractionBackend('slow', ('pdf',), (), extract, priority=10),
+        ExtractionBackend('fast', ('pdf',), (), extract, priority=20),
+        ExtractionBackend('unmeasured', ('pdf',), (), extract, priority=5),
+        ExtractionBackend('fallback', ('pdf',), (), extract, priority=30),
+        ExtractionBackend('missing', ('pdf',), ('no_such_module',), extract, priority=1),
+        ExtractionBackend('other', ('docx',), (), extract, priority=1)
+    ])
+    benchmark = {'pdf': {'slow': 50.0, 'fast': 80.0}}
+    assert [backend.name for backend in backends_for('pdf', benchmark)] == ['fast', 'slow', 'unmeasured', 'fallback']
+    assert [backend.name for backend in backends_for('pdf')] == ['unmeasured', 'slow', 'fast', 'fallback']
+
+
+def test_failing_backend_falls_back_to_the_next(monkeypatch):
+    def broken(file, path, limits):
+        raise RuntimeError('corrupt')
+
+    def working(file, path, limits):
+        return iter([file.read().decode('utf-8')])
+
+    monkeypatch.setattr(text_extraction, 'EXTRACTION_BACKENDS', [
+        ExtractionBackend('broken', ('txt',), (), broken, priority=1),
+        ExtractionBackend('working', ('txt',), (), working, priority=2)
+    ])
+    assert TextExtractor(ExtractionLimits()).extract(b'resume text') == 'resume text'
+
+    monkeypatch.setattr(text_extraction, 'EXTRACTION_BACKENDS', [
+        ExtractionBackend('broken', ('txt',), (), broken)
+    ])
+    with pytest.raises(ExtractionError) as raised:
+        TextExtractor(ExtractionLimits()).extract(b'resume text')
+    assert raised.value.file_type == 'txt'
+    assert 'broken: corrupt' in str(raised.value)
+
+
+def test_unreadable_benchmark_file_is_ignored(tmp_path):
+    path = tmp_path / 'benchmark.json'
+    path.write_text('{not json', encoding='utf-8')
+    assert load_benchmark_results(str(path)) == {}
+    assert load_benchmark_results(str(tmp_path / 'missing.json')) == {}
+
+
+def test_small_uploads_stay_in_memory_and_large_ones_spill(tmp_path):
+    small = spool_upload(io.BytesIO(b'x' * 10), threshold=10, spool_dir=str(tmp_path))
+    assert small == b'x' * 10
+    assert list(tmp_path.iterdir()) == []
+
+    spilled = spool_upload(io.BytesIO(b'y' * 11), threshold=10, spool_dir=str(tmp_path), suffix='.pdf')
+    assert isinstance(spilled, str)
+    assert spilled.endswith('.pdf')
+    with open(spilled, 'rb') as file:
+        assert file.read() == b'y' * 11
+
+
+def test_source_hash_matches_for_memory_and_spilled_sources(tmp_path):
+    data = bytes(range(256)) * 1000
+    path = tmp_path / 'resume.pdf'
+    path.write_bytes(data)
+    assert source_hash(data) == content_hash(data)
+    assert source_hash(memoryview(data)) == content_hash(data)
+    assert source_hash(str(path), chunk_size=1000) == content_hash(data)
+
+
+def test_memory_and_spilled_sources_extract_the_same_text(tmp_path):
+    data = make_docx(['Data engineer', 'Spark, Airflow'])
+    path = tmp_path / 'resume.bin'
+    path.write_bytes(data)
+    extractor = TextExtractor(ExtractionLimits())
+    assert extractor.extract(data) == extractor.extract(str(path)) == 'Data engineer\nSpark, Airflow'
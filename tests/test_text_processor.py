@@ -0,0 +1,298 @@
+# TextProcessor extractors and the shared ParsedResume tokenization
+import re
+import nltk
+import pytest
+from backend.utils import text_processor
+from backend.utils.text_processor import (
+    TRUNCATION_MARKER, ParsedResume, TextProcessor, estimate_tokens, parse_resume
+)
+
+
+def nltk_data_installed(path: str) -> bool:
+    try:
+        nltk.data.find(path)
+        return True
+    except LookupError:
+        return False
+
+
+requires_punkt = pytest.mark.skipif(
+    not nltk_data_installed('tokenizers/punkt'), reason='NLTK punkt data is not installed'
+)
+requires_spacy_model = pytest.mark.skipif(
+    text_processor.get_spacy_pipeline() is None, reason='spaCy or en_core_web_sm is not installed'
+)
+
+
+def parsed(*sentences: str) -> ParsedResume:
+    """ParsedResume with its sentences given up front, so no punkt data is needed"""
+    resume = ParsedResume(' '.join(sentences))
+    resume.__dict__['sentences'] = list(sentences)
+    return resume
+
+
+@pytest.fixture(scope='module')
+def processor():
+    return TextProcessor()
+
+
+def test_parse_resume_reuses_a_parsed_resume():
+    resume = parsed('One sentence.')
+    assert parse_resume(resume) is resume
+    assert parse_resume('Raw text.').text == 'Raw text.'
+
+
+def test_word_views_come_from_the_cached_sentences():
+    resume = parsed('Built a Node/Express API in 2021.', 'Led 3 engineers!')
+    assert resume.words == ['Built', 'a', 'Node/Express', 'API', 'in', '2021', '.', 'Led', '3', 'engineers', '!']
+    assert resume.alpha_words == ['built', 'a', 'api', 'in', 'led', 'engineers']
+    assert resume.clean_words == ['built', 'a', 'node', 'express', 'api', 'in', 'led', 'engineers']
+    assert resume.sentences_lower == ['built a node/express api in 2021.', 'led 3 engineers!']
+
+
+def test_extractors_share_one_sentence_split(processor, monkeypatch):
+    calls = []
+
+    def split(text):
+        calls.append(text)
+        return [sentence + '.' for sentence in text.rstrip('.').split('. ')]
+
+    monkeypatch.setattr(nltk.tokenize, 'sent_tokenize', split)
+    monkeypatch.setattr(text_processor, 'ensure_nltk_data', lambda name: True)
+    resume = ParsedResume(
+        'Worked as a backend intern at Acme in 2022. '
+        'Developed a recommendation system for the campus library. '
+        'Received the Dean award for research.'
+    )
+    assert processor.extract_experience(resume)[0]['timeframe'] == '2022'
+    assert processor.extract_projects(resume) == ['Developed a recommendation system for the campus library.']
+    assert processor.extract_achievements(resume) == ['Received the Dean award for research.']
+    assert processor.calculate_text_complexity(resume)['total_sentences'] == 3
+    assert len(calls) == 1
+
+
+def test_projects_skip_short_sentences_and_keep_five(processor):
+    sentences = ['Built it.'] + [f'Built project number {i} with Flask and React.' for i in range(7)]
+    projects = processor.extract_projects(parsed(*sentences))
+    assert projects == sentences[1:6]
+
+
+def test_text_complexity(processor):
+    metrics = processor.calculate_text_complexity(parsed('Built a Flask app.', 'Deployed it twice.'))
+    assert metrics['total_sentences'] == 2
+    assert metrics['total_words'] == 9
+    assert metrics['avg_words_per_sentence'] == 4.5
+    assert metrics['vocabulary_diversity'] == round(7 / 9, 3)
+
+
+def test_text_complexity_of_empty_text(processor):
+    assert processor.calculate_text_complexity(parsed())['total_words'] == 0
+
+
+@requires_punkt
+def test_raw_text_is_split_into_sentences(processor):
+    text = 'Worked as an intern in 2021. Developed a chat application with websockets.'
+    assert ParsedResume(text).sentences == [
+        'Worked as an intern in 2021.', 'Developed a chat application with websockets.'
+    ]
+    assert processor.extract_experience(text)[0]['timeframe'] == '2021'
+
+
+@pytest.mark.parametrize('sentence, timeframe', [
+    ('Worked as a developer for 5 years.', '5 years'),
+    ('Internship of 3 months, then 1 year full time.', '3 months, 1 year'),
+    ('Took a QA role in March 2021 and left in January 2023.', 'mar, 2021, jan, 2023'),
+    ('Worked in 2020, again in 2020 and in 2022.', '2020, 2022'),
+])
+def test_experience_timeframes_in_text_order(processor, sentence, timeframe):
+    assert processor.extract_experience(parsed(sentence)) == [
+        {'description': sentence, 'timeframe': timeframe}
+    ]
+
+
+def test_experience_needs_a_keyword_and_a_timeframe(processor):
+    resume = parsed('Graduated in 2019.', 'Worked on open source projects.', 'Job at Acme since 2021.')
+    assert [item['description'] for item in processor.extract_experience(resume)] == ['Job at Acme since 2021.']
+
+
+def test_contact_info_from_one_scan(processor):
+    text = (
+        'Reach me at +91 9876543210 or (555) 123-4567, jane.doe@example.com. '
+        'LinkedIn.com/in/janedoe github.com/janedoe'
+    )
+    assert processor.extract_contact_info(text) == {
+        'email': 'jane.doe@example.com',
+        'phone': '+91 9876543210',
+        'linkedin': 'https://LinkedIn.com/in/janedoe',
+        'github': 'https://github.com/janedoe',
+    }
+
+
+@pytest.mark.parametrize('phone', ['(555) 123-4567', '555-123-4567', '555.123.4567', '5551234567'])
+def test_local_phone_formats(processor, phone):
+    assert processor.extract_contact_info(f'Phone: {phone}') == {'phone': phone}
+
+
+def test_missing_contact_fields_are_left_out(processor):
+    assert processor.extract_contact_info('No contact details here') == {}
+
+
+def test_skills_by_kind(processor):
+    skills = processor.extract_skills('Python, React and Java; strong teamwork and communication skills')
+    assert skills == {
+        'technical_skills': ['Python', 'React', 'Java'],
+        'soft_skills': ['Teamwork', 'Communication'],
+    }
+
+
+def test_degrees_come_before_study_levels(processor):
+    text = 'Undergraduate student. B.Tech in Computer Science, MBA 2020'
+    education = processor.extract_education(text)
+    assert [item['degree'] for item in education] == ['B.Tech', 'Mba', 'Undergraduate']
+    assert education[0]['context'] == text
+
+
+def test_models_load_on_first_use_only(monkeypatch):
+    monkeypatch.setattr(text_processor, 'get_spacy_pipeline', lambda: pytest.fail('spaCy loaded eagerly'))
+    monkeypatch.setattr(text_processor, 'get_stop_words', lambda: pytest.fail('stop words loaded eagerly'))
+    processor = TextProcessor()
+    assert processor.extract_contact_info('jane@example.com') == {'email': 'jane@example.com'}
+    assert processor.extract_skills('Python')['technical_skills'] == ['Python']
+
+
+def test_nltk_data_is_only_downloaded_when_missing(monkeypatch):
+    ensure_nltk_data = text_processor.ensure_nltk_data.__wrapped__
+    downloads = []
+    monkeypatch.setattr(nltk, 'download', lambda name, quiet: downloads.append(name) or True)
+
+    monkeypatch.setattr(nltk.data, 'find', lambda path: path)
+    assert ensure_nltk_data('stopwords')
+    assert downloads == []
+
+    def missing(path):
+        raise LookupError(path)
+
+    monkeypatch.setattr(nltk.data, 'find', missing)
+    assert ensure_nltk_data('stopwords')
+    assert downloads == ['stopwords']
+
+
+def test_failed_nltk_download_is_reported_not_raised(monkeypatch):
+    def missing(path):
+        raise LookupError(path)
+
+    def offline(name, quiet):
+        raise OSError('network unreachable')
+
+    monkeypatch.setattr(nltk.data, 'find', missing)
+    monkeypatch.setattr(nltk, 'download', offline)
+    assert text_processor.ensure_nltk_data.__wrapped__('punkt') is False
+
+
+PHRASE_TEXTS = [
+    'Built machine learning pipelines for fraud detection. Machine learning pipelines ran nightly.',
+    'Led the mobile app team. The mobile app team shipped weekly releases.',
+    'Wrote unit tests.',
+]
+
+
+@pytest.fixture
+def ngram_processor():
+    """TextProcessor on the n-gram fallback, with a small stop word list"""
+    processor = TextProcessor()
+    processor.__dict__['nlp'] = None
+    processor.__dict__['stop_words'] = frozenset({'the', 'for', 'a'})
+    return processor
+
+
+def test_ngram_phrases_batch_matches_single_texts(ngram_processor):
+    resumes = [parsed(*text.split('. ')) for text in PHRASE_TEXTS]
+    batch = ngram_processor.get_key_phrases_batch(resumes, num_phrases=3)
+    assert batch == [ngram_processor.get_key_phrases(resume, num_phrases=3) for resume in resumes]
+    assert batch[0][0] == 'machine learning'
+    assert batch[1][0] == 'mobile app'
+
+
+@requires_spacy_model
+def test_spacy_phrases_batch_matches_single_texts():
+    processor = TextProcessor(phrase_batch_size=2)
+    assert 'ner' in processor._unused_components
+    batch = processor.get_key_phrases_batch(PHRASE_TEXTS, num_phrases=5)
+    assert batch == [processor.get_key_phrases(text, num_phrases=5) for text in PHRASE_TEXTS]
+    assert all(len(phrase) > 5 for phrases in batch for phrase in phrases)
+
+
+RESUME_PAGES = """JANE DOE - Resume
+Jane Doe    jane@example.com
+Summary
+Backend developer.
+Experience
+Software Engineer
+- Built REST APIs
+JANE DOE - Resume
+Page 1 of 2
+Software Engineer
+- Built REST APIs
+Software Engineer
+- Built REST APIs
+Hobbies
+Chess and hiking
+Skills
+Python, SQL
+JANE DOE - Resume
+2
+References available upon request
+Declaration
+I hereby declare that the above is true.
+"""
+
+
+def test_compaction_drops_page_headers_and_boilerplate(processor):
+    compacted = processor.compact_for_prompt(RESUME_PAGES)
+    assert compacted.text.splitlines() == [
+        'JANE DOE - Resume',
+        'Jane Doe jane@example.com',
+        'Summary',
+        'Backend developer.',
+        'Experience',
+        # Three roles sharing a title and bullet are all kept
+        'Software Engineer',
+        '- Built REST APIs',
+        'Software Engineer',
+        '- Built REST APIs',
+        'Software Engineer',
+        '- Built REST APIs',
+        'Skills',
+        'Python, SQL',
+    ]
+    assert not compacted.truncated
+    assert compacted.original_tokens == estimate_tokens(RESUME_PAGES)
+    assert compacted.saved_tokens == compacted.original_tokens - estimate_tokens(compacted.text)
+
+
+def test_lines_repeated_fewer_than_three_times_are_kept(processor):
+    text = 'Skills\nPython\nTools\nPython\nCertifications\nAWS Certified\nAWS Certified\nAWS Certified'
+    assert processor.compact_for_prompt(text).text.splitlines() == [
+        'Skills', 'Python', 'Tools', 'Python', 'Certifications', 'AWS Certified'
+    ]
+
+
+def test_any_heading_ends_a_skipped_section(processor):
+    text = 'Personal Details:\nDate of birth 1 Jan 2000\nOPEN SOURCE\nMaintainer of a parser library'
+    assert processor.compact_for_prompt(text).text == 'OPEN SOURCE\nMaintainer of a parser library'
+
+
+def test_estimate_tokens():
+    assert [estimate_tokens(text) for text in ('', 'abc', 'abcd', 'abcde')] == [0, 1, 1, 2]
+
+
+def test_compaction_truncates_at_a_sentence(processor, monkeypatch):
+    monkeypatch.setattr(nltk.tokenize, 'sent_tokenize', lambda text: re.split(r'(?<=[.!?])\s+', text))
+    monkeypatch.setattr(text_processor, 'ensure_nltk_data', lambda name: True)
+    text = ' '.join(f'Sentence number {i} about backend work.' for i in range(20))
+    compacted = processor.compact_for_prompt(text, max_tokens=30)
+    assert compacted.truncated
+    assert compacted.tokens <= 30
+    assert compacted.text.endswith('about backend work.' + TRUNCATION_MARKER)
+    assert text.startswith(compacted.text[:-len(TRUNCATION_MARKER)])
+    assert processor.compact_for_prompt(text, max_tokens=1000).text == text
@@ -0,0 +1,133 @@
+# Analysis modes: local first, escalating uncertain resumes to the LLM
+import re
+import nltk
+import pytest
+import backend.app as app_module
+from backend.utils import text_processor
+from backend.utils.analysis_cache import AnalysisCache, MemoryLRUCache
+from backend.utils.llm_client import LLMClient
+from backend.utils.llm_stub import SAMPLE_ANALYSIS, StubLLMModel
+from backend.utils.metrics import metrics
+
+RESUME = (
+    'Software engineering intern in 2023. Developed a REST API in Python with Flask and PostgreSQL. '
+    'Built a React dashboard with Docker deployment. Won the campus hackathon award.'
+)
+USER = {'fullName': 'Jane Doe', 'college': 'State University', 'cgpa': '8.5'}
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """The app's analyzer with a stub LLM, a fresh cache and a stand-in sentence splitter"""
+    monkeypatch.setattr(nltk.tokenize, 'sent_tokenize', lambda text: re.split(r'(?<=[.!?])\s+', text))
+    monkeypatch.setattr(text_processor, 'ensure_nltk_data', lambda name: True)
+    analyzer = app_module.get_analyzer()
+    monkeypatch.setattr(analyzer, 'cache', AnalysisCache(MemoryLRUCache(), 'test'))
+    metrics.reset()
+    return analyzer
+
+
+def use_llm(monkeypatch, responder=None) -> StubLLMModel:
+    model = StubLLMModel(responder=responder)
+    monkeypatch.setattr(app_module, 'llm_client', LLMClient(model, max_retries=0, backoff=0))
+    return model
+
+
+def use_mode(monkeypatch, mode: str):
+    monkeypatch.setattr(app_module.Config, 'ANALYSIS_MODE', mode)
+
+
+def local_result(score: int, confidence: float):
+    def analyze(resume_text, user_data):
+        return {'scoring': {'overall_resume_score': score}}, confidence
+    return analyze
+
+
+@pytest.mark.parametrize('score, confidence, reason', [
+    (65, 0.9, None),
+    (65, 0.5, 'low_confidence'),
+    (62, 0.9, 'borderline'),
+    (48, 0.9, 'borderline'),
+    (90, 0.9, 'borderline'),
+    (15, 0.9, None),
+])
+def test_escalation_reason(analyzer, score, confidence, reason):
+    assert analyzer._escalation_reason({'scoring': {'overall_resume_score': score}}, confidence) == reason
+
+
+def test_llm_mode_sends_every_resume_to_the_llm(analyzer, monkeypatch):
+    model = use_llm(monkeypatch)
+    use_mode(monkeypatch, 'llm')
+    analysis = analyzer._analyze_resume(RESUME, USER)
+    assert analysis['analysis_tier'] == 'llm'
+    assert analysis['scoring'] == SAMPLE_ANALYSIS['scoring']
+    assert model.calls == 1
+
+
+def test_local_mode_never_calls_the_llm(analyzer, monkeypatch):
+    model = use_llm(monkeypatch)
+    use_mode(monkeypatch, 'local')
+    analysis = analyzer._analyze_resume(RESUME, USER)
+    assert analysis['analysis_tier'] == 'local'
+    assert 'Python' in analysis['skills_analysis']['technical_skills']
+    assert analysis['experience_analysis']['work_experience'][0]['timeframe'] == '2023'
+    assert model.calls == 0
+
+
+def test_without_an_llm_every_mode_is_local(analyzer, monkeypatch):
+    monkeypatch.setattr(app_module, 'llm_client', None)
+    use_mode(monkeypatch, 'llm')
+    assert analyzer._analyze_resume(RESUME, USER)['analysis_tier'] == 'local'
+
+
+def test_tiered_mode_keeps_confident_local_results(analyzer, monkeypatch):
+    model = use_llm(monkeypatch)
+    use_mode(monkeypatch, 'tiered')
+    monkeypatch.setattr(analyzer, '_analyze_locally', local_result(65, 0.9))
+    assert analyzer._analyze_resume(RESUME, USER)['analysis_tier'] == 'local'
+    assert model.calls == 0
+    assert metrics.get('analysis.tier.local') == 1
+
+
+@pytest.mark.parametrize('score, confidence, reason', [(65, 0.2, 'low_confidence'), (79, 0.9, 'borderline')])
+def test_tiered_mode_escalates_uncertain_resumes(analyzer, monkeypatch, score, confidence, reason):
+    model = use_llm(monkeypatch)
+    use_mode(monkeypatch, 'tiered')
+    monkeypatch.setattr(analyzer, '_analyze_locally', local_result(score, confidence))
+    assert analyzer._analyze_resume(RESUME, USER)['analysis_tier'] == 'llm'
+    assert model.calls == 1
+    assert metrics.get(f'analysis.escalations.{reason}') == 1
+
+
+def test_tiered_mode_escalates_when_local_analysis_fails(analyzer, monkeypatch):
+    use_llm(monkeypatch)
+    use_mode(monkeypatch, 'tiered')
+
+    def broken(resume_text, user_data):
+        raise RuntimeError('tokenizer missing')
+
+    monkeypatch.setattr(analyzer, '_analyze_locally', broken)
+    assert analyzer._analyze_resume(RESUME, USER)['analysis_tier'] == 'llm'
+    assert metrics.get('analysis.escalations.local_error') == 1
+
+
+def test_llm_failure_falls_back_to_the_local_analysis(analyzer, monkeypatch):
+    use_llm(monkeypatch, responder=lambda prompt: 'Sorry, I cannot do that.')
+    use_mode(monkeypatch, 'tiered')
+    monkeypatch.setattr(analyzer, '_analyze_locally', local_result(62, 0.9))
+    analysis = analyzer._analyze_resume(RESUME, USER)
+    assert analysis['analysis_tier'] == 'llm_failed'
+    assert analysis['scoring']['overall_resume_score'] == 62
+
+
+def test_only_successful_llm_analyses_are_cached(analyzer, monkeypatch):
+    use_mode(monkeypatch, 'llm')
+    failing = use_llm(monkeypatch, responder=lambda prompt: 'not json')
+    for _ in range(2):
+        assert analyzer.analyze_resume_with_ai(RESUME, USER)['analysis_tier'] == 'llm_failed'
+    assert failing.calls == 2
+
+    model = use_llm(monkeypatch)
+    for _ in range(2):
+        assert analyzer.analyze_resume_with_ai(RESUME, USER)['analysis_tier'] == 'llm'
+    assert model.calls == 1